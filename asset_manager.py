@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+"""
+Asset Manager for Moses Adventure Game
+Loads sprites on first request, tracks which owners (levels, the player) use them
+and evicts unused ones least-recently-used first once a memory budget is exceeded
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from surface_cache import hash_callable, stat_file
+
+DEFAULT_BUDGET = 64 * 1024 * 1024  # Resident surface bytes before unused assets are evicted
+DECODE_WORKERS = min(8, os.cpu_count() or 1)  # Threads decoding image files in preload()
+
+
+class AssetEntry:
+    __slots__ = ('category', 'name', 'path', 'fallback', 'alias', 'source', 'transform')
+
+    def __init__(self, category, name, path=None, fallback=None, alias=None, source=None, transform=None):
+        self.category = category
+        self.name = name
+        self.path = path            # Image file, tried first
+        self.fallback = fallback    # Callable drawing a stand-in when the file is missing
+        self.alias = alias          # (category, name) this entry shares a surface with
+        self.source = source        # (category, name) this entry is derived from...
+        self.transform = transform  # ...by calling transform(source surface)
+
+
+class AssetGroup(Mapping):
+    """Dict-style, lazily loading view of one asset category (e.g. sprites['npcs'])"""
+
+    def __init__(self, manager, category):
+        self.manager = manager
+        self.category = category
+
+    def __getitem__(self, name):
+        if not isinstance(name, str) or (self.category, name) not in self.manager.catalog:
+            raise KeyError(name)
+        return self.manager.get(self.category, name)
+
+    def __contains__(self, name):
+        return (self.category, name) in self.manager.catalog
+
+    def decoded(self, name):
+        """Like get(), but without converting (safe off the main thread); see AssetManager.get_decoded"""
+        if not isinstance(name, str) or (self.category, name) not in self.manager.catalog:
+            return None
+        return self.manager.get_decoded(self.category, name)
+
+    def __iter__(self):
+        return iter(self.manager.names(self.category))
+
+    def __len__(self):
+        return len(self.manager.names(self.category))
+
+
+def decode_image(path):
+    """Decode an image file into a plain (unconverted) surface; return (surface or None, seconds)
+
+    Safe to run on a worker thread: it touches no display state.
+    """
+    start = time.perf_counter()
+    surface = None
+    try:
+        if os.path.exists(path):
+            surface = pygame.image.load(path)
+        else:
+            print(f"Warning: Sprite not found: {path}")
+    except pygame.error as e:
+        print(f"Error loading sprite {path}: {e}")
+    return surface, time.perf_counter() - start
+
+
+def surface_bytes(surface):
+    """Approximate pixel memory held by a surface (none for atlas subsurfaces, which share their sheet's)"""
+    if not surface or surface.get_parent() is not None:
+        return 0
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+class AssetManager:
+    def __init__(self, budget_bytes=DEFAULT_BUDGET):
+        self.budget_bytes = budget_bytes
+        self.catalog = {}              # (category, name) -> AssetEntry, nothing loaded
+        self.resident = OrderedDict()  # (category, name) -> (surface or None, bytes), oldest first
+        self.users = {}                # (category, name) -> set of owners holding it
+        self.owned = {}                # owner -> set of (category, name)
+        self.resident_bytes = 0
+        self.loads = 0
+        self.evictions = 0
+        self.lock = threading.RLock()  # Levels may be prefetched on a worker thread
+        self.staged = {}  # path -> (surface, finished) decoded off the main thread, awaiting conversion
+        self.atlas = None  # SpriteAtlas whose sheets stand in for individual sprite files
+        self.pack = None  # AssetPack of pre-decoded images, checked before the files
+        self.surface_cache = None  # SurfaceCache of finished surfaces, checked before the pack
+        self.scale = 1  # Sprite scale factor, applied when images are finished
+
+    def register(self, category, name, path=None, fallback=None):
+        """Add an asset loaded from an image file, or drawn by fallback() if it is missing"""
+        self.catalog[(category, name)] = AssetEntry(category, name, path=path, fallback=fallback)
+
+    def register_alias(self, category, name, target):
+        """Add a name that shares another asset's surface (e.g. extended NPC types)"""
+        self.catalog[(category, name)] = AssetEntry(category, name, alias=target)
+
+    def register_derived(self, category, name, source, transform):
+        """Add an asset made from another one (e.g. a mirrored sprite)"""
+        self.catalog[(category, name)] = AssetEntry(category, name, source=source, transform=transform)
+
+    def use_atlas(self, atlas):
+        """Take sprites from an atlas's sheets; the sheets stay loaded once used"""
+        self.atlas = atlas
+        if atlas:
+            for sheet in atlas.sheets:
+                self.register('atlas', sheet, sheet)
+            self.retain('atlas', [('atlas', sheet) for sheet in atlas.sheets])
+
+    def names(self, category):
+        """Get the registered names in a category"""
+        return [name for entry_category, name in self.catalog if entry_category == category]
+
+    def group(self, category):
+        return AssetGroup(self, category)
+
+    def resolve(self, key):
+        """Follow aliases to the key whose surface is actually stored"""
+        entry = self.catalog.get(key)
+        while entry is not None and entry.alias:
+            key = entry.alias
+            entry = self.catalog.get(key)
+        return key
+
+    def get(self, category, name):
+        """Get an asset's surface, loading it on first request; None if it has none"""
+        key = self.resolve((category, name))
+        with self.lock:
+            resident = self.resident.get(key)
+            if resident is not None:
+                self.resident.move_to_end(key)
+                return resident[0]
+
+            surface = self.load(self.catalog[key]) if key in self.catalog else None
+            self.store(key, surface)
+            return surface
+
+    def get_decoded(self, category, name):
+        """Get an asset's surface without converting it: resident if loaded, else decoded and staged
+
+        Safe on a worker thread; the staged image is converted when the main
+        thread later loads the asset. None for assets without an image file of
+        their own (atlas sprites, derived or missing ones).
+        """
+        key = self.resolve((category, name))
+        with self.lock:
+            resident = self.resident.get(key)
+            if resident is not None:
+                return resident[0]
+            entry = self.catalog.get(key)
+            staged = self.staged.get(entry.path) if entry and entry.path else None
+        if entry is None or not entry.path or (self.atlas and entry.path in self.atlas):
+            return None
+        return (staged or self.stage_image(entry.path))[0]
+
+    def stage(self, keys):
+        """Decode assets ahead of use without touching the display (safe on a worker thread)
+
+        Surface cache hits are staged finished, everything else raw for
+        preload() or get() to convert on the main thread. Atlas sprites stage
+        their sheet instead.
+        """
+        paths = set()
+        with self.lock:
+            for key in keys:
+                key = self.resolve(key)
+                entry = self.catalog.get(key)
+                if entry is None or not entry.path or key in self.resident:
+                    continue
+                location = self.atlas.locate(entry.path) if self.atlas else None
+                if location is None:
+                    paths.add(entry.path)
+                elif ('atlas', location[0]) not in self.resident:
+                    paths.add(location[0])
+            paths -= self.staged.keys()
+        for path in paths:
+            self.stage_image(path)
+        return len(paths)
+
+    def stage_image(self, path):
+        """Decode one image from the surface cache, the pack or its file and stage it"""
+        source_hash = self.image_hash(path)
+        surface = self.surface_cache.load(self.surface_cache.key(source_hash, self.scale)) if source_hash else None
+        staged = (surface, True) if surface is not None else (self.decode(path), False)
+        with self.lock:
+            self.staged[path] = staged
+        return staged
+
+    def finish_staged(self, path):
+        """Take a staged image and finish it for blitting, caching it (main thread only)"""
+        with self.lock:
+            surface, finished = self.staged.pop(path)
+        if not finished and surface is not None:
+            surface = self.finish_image(surface)
+            source_hash = self.image_hash(path)
+            if source_hash:
+                self.surface_cache.save(self.surface_cache.key(source_hash, self.scale), surface)
+        return surface
+
+    def clear_staged(self):
+        """Drop staged images nothing loaded (e.g. for a level that was not entered)"""
+        with self.lock:
+            self.staged.clear()
+
+    def store(self, key, surface):
+        """Record a loaded surface (or None for a missing asset) as resident"""
+        size = surface_bytes(surface)
+        self.resident[key] = (surface, size)
+        self.resident_bytes += size
+        self.loads += 1
+        self.enforce_budget()
+
+    def load(self, entry):
+        """Make the surface for a catalog entry"""
+        if entry.source:
+            source = self.get(*entry.source)
+            return entry.transform(source) if source else None
+
+        surface = None
+        if entry.path:
+            surface = self.atlas_sprite(entry.path) or self.load_image(entry.path)
+        if surface is None and entry.fallback:
+            surface = self.draw_fallback(entry)
+        return surface
+
+    def load_image(self, path):
+        """Get one image (staged, from the surface cache, the pack or its file), finished for fast blits"""
+        if path in self.staged:
+            return self.finish_staged(path)
+        return self.cached(self.image_hash(path), lambda: self.finish_image(self.decode(path)))
+
+    def atlas_sprite(self, path):
+        """Get a sprite as a subsurface of its atlas sheet, or None if it is not in the atlas"""
+        location = self.atlas.locate(path) if self.atlas else None
+        if location is None:
+            return None
+        sheet_path, rect = location
+        sheet = self.get('atlas', sheet_path)
+        if sheet is None:
+            return None
+        return sheet.subsurface(pygame.Rect([round(value * self.scale) for value in rect]))
+
+    def packed(self, path):
+        """Check whether an image comes from the pack
+
+        The pack must hold a current copy; for an atlas sheet it must also be
+        the sheet atlas.json describes, or the sprite rects would not match.
+        """
+        if not self.pack or path not in self.pack:
+            return False
+        sheet_hash = self.atlas.source_hash(path) if self.atlas else None
+        return sheet_hash is None or self.pack.source_hash(path) == sheet_hash
+
+    def decode(self, path):
+        """Get one unconverted image from the pack, or decode its file"""
+        surface = self.pack.surface(path) if self.packed(path) else None
+        if surface is None:
+            surface, _ = decode_image(path)
+        return surface
+
+    def draw_fallback(self, entry):
+        """Draw an entry's stand-in surface, or take it from the surface cache"""
+        source_hash = self.fallback_hash(entry) if self.surface_cache else None
+        return self.cached(source_hash, lambda: self.scaled(entry.fallback()))
+
+    def fallback_hash(self, entry):
+        """Get the surface cache source hash of an entry's drawn fallback"""
+        return f"fallback:{hash_callable(entry.fallback)}"
+
+    def image_hash(self, path):
+        """Get an image's surface cache source hash, or None when not caching
+
+        The key follows where the pixels are decoded from: packed images use
+        the content hash recorded in the pack, loose files (atlas sheets
+        included) are fingerprinted by mtime and size. Neither is read.
+        """
+        if not self.surface_cache:
+            return None
+        if self.packed(path):
+            return self.pack.source_hash(path) or stat_file(path)
+        return stat_file(path)
+
+    def cached(self, source_hash, make):
+        """Get a surface from the surface cache, or make() it and cache the result"""
+        if source_hash is None:
+            return make()
+        key = self.surface_cache.key(source_hash, self.scale)
+        surface = self.surface_cache.load(key)
+        if surface is None:
+            surface = make()
+            self.surface_cache.save(key, surface)
+        return surface
+
+    def finish_image(self, surface):
+        """Convert a decoded surface to the display format and scale it (main thread only)"""
+        if surface is not None and pygame.display.get_surface():
+            surface = surface.convert_alpha()
+        return self.scaled(surface)
+
+    def scaled(self, surface):
+        """Apply the sprite scale factor"""
+        if surface is None or self.scale == 1:
+            return surface
+        return pygame.transform.scale_by(surface, self.scale)
+
+    def preload(self, keys, workers=DECODE_WORKERS):
+        """Load many assets at once: decode their files on a thread pool, then convert them in one batch
+
+        Assets without a file (derived ones) or already resident are skipped;
+        missing files still get their fallback. Atlas sprites only need their
+        sheets; images staged by a prefetch are only converted, and surface
+        cache hits skip both steps. Prints per-file and total times.
+        """
+        pending = {}  # path -> [(key, entry)] waiting on that file
+        atlased = []  # (key, entry) cut from an atlas sheet
+        with self.lock:
+            for key in keys:
+                key = self.resolve(key)
+                entry = self.catalog.get(key)
+                if entry is not None and entry.path and key not in self.resident:
+                    if self.atlas and entry.path in self.atlas:
+                        atlased.append((key, entry))
+                    else:
+                        pending.setdefault(entry.path, []).append((key, entry))
+
+        if atlased:
+            self.preload({('atlas', self.atlas.locate(entry.path)[0]) for _, entry in atlased}, workers)
+            with self.lock:
+                for key, entry in atlased:
+                    if key not in self.resident:
+                        self.store(key, self.load(entry))
+            print(f"🗺️ Took {len(atlased)} sprites from the atlas")
+        if not pending:
+            return
+
+        # Images a level prefetch already decoded only need converting
+        staged = [path for path in pending if path in self.staged]
+        if staged:
+            start = time.perf_counter()
+            with self.lock:
+                for path in staged:
+                    surface = self.finish_staged(path)
+                    for key, entry in pending.pop(path):
+                        if key in self.resident:
+                            continue
+                        if surface is None and entry.fallback:
+                            self.store(key, self.draw_fallback(entry))
+                        else:
+                            self.store(key, surface)
+            print(f"📥 Finished {len(staged)} prefetched images in {(time.perf_counter() - start) * 1000:.1f} ms")
+            if not pending:
+                return
+
+        # Finished surfaces from earlier runs need neither decoding nor converting
+        cache_keys = {}  # path -> surface cache key, for saving what gets decoded below
+        cached = 0
+        if self.surface_cache:
+            with self.lock:
+                for path in list(pending):
+                    source_hash = self.image_hash(path)
+                    if source_hash is None:
+                        continue
+                    cache_keys[path] = self.surface_cache.key(source_hash, self.scale)
+                    surface = self.surface_cache.load(cache_keys[path])
+                    if surface is not None:
+                        cached += 1
+                        for key, _ in pending.pop(path):
+                            if key not in self.resident:
+                                self.store(key, surface)
+            if cached:
+                print(f"💾 Took {cached} images from the surface cache")
+            if not pending:
+                return
+
+        # Packed images are already decoded; only the rest go to the thread pool
+        packed = {path: (self.pack.surface(path), 0.0) for path in pending if self.packed(path)}
+        files = [path for path in pending if path not in packed]
+
+        start = time.perf_counter()
+        workers = max(1, min(workers, len(files)))
+        decoded = dict(packed)
+        if files:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asset-decode") as pool:
+                decoded.update(zip(files, pool.map(decode_image, files)))
+        decode_time = time.perf_counter() - start
+
+        # convert_alpha needs the display, so the batch is finished here on the calling thread
+        start = time.perf_counter()
+        with self.lock:
+            for path, (surface, _) in decoded.items():
+                surface = self.finish_image(surface)
+                if path in cache_keys:
+                    self.surface_cache.save(cache_keys[path], surface)
+                for key, entry in pending[path]:
+                    if key in self.resident:
+                        continue
+                    if surface is None and entry.fallback:
+                        self.store(key, self.draw_fallback(entry))
+                    else:
+                        self.store(key, surface)
+        convert_time = time.perf_counter() - start
+
+        file_time = sum(seconds for _, seconds in decoded.values())
+        if packed:
+            print(f"📦 Took {len(packed)} images from the asset pack")
+        if files:
+            print(f"🧵 Decoded {len(files)} images on {workers} threads in {decode_time * 1000:.1f} ms "
+                  f"({file_time * 1000:.1f} ms of file work)")
+        print(f"🎨 Converted {len(decoded)} images in {convert_time * 1000:.1f} ms")
+        for path in sorted(files, key=lambda path: -decoded[path][1]):
+            print(f"   {decoded[path][1] * 1000:6.2f} ms  {path}")
+
+    def prune_surface_cache(self):
+        """Delete cached surfaces that no registered asset would load any more
+
+        Anything keyed by an old source, display format or scale goes.
+        """
+        if not self.surface_cache:
+            return
+        keys = set()
+        for entry in self.catalog.values():
+            if entry.path and not (self.atlas and entry.path in self.atlas):
+                source_hash = self.image_hash(entry.path)
+                if source_hash:
+                    keys.add(self.surface_cache.key(source_hash, self.scale))
+            if entry.fallback:
+                keys.add(self.surface_cache.key(self.fallback_hash(entry), self.scale))
+        removed = self.surface_cache.prune(keys)
+        if removed:
+            print(f"🧹 Pruned {removed} stale cached surfaces")
+
+    def retain(self, owner, keys):
+        """Make owner hold exactly these (category, name) assets, releasing what it held before
+
+        Held assets are never evicted. Nothing is loaded here; assets still load
+        on first use.
+        """
+        with self.lock:
+            keys = {self.resolve(key) for key in keys}
+            for key in self.owned.get(owner, set()) - keys:
+                self.users[key].discard(owner)
+            for key in keys:
+                self.users.setdefault(key, set()).add(owner)
+            self.owned[owner] = keys
+            self.enforce_budget()
+
+    def release(self, owner):
+        """Drop everything an owner holds so it can be evicted"""
+        self.retain(owner, ())
+        del self.owned[owner]
+
+    def enforce_budget(self):
+        """Evict least recently used, unheld assets until resident bytes fit the budget"""
+        if self.resident_bytes <= self.budget_bytes:
+            return
+        for key in list(self.resident):
+            if self.resident_bytes <= self.budget_bytes:
+                break
+            if self.users.get(key) or not self.resident[key][1]:
+                continue
+            _, size = self.resident.pop(key)
+            self.resident_bytes -= size
+            self.evictions += 1
+
+    def bytes_by_category(self):
+        """Get resident surface bytes per category"""
+        totals = {}
+        for (category, _), (_, size) in self.resident.items():
+            totals[category] = totals.get(category, 0) + size
+        return totals
+
+    def print_report(self):
+        """Print resident memory per category"""
+        totals = self.bytes_by_category()
+        loaded = sum(1 for surface, _ in self.resident.values() if surface)
+        print(f"🗃️ Assets: {loaded}/{len(self.catalog)} loaded, {self.resident_bytes / 1024:.0f} KB of "
+              f"{self.budget_bytes / 1024:.0f} KB budget, {self.evictions} evicted")
+        if self.surface_cache:
+            print(f"   surface cache: {self.surface_cache.hits} hits, {self.surface_cache.misses} misses")
+        for category in sorted(totals):
+            print(f"   {category}: {totals[category] / 1024:.0f} KB")
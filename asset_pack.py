@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Asset Pack for Moses Adventure Game
+One memory-mapped file holding decoded RGBA images and PCM sounds, built by pack_assets.py
+"""
+
+import json
+import mmap
+import os
+import struct
+
+import pygame
+
+PACK_PATH = "assets.pack"
+PACK_MAGIC = b"MOSPAK02"
+ALIGNMENT = 64
+
+_default_pack = None  # Opened once, shared by the sprite and sound loaders
+
+
+def align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def source_stat(path):
+    """Get [size, mtime_ns] of an asset's source file, or None if it is missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class AssetPack:
+    """Read-only access to a packed asset file
+
+    The index maps asset paths (as written in the code, e.g.
+    "assets/items/stone.png") to payload slices. Images are raw RGBA rows,
+    sounds raw PCM in the mixer format recorded at pack time. Each entry also
+    records its source file's size and mtime; an asset whose file has since
+    changed is treated as not packed (with a warning), so the loaders fall
+    back to the file until pack_assets.py is re-run.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as pack_file:
+            # Copy-on-write mapping: pages are shared with the file cache but
+            # writable, which pygame.image.frombuffer needs
+            self.data = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_COPY)
+        if self.data[:len(PACK_MAGIC)] != PACK_MAGIC:
+            if self.data[:6] == PACK_MAGIC[:6]:
+                raise ValueError(f"{path} is from an older pack_assets.py; re-run it")
+            raise ValueError(f"{path} is not an asset pack")
+        (length,) = struct.unpack_from("<I", self.data, len(PACK_MAGIC))
+        header_end = len(PACK_MAGIC) + 4 + length
+        header = json.loads(self.data[len(PACK_MAGIC) + 4:header_end].decode("utf-8"))
+        self.entries = header['entries']
+        self.mixer_format = tuple(header['mixer']) if header.get('mixer') else None
+        self.data_start = align(header_end)
+        self.view = memoryview(self.data)
+        self.checked = {}  # path -> whether the source file still matches the pack (one stat each)
+
+    def __contains__(self, path):
+        return self.entry(path) is not None
+
+    def entry(self, path):
+        """Get a path's index entry, or None if it is not packed or its source file changed"""
+        entry = self.entries.get(path)
+        if entry is None:
+            return None
+        current = self.checked.get(path)
+        if current is None:
+            stat = source_stat(path)
+            current = stat is None or stat == entry.get('source')  # A missing file leaves only the pack
+            if not current:
+                print(f"⚠️  {path} changed since the asset pack was built; loading the file "
+                      f"until pack_assets.py is re-run")
+            self.checked[path] = current
+        return entry if current else None
+
+    def payload(self, entry):
+        start = self.data_start + entry['offset']
+        return self.view[start:start + entry['size']]
+
+    def source_hash(self, path):
+        """Get the content hash of the file an image was packed from, or None"""
+        entry = self.entry(path)
+        return entry.get('hash') if entry else None
+
+    def surface(self, path):
+        """Get an image as a surface over the mapped pixels, or None if it is not packed"""
+        entry = self.entry(path)
+        if entry is None or entry['kind'] != 'image':
+            return None
+        return pygame.image.frombuffer(self.payload(entry), (entry['width'], entry['height']), "RGBA")
+
+    def sound(self, path):
+        """Get a packed sound as a mixer Sound, or None if missing or packed for another mixer format"""
+        entry = self.entry(path)
+        if entry is None or entry['kind'] != 'sound' or pygame.mixer.get_init() != self.mixer_format:
+            return None
+        return pygame.mixer.Sound(buffer=self.payload(entry))
+
+
+def open_default_pack():
+    """Get the game's asset pack, or None if pack_assets.py has not been run"""
+    global _default_pack
+    if _default_pack is None:
+        try:
+            _default_pack = AssetPack(PACK_PATH)
+            print(f"📦 Using asset pack {PACK_PATH} ({len(_default_pack.entries)} assets)")
+        except (OSError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                print(f"⚠️  Ignoring asset pack: {e}")
+            _default_pack = False
+    return _default_pack or None
+
+
+def write_pack(path, images, sounds, mixer_format, source_hashes=None):
+    """Write a pack from {path: surface} images and {path: raw PCM bytes} sounds
+
+    source_hashes ({path: hash}) are stored with the images so the surface
+    cache can key them without reading the source files.
+    """
+    source_hashes = source_hashes or {}
+    entries = {}
+    payloads = []
+    offset = 0
+    for asset_path, surface in images.items():
+        data = pygame.image.tobytes(surface, "RGBA")
+        entries[asset_path] = {'kind': 'image', 'offset': offset, 'size': len(data),
+                               'width': surface.get_width(), 'height': surface.get_height(),
+                               'hash': source_hashes.get(asset_path), 'source': source_stat(asset_path)}
+        payloads.append((offset, data))
+        offset = align(offset + len(data))
+    for asset_path, data in sounds.items():
+        entries[asset_path] = {'kind': 'sound', 'offset': offset, 'size': len(data),
+                               'source': source_stat(asset_path)}
+        payloads.append((offset, data))
+        offset = align(offset + len(data))
+
+    header = json.dumps({'entries': entries, 'mixer': list(mixer_format) if mixer_format else None}).encode("utf-8")
+    data_start = align(len(PACK_MAGIC) + 4 + len(header))
+
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as pack_file:
+        pack_file.write(PACK_MAGIC)
+        pack_file.write(struct.pack("<I", len(header)))
+        pack_file.write(header)
+        for payload_offset, data in payloads:
+            pack_file.seek(data_start + payload_offset)
+            pack_file.write(data)
+        pack_file.truncate(data_start + offset)
+    os.replace(temp_path, path)
+    return entries
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Axis Index for Moses Adventure Game
+Objects kept sorted by one x coordinate so range queries are two binary searches
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+class AxisIndex:
+    def __init__(self):
+        self.keys = []     # Sorted x coordinates
+        self.objects = []  # Objects in the same order as keys
+
+    def __len__(self):
+        return len(self.objects)
+
+    def clear(self):
+        """Remove everything from the index"""
+        self.keys.clear()
+        self.objects.clear()
+
+    def build(self, keys, objects):
+        """Replace the contents with objects at the given x coordinates, sorting once"""
+        order = sorted(range(len(objects)), key=keys.__getitem__)
+        self.keys = [keys[i] for i in order]
+        self.objects = [objects[i] for i in order]
+
+    def insert(self, x, obj):
+        """Add an object at x, after any objects already at the same x"""
+        i = bisect_right(self.keys, x)
+        self.keys.insert(i, x)
+        self.objects.insert(i, obj)
+
+    def remove(self, x, obj):
+        """Remove an object that was inserted at x; return True if it was found"""
+        i = bisect_left(self.keys, x)
+        stop = bisect_right(self.keys, x, lo=i)
+        for j in range(i, stop):
+            if self.objects[j] is obj:
+                del self.keys[j]
+                del self.objects[j]
+                return True
+        return False
+
+    def query(self, low, high):
+        """Get the objects with low < x < high, in x order"""
+        start = bisect_right(self.keys, low)
+        stop = bisect_left(self.keys, high, lo=start)
+        return self.objects[start:stop]
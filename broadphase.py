@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Sort-and-Sweep Broadphase for Moses Adventure Game
+Finds overlapping box pairs between two groups (projectiles and enemies) in one pass
+"""
+
+import numpy as np
+
+EMPTY_PAIRS = (np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp))
+
+
+def boxes_from_rects(rects):
+    """Pack pygame Rects into an (N, 4) array of left, top, right, bottom"""
+    boxes = np.zeros((len(rects), 4), dtype=np.float64)
+    for i, rect in enumerate(rects):
+        boxes[i] = (rect.left, rect.top, rect.right, rect.bottom)
+    return boxes
+
+
+def sweep_overlaps(boxes_a, boxes_b):
+    """Get (index_a, index_b) arrays for every overlapping pair of boxes
+
+    Group A is sorted once along x. Each B box then only looks at the A
+    boxes whose left edge falls inside [b.left - widest A, b.right), found
+    with a binary search, so the cost grows with N log N plus the number
+    of nearby pairs instead of A x B.
+    """
+    if len(boxes_a) == 0 or len(boxes_b) == 0:
+        return EMPTY_PAIRS
+
+    order = np.argsort(boxes_a[:, 0], kind='stable')
+    sorted_a = boxes_a[order]
+    lefts = sorted_a[:, 0]
+    widest = float((sorted_a[:, 2] - lefts).max())
+
+    # Sweep window in sorted A for every B box
+    starts = np.searchsorted(lefts, boxes_b[:, 0] - widest, side='right')
+    stops = np.searchsorted(lefts, boxes_b[:, 2], side='left')
+    counts = np.maximum(stops - starts, 0)
+    total = int(counts.sum())
+    if total == 0:
+        return EMPTY_PAIRS
+
+    # Expand the windows into flat candidate pairs without a Python loop
+    candidate_b = np.repeat(np.arange(len(boxes_b)), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    candidate_a = np.repeat(starts, counts) + offsets
+
+    a = sorted_a[candidate_a]
+    b = boxes_b[candidate_b]
+    overlap = (a[:, 0] < b[:, 2]) & (a[:, 2] > b[:, 0]) & (a[:, 1] < b[:, 3]) & (a[:, 3] > b[:, 1])
+    return order[candidate_a[overlap]], candidate_b[overlap]
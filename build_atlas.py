@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Moses Adventure - Sprite Atlas Builder
+Packs the sprites made by create_sprites.py into a few large sheets plus atlas.json
+Re-run after changing any sprite (create_sprites.py does this itself); an existing assets.pack is rebuilt too
+"""
+
+import json
+import os
+import sys
+
+import pygame
+
+from asset_pack import PACK_PATH, source_stat
+from pack_assets import pack_assets
+from sprite_atlas import ATLAS_DIR, ATLAS_META_NAME, ATLAS_VERIFIED_NAME
+from surface_cache import hash_file
+
+# Folders whose sprites go into the atlas; backgrounds are full-screen and stay separate
+ATLAS_SOURCES = [
+    "assets/sprites/player",
+    "assets/sprites/npcs",
+    "assets/sprites/enemies",
+    "assets/sprites/effects",
+    "assets/items",
+    "assets/tiles",
+    "assets/ui",
+]
+ATLAS_SHEET_SIZE = 512  # Maximum sheet width and height (pixels)
+ATLAS_PADDING = 2       # Transparent gap around each sprite so scaled sheets do not bleed
+
+# Animation frame tables: name -> frames in play order
+ATLAS_ANIMATIONS = {
+    'moses_walk': [f"assets/sprites/player/moses_walk_{i}.png" for i in range(4)],
+}
+
+
+def collect_sprites(folders):
+    """Load every PNG in the folders: {path: surface}, paths as the game writes them"""
+    sprites = {}
+    for folder in folders:
+        if not os.path.isdir(folder):
+            print(f"⚠️  Missing sprite folder {folder}")
+            continue
+        for filename in sorted(os.listdir(folder)):
+            if filename.lower().endswith(".png"):
+                path = f"{folder}/{filename}"
+                try:
+                    sprites[path] = pygame.image.load(path)
+                except pygame.error as e:
+                    print(f"❌ Skipping {path}: {e}")
+    return sprites
+
+
+def pack_rects(sizes, sheet_size=ATLAS_SHEET_SIZE, padding=ATLAS_PADDING):
+    """Shelf-pack {name: (width, height)} into sheets
+
+    Tallest first, left to right along shelves, opening a new sheet when one
+    is full. Returns ({name: (sheet, x, y)}, [(sheet width, sheet height)]).
+    """
+    placements = {}
+    sheets = []
+    shelf_x = shelf_y = shelf_height = used_width = 0
+    for name, (width, height) in sorted(sizes.items(), key=lambda item: (-item[1][1], -item[1][0], item[0])):
+        padded_width, padded_height = width + padding * 2, height + padding * 2
+        if padded_width > sheet_size or padded_height > sheet_size:
+            raise ValueError(f"{name} ({width}x{height}) does not fit a {sheet_size}px sheet")
+        if not sheets or shelf_x + padded_width > sheet_size:
+            shelf_x, shelf_y, shelf_height = 0, shelf_y + shelf_height, 0
+        if not sheets or shelf_y + padded_height > sheet_size:
+            if sheets:
+                sheets[-1] = (used_width, shelf_y)
+            sheets.append(None)
+            shelf_x = shelf_y = shelf_height = used_width = 0
+        placements[name] = (len(sheets) - 1, shelf_x + padding, shelf_y + padding)
+        shelf_x += padded_width
+        shelf_height = max(shelf_height, padded_height)
+        used_width = max(used_width, shelf_x)
+    if sheets:
+        sheets[-1] = (used_width, shelf_y + shelf_height)
+    return placements, sheets
+
+
+def format_metadata(sheets, sprites, animations):
+    """Write atlas.json with one sprite or animation per line so rebuilds diff cleanly"""
+    def section(name, entries):
+        lines = [f"        {json.dumps(key)}: {json.dumps(value)}" for key, value in sorted(entries.items())]
+        return f'    "{name}": {{\n' + ",\n".join(lines) + "\n    }"
+    sheet_lines = ",\n".join(f"        {json.dumps(sheet)}" for sheet in sheets)
+    return ("{\n"
+            f'    "sheets": [\n{sheet_lines}\n    ],\n'
+            f"{section('sprites', sprites)},\n"
+            f"{section('animations', animations)}\n"
+            "}\n")
+
+
+def build_atlas(folders=ATLAS_SOURCES, output_dir=ATLAS_DIR):
+    """Pack the sprites and write the sheets and their metadata"""
+    pygame.init()
+    sprites = collect_sprites(folders)
+    placements, sheet_sizes = pack_rects({path: surface.get_size() for path, surface in sprites.items()})
+
+    sheets = [pygame.Surface(size, pygame.SRCALPHA, 32) for size in sheet_sizes]
+    for sheet in sheets:
+        sheet.fill((0, 0, 0, 0))
+    entries = {}
+    for path, (index, x, y) in placements.items():
+        surface = sprites[path]
+        sheets[index].blit(surface, (x, y))
+        entries[path] = {'sheet': index, 'rect': [x, y, *surface.get_size()], 'hash': hash_file(path),
+                         'source': source_stat(path)}
+
+    os.makedirs(output_dir, exist_ok=True)
+    sheet_files = []
+    for index, sheet in enumerate(sheets):
+        sheet_path = os.path.join(output_dir, f"sheet_{index}.png")
+        pygame.image.save(sheet, sheet_path)
+        sheet_files.append({'file': os.path.basename(sheet_path), 'hash': hash_file(sheet_path)})
+
+    animations = {name: {'frames': [frame for frame in frames if frame in entries]}
+                  for name, frames in ATLAS_ANIMATIONS.items()}
+    with open(os.path.join(output_dir, ATLAS_META_NAME), "w") as meta_file:
+        meta_file.write(format_metadata(sheet_files, entries, animations))
+    if os.path.exists(os.path.join(output_dir, ATLAS_VERIFIED_NAME)):
+        os.remove(os.path.join(output_dir, ATLAS_VERIFIED_NAME))  # Fresh fingerprints make it redundant
+
+    print(f"🗺️ Packed {len(entries)} sprites into {len(sheets)} sheet(s) "
+          f"({', '.join(f'{width}x{height}' for width, height in sheet_sizes)}) in {output_dir}")
+    if os.path.exists(PACK_PATH):
+        return pack_assets()  # The sprites and sheets it holds just changed
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if build_atlas() else 1)
@@ -9,6 +9,8 @@ import os
 from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 
+from build_atlas import build_atlas
+
 # Initialize Pygame for color constants
 pygame.init()
 
@@ -499,6 +501,7 @@ def main():
     create_enemy_sprites()
     create_effect_sprites()
     create_location_backgrounds()
+    build_atlas()
     
     print("\n✅ All sprites created successfully!")
     print("\nGenerated assets:")
@@ -510,6 +513,7 @@ def main():
     print("📁 Enemy sprites (Egyptian soldiers, Wild animals)")
     print("📁 Effect sprites (Dust clouds, Sparkles, Divine light)")
     print("📁 Location backgrounds (Palace, Desert, Red Sea)")
+    print("📁 Sprite atlas (all of the above but the backgrounds, packed into sheets)")
     print("\nYou can now run your Moses Adventure game!")
     print("To improve the sprites later, you can:")
     print("- Replace with hand-drawn artwork")
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Entity-Component System for Moses Adventure Game
+Dense component columns plus systems that run over every entity with matching components
+"""
+
+import numpy as np
+import pygame
+
+from font_manager import get_font_manager
+
+SCREEN_WIDTH = 1024
+SCREEN_HEIGHT = 768
+FPS = 60
+
+# How close Moses must be to an NPC (center to center) to talk
+INTERACTION_RANGE_X = 100
+INTERACTION_RANGE_Y = 60
+
+# Component name -> column name -> dtype (object columns hold Python values)
+COMPONENTS = {
+    'body': {'x': np.float64, 'y': np.float64, 'width': np.int16, 'height': np.int16},
+    'bob': {'phase': np.float64, 'speed': np.float64},
+    'patrol': {'start_x': np.float64, 'distance': np.float64, 'speed': np.float64,
+               'direction': np.int8, 'timer': np.float64, 'turn_time': np.float64},
+    'health': {'current': np.int32, 'maximum': np.int32, 'defeated': np.bool_},
+    'pickup': {'item_type': object},
+    'interaction': {'npc_type': object, 'dialogue_id': object, 'facing_right': np.bool_,
+                    'showing_prompt': np.bool_, 'info_shown': np.bool_,
+                    'is_interacting': np.bool_, 'completed': np.bool_},
+    'enemy': {'enemy_type': object},
+}
+
+ITEM_COLORS = {
+    "stone": (128, 128, 128),
+    "meat": (139, 69, 19),
+    "water": (70, 130, 180),
+    "armor_of_god": (255, 215, 0),
+    "staff": (139, 69, 19),
+    "bread": (210, 180, 140),
+    "scroll": (245, 245, 220)
+}
+
+NPC_COLORS = {
+    "palace_guard": (255, 0, 0),        # Bright Red
+    "egyptian_citizen": (255, 255, 255), # White
+    "hebrew_slave": (139, 69, 19),      # Brown
+    "priest": (255, 215, 0),            # Gold
+    "royal_servant": (0, 191, 255),     # Deep Sky Blue
+    "taskmaster": (220, 20, 60),        # Crimson
+}
+
+ENEMY_COLORS = {
+    "egyptian_soldier": (220, 20, 60),  # Red
+    "wild_animal": (139, 69, 19),       # Brown
+}
+
+
+class ComponentStore:
+    def __init__(self, columns, capacity=16):
+        self.columns = columns
+        self.count = 0
+        self.rows = {}  # entity -> row
+        self.capacity = 0
+        self.allocate(capacity)
+
+    def allocate(self, capacity):
+        """Create (or grow) the packed columns, keeping existing rows"""
+        entities = np.zeros(capacity, dtype=np.int64)
+        if self.count:
+            entities[:self.count] = self.entities[:self.count]
+        self.entities = entities
+
+        for name, dtype in self.columns.items():
+            array = np.empty(capacity, dtype=object) if dtype is object else np.zeros(capacity, dtype=dtype)
+            if self.count:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def __contains__(self, entity):
+        return entity in self.rows
+
+    def add(self, entity, values):
+        """Append a row for an entity"""
+        if self.count == self.capacity:
+            self.allocate(self.capacity * 2)
+
+        row = self.count
+        self.entities[row] = entity
+        for name in self.columns:
+            getattr(self, name)[row] = values.get(name, 0 if self.columns[name] is not object else None)
+        self.rows[entity] = row
+        self.count += 1
+
+    def add_many(self, entities, values):
+        """Append rows for a batch of entities; values are per-column arrays or scalars"""
+        n = len(entities)
+        if self.count + n > self.capacity:
+            self.allocate(max(self.capacity * 2, self.count + n))
+
+        start, stop = self.count, self.count + n
+        self.entities[start:stop] = entities
+        for name in self.columns:
+            getattr(self, name)[start:stop] = values.get(name, 0 if self.columns[name] is not object else None)
+        self.rows.update(zip(entities.tolist(), range(start, stop)))
+        self.count = stop
+
+    def remove(self, entity):
+        """Swap-remove an entity's row"""
+        row = self.rows.pop(entity)
+        last = self.count - 1
+        if row != last:
+            moved = int(self.entities[last])
+            self.entities[row] = moved
+            for name in self.columns:
+                array = getattr(self, name)
+                array[row] = array[last]
+            self.rows[moved] = row
+        self.count = last
+
+    def clear(self):
+        """Remove every row"""
+        self.rows.clear()
+        self.count = 0
+
+
+class World:
+    def __init__(self):
+        self.next_entity = 1
+        self.stores = {name: ComponentStore(columns) for name, columns in COMPONENTS.items()}
+        self.handles = {}  # entity -> game object wrapping it (NPC, ItemPickup, Enemy)
+        self.version = 0  # Bumped on every structural change to invalidate query caches
+        self.query_cache = {}
+
+    def create(self, **components):
+        """Create an entity with the given component values and return its id"""
+        entity = self.next_entity
+        self.next_entity += 1
+        for name, values in components.items():
+            self.stores[name].add(entity, values)
+        self.version += 1
+        return entity
+
+    def create_many(self, count, **components):
+        """Create count entities at once from per-column arrays; return their ids"""
+        entities = np.arange(self.next_entity, self.next_entity + count, dtype=np.int64)
+        self.next_entity += count
+        for name, values in components.items():
+            self.stores[name].add_many(entities, values)
+        self.version += 1
+        return entities
+
+    def destroy(self, entity):
+        """Remove an entity and all its components"""
+        for store in self.stores.values():
+            if entity in store:
+                store.remove(entity)
+        self.handles.pop(entity, None)
+        self.version += 1
+
+    def clear(self):
+        """Remove every entity"""
+        for store in self.stores.values():
+            store.clear()
+        self.handles.clear()
+        self.version += 1
+
+    def get(self, entity, component, column):
+        store = self.stores[component]
+        return getattr(store, column)[store.rows[entity]]
+
+    def set(self, entity, component, column, value):
+        store = self.stores[component]
+        getattr(store, column)[store.rows[entity]] = value
+
+    def query(self, *components):
+        """Get the entities having every listed component, with their row in each store
+
+        Returns (entities, rows) where rows maps component name to an index array
+        aligned with entities. Results are cached until entities are added or removed.
+        """
+        key = (components, self.version)
+        cached = self.query_cache.get(components)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        stores = [self.stores[name] for name in components]
+        smallest = min(stores, key=lambda store: store.count)
+        entities = [int(entity) for entity in smallest.entities[:smallest.count]
+                    if all(entity in store.rows for store in stores)]
+        rows = {name: np.array([self.stores[name].rows[entity] for entity in entities], dtype=np.intp)
+                for name in components}
+        result = (np.array(entities, dtype=np.int64), rows)
+        self.query_cache[components] = (key, result)
+        return result
+
+
+class ComponentField:
+    """Attribute on an entity handle that reads and writes one component column"""
+
+    def __init__(self, component, column):
+        self.component = component
+        self.column = column
+
+    def __get__(self, handle, owner=None):
+        if handle is None:
+            return self
+        value = handle.world.get(handle.entity, self.component, self.column)
+        return value.item() if isinstance(value, np.generic) else value
+
+    def __set__(self, handle, value):
+        handle.world.set(handle.entity, self.component, self.column, value)
+
+
+class EntityHandle:
+    """Object-style access to one entity, for code outside the systems"""
+
+    def __init__(self, world, **components):
+        self.world = world
+        self.entity = world.create(**components)
+        world.handles[self.entity] = self
+
+    @classmethod
+    def wrap_many(cls, world, entities):
+        """Make handles for entities created with World.create_many"""
+        handles = []
+        for entity in entities.tolist():
+            handle = cls.__new__(cls)
+            handle.world = world
+            handle.entity = entity
+            world.handles[entity] = handle
+            handles.append(handle)
+        return handles
+
+    @property
+    def alive(self):
+        return self.entity in self.world.handles
+
+    @property
+    def rect(self):
+        """Snapshot of the body as a Rect; assign a Rect back to move the entity"""
+        body = self.world.stores['body']
+        row = body.rows[self.entity]
+        return pygame.Rect(int(body.x[row]), int(body.y[row]), int(body.width[row]), int(body.height[row]))
+
+    @rect.setter
+    def rect(self, value):
+        value = pygame.Rect(value)
+        body = self.world.stores['body']
+        row = body.rows[self.entity]
+        body.x[row], body.y[row] = value.x, value.y
+        body.width[row], body.height[row] = value.width, value.height
+
+    def destroy(self):
+        """Remove the entity from its world"""
+        if self.alive:
+            self.world.destroy(self.entity)
+
+
+def bob_system(world, dt):
+    """Advance the floating animation of every bobbing entity"""
+    store = world.stores['bob']
+    n = store.count
+    store.phase[:n] += store.speed[:n] * dt
+
+
+def patrol_system(world, dt):
+    """Walk patrolling enemies back and forth, turning on a timer or at the patrol edge"""
+    entities, rows = world.query('body', 'patrol', 'health')
+    if len(entities) == 0:
+        return
+
+    body, patrol, health = world.stores['body'], world.stores['patrol'], world.stores['health']
+    b, p = rows['body'], rows['patrol']
+    active = ~health.defeated[rows['health']]
+    b, p = b[active], p[active]
+
+    timer = patrol.timer[p] + dt
+    direction = patrol.direction[p].copy()
+    turn = timer >= patrol.turn_time[p]
+    direction[turn] *= -1
+    timer[turn] = 0
+
+    # Speeds are in pixels per 60 FPS frame
+    x = body.x[b] + patrol.speed[p] * direction * dt * FPS
+    start_x, distance = patrol.start_x[p], patrol.distance[p]
+    outside = np.abs(x - start_x) > distance
+    direction[outside] *= -1
+    x[outside] = start_x[outside] + distance[outside] * np.sign(x[outside] - start_x[outside])
+
+    body.x[b] = x
+    patrol.direction[p] = direction
+    patrol.timer[p] = timer
+
+
+def interaction_system(world, player_rect, candidates, previous=(), range_y=INTERACTION_RANGE_Y):
+    """Flag the candidate NPCs close enough to talk to and clear prompts on the ones left behind
+
+    Candidates come from the level's x-sorted NPC index, already limited to the
+    horizontal interaction window, so only a handful of rows are touched per tick.
+    Returns (nearby, newly_nearby) handle lists.
+    """
+    body, interaction = world.stores['body'], world.stores['interaction']
+    nearby, newly_nearby = [], []
+    for npc in candidates:
+        b, i = body.rows[npc.entity], interaction.rows[npc.entity]
+        center_y = int(body.y[b]) + int(body.height[b]) // 2
+        if abs(player_rect.centery - center_y) < range_y:
+            nearby.append(npc)
+            if not interaction.info_shown[i]:
+                newly_nearby.append(npc)
+            interaction.showing_prompt[i] = True
+            interaction.info_shown[i] = True
+
+    # Reset info and prompt on NPCs that moved out of range
+    for npc in previous:
+        if npc.alive and npc not in nearby:
+            i = interaction.rows[npc.entity]
+            interaction.showing_prompt[i] = False
+            interaction.info_shown[i] = False
+    return nearby, newly_nearby
+
+
+def render_system(world, screen, camera_offset, sprites):
+    """Draw every item, NPC and enemy that is on screen"""
+    sprites = sprites or {}
+    render_items(world, screen, camera_offset, sprites.get('items', {}))
+    render_npcs(world, screen, camera_offset, sprites.get('npcs', {}), sprites.get('npcs_left', {}))
+    render_enemies(world, screen, camera_offset, sprites.get('enemies', {}))
+
+
+def screen_positions(world, rows, camera_offset, margin):
+    """Get integer screen x/y for body rows plus a mask of the ones near the screen"""
+    body = world.stores['body']
+    screen_x = body.x[rows].astype(np.int32) - camera_offset[0]
+    screen_y = body.y[rows].astype(np.int32) - camera_offset[1]
+    visible = ((screen_x + body.width[rows] > -margin) & (screen_x < SCREEN_WIDTH + margin) &
+               (screen_y + body.height[rows] > -margin) & (screen_y < SCREEN_HEIGHT + margin))
+    return screen_x, screen_y, visible
+
+
+def render_items(world, screen, camera_offset, item_sprites):
+    """Draw bobbing item pickups"""
+    entities, rows = world.query('body', 'pickup', 'bob')
+    if len(entities) == 0:
+        return
+
+    body, pickup, bob = world.stores['body'], world.stores['pickup'], world.stores['bob']
+    b = rows['body']
+    screen_x, screen_y, visible = screen_positions(world, b, camera_offset, 50)
+    bob_y = (np.sin(bob.phase[rows['bob']]) * 3).astype(np.int32)
+
+    for k in np.flatnonzero(visible).tolist():
+        item_type = pickup.item_type[rows['pickup'][k]]
+        render_rect = pygame.Rect(int(screen_x[k]), int(screen_y[k] - bob_y[k]), int(body.width[b[k]]), int(body.height[b[k]]))
+        sprite = item_sprites.get(item_type)
+        if sprite:
+            screen.blit(sprite, render_rect)
+        else:
+            pygame.draw.rect(screen, ITEM_COLORS.get(item_type, (255, 255, 255)), render_rect)
+
+
+def render_npcs(world, screen, camera_offset, npc_sprites, npc_left_sprites):
+    """Draw NPCs with their name label and interaction prompt when Moses is near"""
+    entities, rows = world.query('body', 'interaction')
+    if len(entities) == 0:
+        return
+
+    body, interaction = world.stores['body'], world.stores['interaction']
+    b, i = rows['body'], rows['interaction']
+    screen_x, screen_y, visible = screen_positions(world, b, camera_offset, 100)
+    fonts = get_font_manager()
+
+    for k in np.flatnonzero(visible).tolist():
+        row = i[k]
+        npc_type = interaction.npc_type[row]
+        render_rect = pygame.Rect(int(screen_x[k]), int(screen_y[k]), int(body.width[b[k]]), int(body.height[b[k]]))
+
+        sprite = npc_sprites.get(npc_type)
+        if sprite:
+            if not interaction.facing_right[row]:
+                sprite = npc_left_sprites.get(npc_type) or pygame.transform.flip(sprite, True, False)
+            screen.blit(sprite, render_rect)
+        else:
+            # Fallback body with maximum visibility
+            pygame.draw.rect(screen, NPC_COLORS.get(npc_type, (255, 0, 255)), render_rect)
+            pygame.draw.rect(screen, (0, 0, 0), render_rect, 4)  # Thick black border
+            # Head
+            pygame.draw.circle(screen, (255, 255, 255), (render_rect.centerx, render_rect.top + 12), 8)
+            pygame.draw.circle(screen, (0, 0, 0), (render_rect.centerx, render_rect.top + 12), 8, 2)
+
+        # NPC type label and interaction prompt only when Moses is close enough
+        if interaction.showing_prompt[row]:
+            font = fonts.get_sized_font(18)
+            label_text = font.render(npc_type.replace('_', ' ').title(), True, (255, 255, 255))
+            label_bg = pygame.Rect(render_rect.centerx - 35, render_rect.top - 22, 70, 18)
+            pygame.draw.rect(screen, (0, 0, 0, 180), label_bg)
+            pygame.draw.rect(screen, (200, 200, 200), label_bg, 1)
+            screen.blit(label_text, (label_bg.left + 3, label_bg.top + 1))
+
+            prompt_font = fonts.get_sized_font(22)
+            prompt_text = prompt_font.render("Press E to Interact", True, (255, 255, 255))
+            prompt_bg = pygame.Rect(render_rect.centerx - 55, render_rect.bottom + 5, 110, 22)
+            pygame.draw.rect(screen, (0, 0, 0, 200), prompt_bg)
+            pygame.draw.rect(screen, (100, 200, 100), prompt_bg, 2)
+            screen.blit(prompt_text, (prompt_bg.left + 3, prompt_bg.top + 2))
+
+        # Show position for debugging
+        pos_font = fonts.get_sized_font(16)
+        pos_text = pos_font.render(f"({int(body.x[b[k]])},{int(body.y[b[k]])})", True, (255, 255, 255))
+        screen.blit(pos_text, (render_rect.left, render_rect.bottom + 30))
+
+
+def render_enemies(world, screen, camera_offset, enemy_sprites):
+    """Draw living enemies with a health bar once damaged"""
+    entities, rows = world.query('body', 'enemy', 'health')
+    if len(entities) == 0:
+        return
+
+    body, enemy, health = world.stores['body'], world.stores['enemy'], world.stores['health']
+    b, h = rows['body'], rows['health']
+    screen_x, screen_y, visible = screen_positions(world, b, camera_offset, 50)
+    visible &= ~health.defeated[h]
+
+    for k in np.flatnonzero(visible).tolist():
+        enemy_type = enemy.enemy_type[rows['enemy'][k]]
+        render_rect = pygame.Rect(int(screen_x[k]), int(screen_y[k]), int(body.width[b[k]]), int(body.height[b[k]]))
+
+        sprite = enemy_sprites.get(enemy_type)
+        if sprite:
+            screen.blit(sprite, render_rect)
+        else:
+            pygame.draw.rect(screen, ENEMY_COLORS.get(enemy_type, (128, 128, 128)), render_rect)
+            pygame.draw.circle(screen, (0, 0, 0), render_rect.center, 4)  # Eye
+            pygame.draw.rect(screen, (0, 0, 0), render_rect, 2)  # Border
+
+        # Health bar for damaged enemies
+        current, maximum = int(health.current[h[k]]), int(health.maximum[h[k]])
+        if current < maximum:
+            bar_x, bar_y = render_rect.x + 1, render_rect.y - 8
+            pygame.draw.rect(screen, (220, 20, 60), (bar_x, bar_y, 30, 4))
+            pygame.draw.rect(screen, (34, 139, 34), (bar_x, bar_y, int(current / maximum * 30), 4))
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Enemy Store for Moses Adventure Game
+Simple patrolling enemies kept in typed NumPy columns, with dict-style views for old code
+"""
+
+import numpy as np
+import pygame
+
+FPS = 60
+PATROL_DISTANCE = 100  # Pixels an enemy walks away from its start before turning
+
+
+class EnemyView:
+    """Dict-style window onto one row of an EnemyStore
+
+    Supports the keys the old simple enemy dicts had: 'rect', 'type', 'health',
+    'current_health', 'defeated', 'direction', 'start_x' and 'speed'. The 'rect'
+    is built on read, so move an enemy by assigning a new rect back.
+    """
+
+    KEYS = ('rect', 'type', 'health', 'current_health', 'defeated', 'direction', 'start_x', 'speed')
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    def __getitem__(self, key):
+        store, i = self.store, self.index
+        if key == 'rect':
+            return pygame.Rect(int(store.x[i]), int(store.y[i]), int(store.width[i]), int(store.height[i]))
+        if key == 'type':
+            return store.type_names[store.type_id[i]]
+        if key == 'defeated':
+            return bool(store.defeated[i])
+        if key in ('health', 'current_health', 'direction'):
+            return int(getattr(store, key)[i])
+        if key in ('start_x', 'speed'):
+            return float(getattr(store, key)[i])
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        store, i = self.store, self.index
+        if key == 'rect':
+            rect = pygame.Rect(value)
+            store.x[i], store.y[i] = rect.x, rect.y
+            store.width[i], store.height[i] = rect.width, rect.height
+        elif key == 'type':
+            store.type_id[i] = store.get_type_id(value)
+        elif key in store.COLUMNS:
+            getattr(store, key)[i] = value
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self.KEYS
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+class EnemyStore:
+    COLUMNS = {
+        'x': np.float64, 'y': np.float64,
+        'width': np.int16, 'height': np.int16,
+        'start_x': np.float64, 'speed': np.float32,
+        'direction': np.int8, 'type_id': np.int16,
+        'health': np.int32, 'current_health': np.int32,
+        'defeated': np.bool_,
+        'spawn_id': np.int32,  # Row in the compiled level's enemy table, or -1
+    }
+
+    def __init__(self, capacity=32):
+        self.count = 0
+        self.type_names = []  # type_id -> enemy type string
+        self.type_ids = {}    # enemy type string -> type_id
+        self.allocate(capacity)
+
+    def allocate(self, capacity):
+        """Create (or grow) the column arrays, keeping existing enemies"""
+        for name, dtype in self.COLUMNS.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if self.count:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return (EnemyView(self, i) for i in range(self.count))
+
+    def __getitem__(self, index):
+        if not -self.count <= index < self.count:
+            raise IndexError(index)
+        return EnemyView(self, index % self.count)
+
+    def clear(self):
+        """Remove every enemy"""
+        self.count = 0
+
+    def get_type_id(self, enemy_type):
+        """Get (or register) the numeric id for an enemy type"""
+        if enemy_type not in self.type_ids:
+            self.type_ids[enemy_type] = len(self.type_names)
+            self.type_names.append(enemy_type)
+        return self.type_ids[enemy_type]
+
+    def add(self, x, y, enemy_type, health=30, direction=1, speed=1, width=32, height=32, start_x=None):
+        """Add a patrolling enemy and return its index"""
+        if self.count == self.capacity:
+            self.allocate(self.capacity * 2)
+
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.width[i] = width
+        self.height[i] = height
+        self.start_x[i] = x if start_x is None else start_x
+        self.speed[i] = speed
+        self.direction[i] = direction
+        self.type_id[i] = self.get_type_id(enemy_type)
+        self.health[i] = health
+        self.current_health[i] = health
+        self.defeated[i] = False
+        self.spawn_id[i] = -1
+        self.count += 1
+        return i
+
+    def add_many(self, x, y, enemy_types, health, direction, speed, width, height, spawn_ids=-1):
+        """Add a batch of patrolling enemies from aligned arrays (start_x is x)"""
+        n = len(x)
+        if self.count + n > self.capacity:
+            self.allocate(max(self.capacity * 2, self.count + n))
+
+        start, stop = self.count, self.count + n
+        self.x[start:stop] = x
+        self.y[start:stop] = y
+        self.width[start:stop] = width
+        self.height[start:stop] = height
+        self.start_x[start:stop] = x
+        self.speed[start:stop] = speed
+        self.direction[start:stop] = direction
+        self.type_id[start:stop] = [self.get_type_id(enemy_type) for enemy_type in enemy_types]
+        self.health[start:stop] = health
+        self.current_health[start:stop] = health
+        self.defeated[start:stop] = False
+        self.spawn_id[start:stop] = spawn_ids
+        self.count = stop
+
+    def remove_where(self, mask):
+        """Drop the enemies where mask is True, keeping the rest packed in order"""
+        n = self.count
+        keep = np.flatnonzero(~mask[:n])
+        for name in self.COLUMNS:
+            array = getattr(self, name)
+            array[:len(keep)] = array[keep]
+        self.count = len(keep)
+
+    def append(self, enemy):
+        """Add an enemy from an old-style simple enemy dict"""
+        rect = enemy['rect']
+        i = self.add(rect.x, rect.y, enemy['type'], health=enemy['health'],
+                     direction=enemy['direction'], speed=enemy['speed'],
+                     width=rect.width, height=rect.height, start_x=enemy['start_x'])
+        self.current_health[i] = enemy.get('current_health', enemy['health'])
+        self.defeated[i] = enemy.get('defeated', False)
+
+    def active_indices(self):
+        """Get the indices of enemies that are not defeated"""
+        return np.flatnonzero(~self.defeated[:self.count])
+
+    def boxes(self, indices):
+        """Get an (N, 4) array of left, top, right, bottom for the given enemies"""
+        boxes = np.empty((len(indices), 4), dtype=np.float64)
+        boxes[:, 0] = np.floor(self.x[indices])
+        boxes[:, 1] = np.floor(self.y[indices])
+        boxes[:, 2] = boxes[:, 0] + self.width[indices]
+        boxes[:, 3] = boxes[:, 1] + self.height[indices]
+        return boxes
+
+    def update_patrol(self, dt, patrol_distance=PATROL_DISTANCE):
+        """Walk every active enemy back and forth around its start position"""
+        n = self.count
+        if n == 0:
+            return
+
+        active = ~self.defeated[:n]
+        step = dt * FPS  # Speeds are in pixels per 60 FPS frame
+        self.x[:n] += np.where(active, self.direction[:n] * self.speed[:n] * step, 0.0)
+
+        # Turn around once past the patrol distance
+        turn = active & (np.abs(np.floor(self.x[:n]) - self.start_x[:n]) > patrol_distance)
+        self.direction[:n][turn] *= -1
+
+    def apply_damage(self, indices, damage):
+        """Subtract damage from the given enemies; return the indices that were defeated by it"""
+        np.subtract.at(self.current_health, indices, damage)
+        hit = np.unique(indices)
+        defeated = hit[(self.current_health[hit] <= 0) & ~self.defeated[hit]]
+        self.defeated[defeated] = True
+        return defeated
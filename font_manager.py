@@ -6,11 +6,13 @@ Handles custom font loading with graceful fallback to system fonts
 
 import pygame
 import os
+from collections import OrderedDict
 from typing import Dict, Optional
 
 class FontManager:
-    def __init__(self):
+    def __init__(self, text_cache_size: int = 256):
         self.fonts = {}
+        self.font_registry = {}  # Shared fonts keyed by (face, point size)
         self.custom_font_path = "fonts/Pixeled.ttf"
         self.custom_font_available = False
         self.system_font_name = None
@@ -23,6 +25,12 @@ class FontManager:
             'large': 48
         }
         
+        # LRU cache of rendered text surfaces keyed by (text, size, color, antialias)
+        self.text_cache = OrderedDict()
+        self.text_cache_size = text_cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
         # Try to load custom font, fallback to system fonts
         self.load_fonts()
     
@@ -127,7 +135,9 @@ class FontManager:
             'custom_font_path': self.custom_font_path,
             'system_font_name': self.system_font_name,
             'loaded_sizes': list(self.fonts.keys()),
-            'size_values': self.sizes
+            'registry_fonts': len(self.font_registry),
+            'size_values': self.sizes,
+            'text_cache': self.get_cache_stats()
         }
     
     def get_font(self, size_name: str) -> pygame.font.Font:
@@ -136,25 +146,88 @@ class FontManager:
             return self.fonts[size_name]
         else:
             # Return medium font as fallback
-            return self.fonts.get('medium', pygame.font.Font(None, 24))
+            return self.fonts.get('medium') or self.get_sized_font(24)
+    
+    def get_sized_font(self, size: int, face: Optional[str] = None) -> pygame.font.Font:
+        """Get a shared font by point size and face (None = pygame default font)
+        
+        face may be a font file path or a system font name. Fonts are created
+        once and reused, so render paths can ask for any size every frame.
+        """
+        key = (face, size)
+        font = self.font_registry.get(key)
+        if font is None:
+            font = self.create_font(size, face)
+            self.font_registry[key] = font
+        return font
+    
+    def create_font(self, size: int, face: Optional[str] = None) -> pygame.font.Font:
+        """Create a font for the registry with fallback to the default font"""
+        try:
+            if face is None:
+                return pygame.font.Font(None, size)
+            if os.path.exists(face):
+                return pygame.font.Font(face, size)
+            return pygame.font.SysFont(face, size)
+        except Exception as e:
+            print(f"⚠️  Cannot create font '{face}' at {size}px: {e}")
+            return pygame.font.Font(None, size)
     
     def render_text(self, text: str, size_name: str, color: tuple, antialias: bool = True) -> pygame.Surface:
-        """Render text with specified font size and color"""
+        """Render text with specified font size and color (cached)"""
+        # For pixel fonts, disable antialiasing for crisp pixels
+        if self.system_font_name in ['courier', 'monaco', 'consolas']:
+            antialias = False
+        
+        key = (text, size_name, tuple(color), antialias)
+        surface = self.text_cache.get(key)
+        if surface is not None:
+            self.cache_hits += 1
+            self.text_cache.move_to_end(key)
+            return surface
+        
+        self.cache_misses += 1
         try:
             font = self.get_font(size_name)
-            # For pixel fonts, disable antialiasing for crisp pixels
-            if self.system_font_name in ['courier', 'monaco', 'consolas']:
-                antialias = False
-            return font.render(text, antialias, color)
+            surface = font.render(text, antialias, color)
         except Exception as e:
             print(f"⚠️  Error rendering text '{text}': {e}")
             # Fallback rendering
             try:
-                fallback_font = pygame.font.Font(None, 24)
+                fallback_font = self.get_sized_font(24)
                 return fallback_font.render(text, True, color)
             except Exception as fallback_error:
                 print(f"❌ Critical text rendering error: {fallback_error}")
                 return None
+        
+        if self.text_cache_size > 0:
+            self.text_cache[key] = surface
+            if len(self.text_cache) > self.text_cache_size:
+                self.text_cache.popitem(last=False)
+        return surface
+    
+    def set_text_cache_size(self, capacity: int):
+        """Change the text cache capacity, evicting least recently used entries"""
+        self.text_cache_size = max(0, capacity)
+        while len(self.text_cache) > self.text_cache_size:
+            self.text_cache.popitem(last=False)
+    
+    def clear_text_cache(self):
+        """Drop all cached text surfaces and reset the counters"""
+        self.text_cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
+    def get_cache_stats(self) -> dict:
+        """Get text cache hit/miss statistics"""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'hit_rate': self.cache_hits / lookups if lookups else 0.0,
+            'entries': len(self.text_cache),
+            'capacity': self.text_cache_size
+        }
 
 # Global font manager instance
 _font_manager = None
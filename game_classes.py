@@ -1,10 +1,20 @@
 import pygame
+import numpy as np
 import random
-import math
 import os
 from enum import Enum
 from typing import Dict, List, Tuple, Optional
-from enemy_class import Enemy
+from ecs import (World, EntityHandle, ComponentField, INTERACTION_RANGE_X, bob_system, patrol_system,
+                 interaction_system, render_system)
+from axis_index import AxisIndex
+from triggers import TriggerIndex
+from static_geometry import StaticGeometryLayer
+from spatial_grid import SpatialHashGrid
+from projectiles import ProjectilePool
+from broadphase import boxes_from_rects, sweep_overlaps
+from enemy_store import EnemyStore
+from level_cache import load_compiled_level, GRID_CELL_SIZE
+from level_streaming import LevelStreamer, STREAM_MIN_WIDTH
 
 # Import constants from main game
 SCREEN_WIDTH = 1024
@@ -23,6 +33,7 @@ FPS = 60
 GRAVITY = 0.8
 JUMP_STRENGTH = -15
 PLAYER_SPEED = 5
+INTERPOLATION_SNAP_DISTANCE = 64  # Larger jumps between sim ticks are teleports, not motion
 
 # Colors
 WHITE = (255, 255, 255)
@@ -44,211 +55,11 @@ class Location(Enum):
     MOUNT_SINAI = "mount_sinai"
     JERUSALEM = "jerusalem"
 
-class Stone:
-    """Stone projectile for combat"""
-    def __init__(self, x, y, direction):
-        self.rect = pygame.Rect(x, y, 8, 8)
-        self.velocity_x = direction * 300  # Fast horizontal movement
-        self.velocity_y = -50  # Slight upward arc
-        self.gravity = 200  # Falls down
-        self.active = True
-        self.lifetime = 3.0  # Disappear after 3 seconds
-        
-    def update(self, dt):
-        """Update stone physics"""
-        if not self.active:
-            return
-            
-        # Apply physics
-        self.rect.x += self.velocity_x * dt
-        self.rect.y += self.velocity_y * dt
-        self.velocity_y += self.gravity * dt  # Gravity
-        
-        # Remove if off screen or hit ground
-        if (self.rect.x < -50 or self.rect.x > SCREEN_WIDTH + 50 or 
-            self.rect.y > SCREEN_HEIGHT):
-            self.active = False
-            
-        # Lifetime
-        self.lifetime -= dt
-        if self.lifetime <= 0:
-            self.active = False
-    
-    def render(self, screen, camera_offset):
-        """Render the stone"""
-        if not self.active:
-            return
-            
-        render_x = self.rect.x - camera_offset[0]
-        render_y = self.rect.y - camera_offset[1]
-        
-        # Draw stone as small brown circle
-        pygame.draw.circle(screen, (139, 69, 19), (render_x + 4, render_y + 4), 4)
-        pygame.draw.circle(screen, (101, 67, 33), (render_x + 4, render_y + 4), 4, 1)
-
-
-class StaffProjectile:
-    """Staff projectile using diamond yellow shape - SIMPLE AND RELIABLE"""
-    def __init__(self, x, y, direction):
-        import pygame  # Import pygame at the top
-        
-        self.rect = pygame.Rect(x, y, 16, 16)  # 16x16 diamond size
-        self.velocity_x = direction * 450  # Fast movement
-        self.velocity_y = 0  # Straight horizontal
-        self.active = True
-        self.lifetime = 3.0  # 3 seconds lifetime
-        self.damage = 20  # 20 damage per hit
-        self.direction = direction
-        
-        print(f"⚡ CREATED DIAMOND staff projectile at x={x}, y={y}, direction={direction}")
-        
-    def update(self, dt):
-        """Update staff projectile physics"""
-        if not self.active:
-            return
-            
-        # Move horizontally
-        old_x = self.rect.x
-        self.rect.x += self.velocity_x * dt
-        
-        # Debug movement every 50 pixels
-        if abs(self.rect.x - old_x) > 0 and int(self.rect.x) % 50 == 0:
-            print(f"⚡ Diamond projectile moving: x={self.rect.x}, y={self.rect.y}")
-        
-        # Remove if off screen
-        if (self.rect.x < -100 or self.rect.x > 2000):
-            print(f"⚡ Diamond projectile off screen at x={self.rect.x}")
-            self.active = False
-            
-        # Lifetime countdown
-        self.lifetime -= dt
-        if self.lifetime <= 0:
-            print("⚡ Diamond projectile expired")
-            self.active = False
-    
-    def render(self, screen, camera_offset):
-        """Render the staff projectile as a bright yellow diamond"""
-        import pygame  # Import pygame at the top
-        
-        if not self.active:
-            return
-            
-        render_x = self.rect.x - camera_offset[0]
-        render_y = self.rect.y - camera_offset[1]
-        
-        # Only render if on screen
-        if render_x < -50 or render_x > 850:
-            return
-        
-        print(f"⚡ RENDERING DIAMOND staff projectile at screen x={render_x}, y={render_y}")
-        print(f"⚡ Diamond direction: {self.direction}, center: ({center_x}, {center_y})")
-        
-        # Calculate diamond points (centered on the rect)
-        center_x = render_x + 8  # Half of 16
-        center_y = render_y + 8  # Half of 16
-        
-        # Diamond points (top, right, bottom, left)
-        diamond_points = [
-            (center_x, center_y - 8),      # Top point
-            (center_x + 8, center_y),     # Right point  
-            (center_x, center_y + 8),     # Bottom point
-            (center_x - 8, center_y)      # Left point
-        ]
-        
-        # Draw bright yellow diamond with glow effect and direction indicator
-        # Create glow surface
-        glow_surface = pygame.Surface((32, 32))
-        glow_surface.set_alpha(80)
-        glow_surface.fill((255, 255, 0))  # Yellow
-        screen.blit(glow_surface, (render_x - 8, render_y - 8))
-        
-                # SIMPLE BRIGHT TRAIL - Draw before diamond for visibility
-        trail_length = 16
-        if self.direction > 0:  # Moving right, trail behind (left)
-            # Draw bright yellow trail rectangles
-            pygame.draw.rect(screen, (255, 255, 0), (center_x - trail_length, center_y - 2, trail_length - 4, 4))
-            pygame.draw.rect(screen, (255, 255, 255), (center_x - trail_length + 2, center_y - 1, trail_length - 8, 2))
-        else:  # Moving left, trail behind (right)
-            # Draw bright yellow trail rectangles
-            pygame.draw.rect(screen, (255, 255, 0), (center_x + 4, center_y - 2, trail_length, 4))
-            pygame.draw.rect(screen, (255, 255, 255), (center_x + 6, center_y - 1, trail_length - 4, 2))
-        
-        # Draw main diamond (bright yellow)
-        pygame.draw.polygon(screen, (255, 255, 0), diamond_points)  # Bright yellow
-        
-        # Draw inner diamond (white center for brightness)
-        inner_points = [
-            (center_x, center_y - 4),      # Top point (smaller)
-            (center_x + 4, center_y),     # Right point (smaller)
-            (center_x, center_y + 4),     # Bottom point (smaller)
-            (center_x - 4, center_y)      # Left point (smaller)
-        ]
-        pygame.draw.polygon(screen, (255, 255, 255), inner_points)  # White center
-        
-        # Draw diamond outline for definition
-        pygame.draw.polygon(screen, (255, 215, 0), diamond_points, 2)  # Gold outline
-        
-        # Add directional trail effect to show movement direction
-        trail_length = 12
-        if self.direction > 0:  # Moving right
-            # Trail behind (to the left)
-            trail_points = [
-                (center_x - trail_length, center_y - 2),
-                (center_x - 4, center_y),
-                (center_x - trail_length, center_y + 2)
-            ]
-        else:  # Moving left
-            # Trail behind (to the right)
-            trail_points = [
-                (center_x + trail_length, center_y - 2),
-                (center_x + 4, center_y),
-                (center_x + trail_length, center_y + 2)
-            ]
-        
-        # Draw HIGHLY VISIBLE trail with multiple effects
-        # Method 1: Bright solid trail rectangles
-        trail_width = 20
-        trail_height = 6
-        
-        if self.direction > 0:  # Moving right, trail on left
-            # Multiple trail segments for motion blur effect
-            for i in range(3):
-                trail_x = center_x - trail_length - (i * 6)
-                trail_alpha = 255 - (i * 60)  # Fade out
-                
-                # Create bright trail segment
-                trail_rect = pygame.Rect(trail_x - 8, center_y - 3, trail_width - (i * 4), trail_height)
-                pygame.draw.rect(screen, (255, 255, 0), trail_rect)  # Bright yellow
-                pygame.draw.rect(screen, (255, 255, 255), (trail_x - 6, center_y - 1, trail_width - (i * 4) - 4, 2))  # White center
-        else:  # Moving left, trail on right
-            # Multiple trail segments for motion blur effect
-            for i in range(3):
-                trail_x = center_x + trail_length + (i * 6)
-                trail_alpha = 255 - (i * 60)  # Fade out
-                
-                # Create bright trail segment
-                trail_rect = pygame.Rect(trail_x - 4, center_y - 3, trail_width - (i * 4), trail_height)
-                pygame.draw.rect(screen, (255, 255, 0), trail_rect)  # Bright yellow
-                pygame.draw.rect(screen, (255, 255, 255), (trail_x - 2, center_y - 1, trail_width - (i * 4) - 4, 2))  # White center
-        
-        # Method 2: Additional particle trail effect
-        import random
-        for i in range(5):  # 5 trail particles
-            if self.direction > 0:  # Moving right
-                particle_x = center_x - 8 - (i * 4) + random.randint(-2, 2)
-                particle_y = center_y + random.randint(-3, 3)
-            else:  # Moving left
-                particle_x = center_x + 8 + (i * 4) + random.randint(-2, 2)
-                particle_y = center_y + random.randint(-3, 3)
-            
-            # Draw bright particle
-            pygame.draw.circle(screen, (255, 255, 100), (particle_x, particle_y), 2)
-        
-        print(f"⚡ RENDERING TRAIL for direction {self.direction} at center ({center_x}, {center_y})")
-
 class Player:
     def __init__(self, x, y, sprites):
         self.rect = pygame.Rect(x, y, 32, 48)
+        self.prev_x = x  # Position at the previous simulation tick (for interpolation)
+        self.prev_y = y
         self.velocity_x = 0
         self.velocity_y = 0
         self.on_ground = True  # Start on ground
@@ -296,6 +107,7 @@ class Player:
         # Set ground state
         self.on_ground = True
         self.velocity_y = 0
+        self.save_previous()
         
         print(f"🏠 Moses positioned on ground: x={self.rect.x}, y={self.rect.y}, bottom={self.rect.bottom}")
         print(f"🏠 Ground level: {ground_level}, Moses bottom: {self.rect.bottom}, On ground: {self.on_ground}")
@@ -307,7 +119,7 @@ class Player:
         self.staff_timer = 0.0
         self.staff_cooldown = 0.0
         self.staff_cooldown_time = 0.3  # 0.3 seconds between staff shots
-        self.staff_projectiles = []
+        self.projectile_pool = None  # Shared ProjectilePool, connected by the game
         
         # Armor of God system
         self.has_armor_buff = False
@@ -319,9 +131,28 @@ class Player:
         self.armor_timer = 0
         self.max_health = 100
 
-    def update(self, dt):
-        """Update player state with FIXED physics"""
-        keys = pygame.key.get_pressed()
+    def save_previous(self):
+        """Remember the current position before a simulation tick"""
+        self.prev_x = self.rect.x
+        self.prev_y = self.rect.y
+    
+    def get_tick_start_rect(self):
+        """Get the rect Moses occupied at the start of the current simulation tick"""
+        return pygame.Rect(self.prev_x, self.prev_y, self.rect.width, self.rect.height)
+    
+    def get_render_shift(self, alpha):
+        """Get the (dx, dy) from the simulated position to the interpolated render position"""
+        dx = self.prev_x - self.rect.x
+        dy = self.prev_y - self.rect.y
+        if abs(dx) > INTERPOLATION_SNAP_DISTANCE or abs(dy) > INTERPOLATION_SNAP_DISTANCE:
+            return (0, 0)
+        return (int(dx * (1.0 - alpha)), int(dy * (1.0 - alpha)))
+    
+    def update(self, dt, controls):
+        """Update player state with FIXED physics from the tick's held controls"""
+        
+        # Speeds are tuned in pixels per 60 FPS frame; scale them to the tick length
+        step = dt * FPS
         
         # Handle interaction state
         if self.is_interacting:
@@ -345,17 +176,17 @@ class Player:
         self.velocity_x = 0
         self.is_walking = False
         
-        if keys[pygame.K_LEFT]:
+        if controls.left:
             self.velocity_x = -PLAYER_SPEED
             self.facing_right = False
             self.is_walking = True
-        if keys[pygame.K_RIGHT]:
+        if controls.right:
             self.velocity_x = PLAYER_SPEED
             self.facing_right = True
             self.is_walking = True
         
         # Apply horizontal movement
-        self.rect.x += self.velocity_x
+        self.rect.x += self.velocity_x * step
         
         # Handle step sounds
         if hasattr(self, 'sound_manager') and self.sound_manager and self.on_ground:
@@ -375,7 +206,7 @@ class Player:
             self._was_walking_last_frame = self.is_walking
         
         # FIXED: Jumping mechanics - UP key makes Moses jump
-        if keys[pygame.K_UP]:
+        if controls.jump:
             if self.on_ground:
                 self.velocity_y = JUMP_STRENGTH  # -15
                 self.on_ground = False
@@ -389,14 +220,14 @@ class Player:
         
         # FIXED: Gravity system - Always apply when not on ground
         if not self.on_ground:
-            self.velocity_y += GRAVITY  # 0.8
+            self.velocity_y += GRAVITY * step  # 0.8 per frame
             # Terminal velocity
             if self.velocity_y > 15:
                 self.velocity_y = 15
         
         # Apply vertical movement
         old_y = self.rect.y
-        self.rect.y += self.velocity_y
+        self.rect.y += self.velocity_y * step
         
         # Keep player within horizontal bounds
         if self.rect.left < 0:
@@ -457,7 +288,8 @@ class Player:
                 self.current_sprite = 'jump'
             elif self.is_walking:
                 self.current_sprite = 'walk'
-                self.animation_frame = (self.animation_frame + 1) % 4
+                walk_frames = len(self.sprites.get('walk') or ()) if self.sprites else 0
+                self.animation_frame = (self.animation_frame + 1) % (walk_frames or 4)
             else:
                 self.current_sprite = 'idle'
                 self.animation_frame = 0
@@ -490,22 +322,19 @@ class Player:
         # Get current sprite based on state
         sprite = None
         if self.sprites:
+            sprite_key = None
             if self.is_interacting and 'interact' in self.sprites:
-                sprite = self.sprites['interact']
+                sprite_key = 'interact'
             elif self.is_jumping and 'jump' in self.sprites:
-                sprite = self.sprites['jump']
+                sprite_key = 'jump'
             elif self.is_walking and 'walk' in self.sprites:
-                if isinstance(self.sprites['walk'], list) and len(self.sprites['walk']) > self.animation_frame:
-                    sprite = self.sprites['walk'][self.animation_frame]
-                elif 'walk' in self.sprites:
-                    sprite = self.sprites['walk']
+                sprite_key = 'walk'
             elif 'idle' in self.sprites:
-                sprite = self.sprites['idle']
+                sprite_key = 'idle'
+            if sprite_key:
+                sprite = self.get_state_sprite(sprite_key)
         
         if sprite:
-            # Flip sprite if facing left
-            if not self.facing_right:
-                sprite = pygame.transform.flip(sprite, True, False)
             screen.blit(sprite, render_rect)
         else:
             # Enhanced fallback with animation indication
@@ -537,6 +366,18 @@ class Player:
                 ])
 
 
+    def get_state_sprite(self, sprite_key):
+        """Get the sprite (or walk frame) for a state, facing the current direction"""
+        left_sprite = None if self.facing_right else self.sprites.get(f'{sprite_key}_left')
+        sprite = left_sprite or self.sprites.get(sprite_key)
+        if isinstance(sprite, list):
+            sprite = sprite[self.animation_frame] if len(sprite) > self.animation_frame else None
+        
+        # Flip on the fly only when no pre-mirrored variant was cached
+        if sprite and not self.facing_right and not left_sprite:
+            sprite = pygame.transform.flip(sprite, True, False)
+        return sprite
+    
     def activate_staff(self):
         """Activate the staff buff"""
         self.has_staff = True
@@ -573,14 +414,11 @@ class Player:
         # Position at player's center height
         projectile_y = self.rect.centery - 8  # Center the 16px diamond on player center
         
-        print(f"⚡ Creating staff projectile at player pos x={self.rect.centerx}, y={self.rect.centery}")
-        print(f"⚡ Player facing: {'RIGHT' if self.facing_right else 'LEFT'}")
-        print(f"⚡ Projectile spawn: x={projectile_x}, y={projectile_y}, direction={direction}")
-        
-        projectile = StaffProjectile(projectile_x, projectile_y, direction)
-        self.staff_projectiles.append(projectile)
+        if self.projectile_pool is None:
+            print("❌ No projectile pool connected - cannot shoot")
+            return False
         
-        print(f"⚡ Total staff projectiles: {len(self.staff_projectiles)}")
+        self.projectile_pool.spawn_staff_bolt(projectile_x, projectile_y, direction)
         
         # Set cooldown
         self.staff_cooldown = self.staff_cooldown_time
@@ -589,7 +427,7 @@ class Player:
         return True
     
     def update_staff_system(self, dt):
-        """Update staff system timers and projectiles"""
+        """Update staff system timers (bolts live in the shared projectile pool)"""
         # Update staff duration
         if self.staff_active:
             self.staff_timer -= dt
@@ -599,24 +437,6 @@ class Player:
         # Update staff cooldown
         if self.staff_cooldown > 0:
             self.staff_cooldown -= dt
-        
-        # Update staff projectiles
-        for projectile in self.staff_projectiles[:]:
-            projectile.update(dt)
-            if not projectile.active:
-                self.staff_projectiles.remove(projectile)
-    
-    def render_staff_projectiles(self, screen, camera_offset):
-        """Render all staff projectiles - ENHANCED DEBUG VERSION"""
-        if len(self.staff_projectiles) > 0:
-            print(f"⚡ Rendering {len(self.staff_projectiles)} staff projectiles")
-        
-        for i, projectile in enumerate(self.staff_projectiles):
-            if projectile.active:
-                print(f"⚡ Rendering projectile {i}: x={projectile.rect.x}, y={projectile.rect.y}")
-                projectile.render(screen, camera_offset)
-            else:
-                print(f"⚡ Projectile {i} is inactive")
     
     def get_staff_time_remaining(self):
         """Get remaining staff time in seconds"""
@@ -653,6 +473,13 @@ class Camera:
         self.smoothing = 0.1
         self.vertical_smoothing = 0.08  # Slightly slower vertical movement for comfort
         self.vertical_deadzone = 50  # Pixels of movement before camera follows vertically
+        self.prev_x = 0  # Position at the previous simulation tick (for interpolation)
+        self.prev_y = 0
+    
+    def save_previous(self):
+        """Remember the current position before a simulation tick"""
+        self.prev_x = self.x
+        self.prev_y = self.y
     
     def follow_player(self, player):
         """Follow the player both horizontally AND vertically for platform jumping"""
@@ -684,289 +511,63 @@ class Camera:
         if hasattr(self, 'debug_camera') and self.debug_camera and abs(y_diff) > self.vertical_deadzone:
             print(f"📹 Camera following Moses vertically: player_y={player.rect.centery}, camera_y={self.y}")
     
-    def get_offset(self):
-        """Get camera offset for rendering"""
-        return (int(self.x), int(self.y))
-
-class Enemy:
-    def __init__(self, x, y, enemy_type, sprites):
-        self.rect = pygame.Rect(x, y, 32, 32)
-        self.enemy_type = enemy_type
-        self.health = 30
-        self.max_health = 30
-        self.speed = 1
-        self.direction = 1  # 1 for right, -1 for left
-        self.patrol_distance = 100
-        self.start_x = x
-        self.defeated = False
-        
-        # Load sprite
-        self.sprite = None
-        if sprites and 'enemies' in sprites:
-            self.sprite = sprites['enemies'].get(enemy_type)
-        
-        if not self.sprite:
-            # Create fallback sprite
-            self.sprite = self.create_fallback_sprite()
-        
-        # Movement AI
-        self.ai_timer = 0
-        self.change_direction_time = 2.0  # Change direction every 2 seconds
-    
-    def create_fallback_sprite(self):
-        """Create a fallback enemy sprite"""
-        surface = pygame.Surface((32, 32))
-        if self.enemy_type == "egyptian_soldier":
-            surface.fill((220, 20, 60))  # Red
-        elif self.enemy_type == "wild_animal":
-            surface.fill((139, 69, 19))  # Brown
-        else:
-            surface.fill((128, 128, 128))  # Gray
-        
-        # Add simple enemy design
-        pygame.draw.circle(surface, (0, 0, 0), (16, 16), 4)  # Eye
-        pygame.draw.rect(surface, (0, 0, 0), surface.get_rect(), 2)  # Border
-        return surface
-    
-    def update(self, dt):
-        """Update enemy AI and movement"""
-        if self.defeated:
-            return
-        
-        self.ai_timer += dt
-        
-        # Simple patrol AI
-        if self.ai_timer >= self.change_direction_time:
-            self.direction *= -1  # Change direction
-            self.ai_timer = 0
-        
-        # Move horizontally
-        self.rect.x += self.speed * self.direction
-        
-        # Keep within patrol area
-        if abs(self.rect.x - self.start_x) > self.patrol_distance:
-            self.direction *= -1
-            self.rect.x = self.start_x + (self.patrol_distance * (-1 if self.rect.x < self.start_x else 1))
-    
-    def take_damage(self, damage):
-        """Take damage from attacks"""
-        self.health -= damage
-        if self.health <= 0:
-            self.defeated = True
-            print(f"💀 {self.enemy_type} defeated!")
-            return True
-        else:
-            print(f"⚔️ {self.enemy_type} took {damage} damage! Health: {self.health}/{self.max_health}")
-            return False
-    
-    def render(self, screen, camera_offset):
-        """Render the enemy"""
-        if self.defeated:
-            return
-        
-        render_rect = self.rect.copy()
-        render_rect.x -= camera_offset[0]
-        render_rect.y -= camera_offset[1]
-        
-        # Only render if on screen
-        if (-50 <= render_rect.x <= SCREEN_WIDTH + 50 and 
-            -50 <= render_rect.y <= SCREEN_HEIGHT + 50):
-            
-            if self.sprite:
-                screen.blit(self.sprite, render_rect)
-            
-            # Health bar for enemies
-            if self.health < self.max_health:
-                bar_width = 30
-                bar_height = 4
-                bar_x = render_rect.x + 1
-                bar_y = render_rect.y - 8
-                
-                # Background
-                pygame.draw.rect(screen, RED, (bar_x, bar_y, bar_width, bar_height))
-                # Health
-                health_width = int((self.health / self.max_health) * bar_width)
-                pygame.draw.rect(screen, GREEN, (bar_x, bar_y, health_width, bar_height))
-
-    def __init__(self):
-        self.x = 0
-        self.y = 0
-        self.target_x = 0
-        self.target_y = 0
-        self.smoothing = 0.15  # Increased smoothing for better Mario Bros feel
-    
-    def follow_player(self, player):
-        """Mario Bros style camera following"""
-        # Follow player horizontally with smooth movement
-        self.target_x = player.rect.centerx - SCREEN_WIDTH // 2
-        self.target_y = 0  # Keep camera at a fixed vertical position for side-scrolling
-        
-        # Smooth horizontal camera movement
-        self.x += (self.target_x - self.x) * self.smoothing
-        self.y = 0  # Lock vertical camera position
-        
-        # Keep camera bounds reasonable for extended palace
-        self.x = max(0, min(self.x, SCREEN_WIDTH * 4))  # Allow camera to follow across the full palace
-    
-    def get_offset(self):
-        """Get camera offset for rendering"""
-        return (int(self.x), int(self.y))
+    def get_offset(self, alpha=1.0):
+        """Get camera offset for rendering, interpolated between the last two sim ticks"""
+        if alpha >= 1.0:
+            return (int(self.x), int(self.y))
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        return (int(x), int(y))
 
 class Platform:
     def __init__(self, x, y, width, height, platform_type="stone"):
         self.rect = pygame.Rect(x, y, width, height)
         self.platform_type = platform_type
 
-class ItemPickup:
-    def __init__(self, x, y, item_type, sprites=None):
-        self.rect = pygame.Rect(x, y, 24, 24)
-        self.item_type = item_type
-        self.sprites = sprites
-        self.bob_offset = 0
-        self.bob_speed = 2
+class ItemPickup(EntityHandle):
+    """Bobbing item entity; drawn and collected by the ECS systems"""
+    item_type = ComponentField('pickup', 'item_type')
     
-    def update(self, dt):
-        """Update item animation (bobbing effect)"""
-        self.bob_offset += self.bob_speed * dt
+    def __init__(self, world, x, y, item_type):
+        super().__init__(world,
+                         body={'x': x, 'y': y, 'width': 24, 'height': 24},
+                         bob={'phase': 0, 'speed': 2},
+                         pickup={'item_type': item_type})
     
-    def render(self, screen, camera_offset):
-        render_rect = self.rect.copy()
-        render_rect.x -= camera_offset[0]
-        render_rect.y -= camera_offset[1] + int(math.sin(self.bob_offset) * 3)
-        
-        # Get sprite
-        sprite = None
-        if self.sprites and 'items' in self.sprites:
-            sprite = self.sprites['items'].get(self.item_type)
-        
-        if sprite:
-            screen.blit(sprite, render_rect)
-        else:
-            # Fallback colors
-            colors = {
-                "stone": GRAY,
-                "meat": BROWN,
-                "water": BLUE,
-                "armor_of_god": GOLD,
-                "staff": BROWN,
-                "bread": (210, 180, 140),
-                "scroll": (245, 245, 220)
-            }
-            color = colors.get(self.item_type, WHITE)
-            pygame.draw.rect(screen, color, render_rect)
+    @classmethod
+    def spawn_many(cls, world, x, y, item_types):
+        """Create a batch of items from aligned position and type arrays"""
+        entities = world.create_many(len(x),
+                                     body={'x': x, 'y': y, 'width': 24, 'height': 24},
+                                     bob={'phase': 0, 'speed': 2},
+                                     pickup={'item_type': item_types})
+        return cls.wrap_many(world, entities)
 
-class NPC:
-    def __init__(self, x, y, npc_type, dialogue_id, sprites=None):
-        self.rect = pygame.Rect(x, y, 32, 48)
-        self.interaction_rect = pygame.Rect(x - 20, y - 20, 72, 88)
-        self.npc_type = npc_type
-        self.dialogue_id = dialogue_id
-        self.sprites = sprites
-        self.facing_right = True
-        
-        # Don't auto-position here - let the level creation handle it
-    
-    def update(self, dt):
-        """Update NPC state"""
-        pass
+class NPC(EntityHandle):
+    """Talkable NPC entity; prompts are driven by interaction_system"""
+    npc_type = ComponentField('interaction', 'npc_type')
+    dialogue_id = ComponentField('interaction', 'dialogue_id')
+    facing_right = ComponentField('interaction', 'facing_right')
+    showing_prompt = ComponentField('interaction', 'showing_prompt')
+    info_shown = ComponentField('interaction', 'info_shown')
+    is_interacting = ComponentField('interaction', 'is_interacting')
+    completed = ComponentField('interaction', 'completed')
     
-    def render(self, screen, camera_offset):
-        """Render NPC with maximum visibility and interaction prompts"""
-        render_rect = self.rect.copy()
-        render_rect.x -= camera_offset[0]
-        render_rect.y -= camera_offset[1]
+    def __init__(self, world, x, y, npc_type, dialogue_id):
+        super().__init__(world,
+                         body={'x': x, 'y': y, 'width': 32, 'height': 48},
+                         interaction={'npc_type': npc_type, 'dialogue_id': dialogue_id, 'facing_right': True})
         
-        # Always render NPCs if they're anywhere near the screen
-        if render_rect.right > -100 and render_rect.left < SCREEN_WIDTH + 100:
-            # Get sprite
-            sprite = None
-            if self.sprites and 'npcs' in self.sprites:
-                sprite = self.sprites['npcs'].get(self.npc_type)
-            
-            if sprite:
-                if not self.facing_right:
-                    sprite = pygame.transform.flip(sprite, True, False)
-                screen.blit(sprite, render_rect)
-                
-                # Removed yellow outline for cleaner look
-                # pygame.draw.rect(screen, (255, 255, 0), render_rect, 3)
-            else:
-                # ENHANCED fallback with maximum visibility
-                colors = {
-                    "palace_guard": (255, 0, 0),        # Bright Red
-                    "egyptian_citizen": (255, 255, 255), # White
-                    "hebrew_slave": (139, 69, 19),      # Brown
-                    "priest": (255, 215, 0),            # Gold
-                    "royal_servant": (0, 191, 255),     # Deep Sky Blue
-                    "taskmaster": (220, 20, 60),        # Crimson
-                }
-                color = colors.get(self.npc_type, (255, 0, 255))  # Magenta fallback
-                
-                # Draw main body with bright colors
-                pygame.draw.rect(screen, color, render_rect)
-                pygame.draw.rect(screen, (0, 0, 0), render_rect, 4)  # Thick black border
-                
-                # Add character details for better identification
-                # Head
-                pygame.draw.circle(screen, (255, 255, 255), (render_rect.centerx, render_rect.top + 12), 8)
-                pygame.draw.circle(screen, (0, 0, 0), (render_rect.centerx, render_rect.top + 12), 8, 2)
-            
-            # Show NPC type label only when nearby (less intrusive)
-            # Only show if player is close enough to interact
-            if hasattr(self, 'showing_prompt') and self.showing_prompt:
-                font = pygame.font.Font(None, 18)  # Smaller font
-                label_text = font.render(self.npc_type.replace('_', ' ').title(), True, (255, 255, 255))
-                label_bg = pygame.Rect(render_rect.centerx - 35, render_rect.top - 22, 70, 18)
-                pygame.draw.rect(screen, (0, 0, 0, 180), label_bg)  # Semi-transparent
-                pygame.draw.rect(screen, (200, 200, 200), label_bg, 1)  # Subtle gray border
-                screen.blit(label_text, (label_bg.left + 3, label_bg.top + 1))
-            
-            # Show interaction prompt with more subtle styling
-            if hasattr(self, 'showing_prompt') and self.showing_prompt:
-                prompt_font = pygame.font.Font(None, 22)
-                prompt_text = prompt_font.render("Press E to Interact", True, (255, 255, 255))
-                prompt_bg = pygame.Rect(render_rect.centerx - 55, render_rect.bottom + 5, 110, 22)
-                pygame.draw.rect(screen, (0, 0, 0, 200), prompt_bg)  # Semi-transparent black
-                pygame.draw.rect(screen, (100, 200, 100), prompt_bg, 2)  # Subtle green border
-                screen.blit(prompt_text, (prompt_bg.left + 3, prompt_bg.top + 2))
-            
-            # Show position for debugging
-            pos_font = pygame.font.Font(None, 16)
-            pos_text = pos_font.render(f"({self.rect.x},{self.rect.y})", True, (255, 255, 255))
-            screen.blit(pos_text, (render_rect.left, render_rect.bottom + 30))
+        # Don't auto-position here - let the level creation handle it
     
-    def can_interact_with(self, player):
-            # ENHANCED interaction indicator - much more visible
-            indicator_y = render_rect.top - 25
-            # Large white background
-            pygame.draw.circle(screen, (255, 255, 255), (render_rect.centerx, indicator_y), 15)
-            # Green inner circle
-            pygame.draw.circle(screen, (0, 255, 0), (render_rect.centerx, indicator_y), 12)
-            # Black border
-            pygame.draw.circle(screen, (0, 0, 0), (render_rect.centerx, indicator_y), 15, 3)
-            
-            # Large "E" for interact
-            font = pygame.font.Font(None, 24)
-            e_text = font.render("E", True, (0, 0, 0))
-            e_rect = e_text.get_rect(center=(render_rect.centerx, indicator_y))
-            screen.blit(e_text, e_rect)
-            
-            # NPC name label - always visible
-            name_font = pygame.font.Font(None, 20)
-            npc_name = self.npc_type.replace('_', ' ').title()
-            name_text = name_font.render(npc_name, True, (255, 255, 255))
-            name_rect = name_text.get_rect(center=(render_rect.centerx, indicator_y - 30))
-            
-            # Background for name text
-            name_bg = pygame.Rect(name_rect.left - 4, name_rect.top - 2, name_rect.width + 8, name_rect.height + 4)
-            pygame.draw.rect(screen, (0, 0, 0), name_bg)
-            pygame.draw.rect(screen, (255, 255, 255), name_bg, 2)
-            screen.blit(name_text, name_rect)
-            
-            # Debug: Show NPC position
-            debug_font = pygame.font.Font(None, 16)
-            pos_text = debug_font.render(f"({self.rect.x}, {self.rect.y})", True, (255, 255, 0))
-            screen.blit(pos_text, (render_rect.left, render_rect.bottom + 5))
+    @classmethod
+    def spawn_many(cls, world, x, y, npc_types, dialogue_ids):
+        """Create a batch of NPCs from aligned position, type and dialogue arrays"""
+        entities = world.create_many(len(x),
+                                     body={'x': x, 'y': y, 'width': 32, 'height': 48},
+                                     interaction={'npc_type': npc_types, 'dialogue_id': dialogue_ids,
+                                                  'facing_right': True})
+        return cls.wrap_many(world, entities)
 
 class ExitZone:
     def __init__(self, x, y, width, height, destination):
@@ -977,371 +578,254 @@ class LevelManager:
     def __init__(self):
         self.current_location = Location.PALACE
         self.platforms = []
+        self.world = World()  # Items, NPCs and enemy objects live here as component rows
         self.items = []
         self.npcs = []
+        self.npc_index = AxisIndex()  # NPCs sorted by center x for interaction range queries
+        self.nearby_npcs = []  # NPCs showing their prompt since the last interaction check
         self.enemies = []
-        self.simple_enemies = []  # Simple enemy blocks
-        self.stones = []  # Active stone projectiles
+        self.simple_enemies = EnemyStore()  # Simple enemy blocks (columnar, dict-style views)
+        self.projectiles = ProjectilePool()  # Stones and staff bolts in flight
         self.exit_zones = []
+        self.triggers = TriggerIndex()  # Item pickups and exits, registered once per level
         self.background = None
+        
+        # Pre-scaled background cache, rebuilt on level load or resolution change
+        self.background_cache = None
+        self.background_cache_key = None
+        
+        # Platforms and ground baked into chunk surfaces once per level
+        self.static_geometry = StaticGeometryLayer()
+        self.game_platforms = []  # Multi-level platform dicts shared by every level
+        self.fixed_ground_width = None
+        
+        # Uniform grid over every solid platform, rebuilt once per level
+        self.collision_grid = SpatialHashGrid(GRID_CELL_SIZE)
+        self.compiled_level = None  # Memory-mapped arrays the current level was built from
+        
+        # "auto" streams levels longer than STREAM_MIN_WIDTH; "on" / "off" force it
+        self.streaming_mode = "auto"
+        self.streamer = None
     
-    def load_level(self, location, sprites):
-        """Load a specific level"""
+    def load_level(self, location, sprites, finish=True):
+        """Load a specific level
+        
+        finish=False leaves the background and platform surfaces unconverted
+        and the background sprite only decoded, so the load can run off the
+        main thread; finish_loading() must then be called on the main thread.
+        """
         self.current_location = location
         self.sprites = sprites  # Store sprites for enemy rendering
         
         # Clear existing level data
         self.platforms.clear()
+        self.world.clear()
         self.items.clear()
         self.npcs.clear()
+        self.npc_index.clear()
+        self.nearby_npcs = []
         self.enemies.clear()
         self.simple_enemies.clear()  # Clear simple enemies too
-        self.stones.clear()  # Clear stones too
+        self.projectiles.clear()  # Clear projectiles too
         self.exit_zones.clear()
+        self.triggers.clear()
+        
+        # Create level from its compiled (memory-mapped) data file
+        self.compiled_level = load_compiled_level(location)
+        self.streamer = None
+        self.static_geometry.streaming = self.uses_streaming(self.compiled_level)
+        if self.static_geometry.streaming:
+            # Long level: only platforms and exits now, entities as their chunks come into view
+            self.build_level_geometry(self.compiled_level)
+            self.streamer = LevelStreamer()
+            self.streamer.start(self, self.compiled_level)
+        else:
+            self.build_level(self.compiled_level)
+        
+        self.static_geometry.build(self.platforms, self.game_platforms, self.fixed_ground_width, convert=False)
+        self.build_collision_grid()
+        self.build_npc_index()
+        self.build_triggers()
+        self.stream(0)
         
-        # Load background
         if sprites and 'backgrounds' in sprites:
-            self.background = sprites['backgrounds'].get(location)
-        
-        # Create level based on location
-        if location == Location.PALACE or location == "palace" or str(location) == "Location.PALACE":
-            self.create_palace_level(sprites)
-        elif location == Location.EGYPT_CITY or location == "egypt_city":
-            self.create_egypt_city_level(sprites)
-        elif location == Location.DESERT:
-            self.create_desert_level(sprites)
-        elif location == Location.RED_SEA:
-            self.create_red_sea_level(sprites)
-        elif location == Location.WILDERNESS:
-            self.create_wilderness_level(sprites)
-        elif location == Location.MOUNT_SINAI:
-            self.create_mount_sinai_level(sprites)
-        elif location == Location.JERUSALEM:
-            self.create_jerusalem_level(sprites)
+            backgrounds = sprites['backgrounds']
+            decoded = getattr(backgrounds, 'decoded', None)
+            self.background = backgrounds.get(location) if finish or decoded is None else decoded(location)
+        
+        # Scale the background (or draw the fallback pattern) once for this level
+        self.build_background_cache((SCREEN_WIDTH, SCREEN_HEIGHT), convert=False)
+        
+        if finish:
+            self.finish_loading()
     
-    def create_palace_level(self, sprites):
-        """Create the palace level with NPCs positioned at Moses' EXACT Y level"""
-        # Extended ground platform
-        ground_y = SCREEN_HEIGHT - 50  # 718
-        self.platforms.append(Platform(0, ground_y, SCREEN_WIDTH * 8, 50))  # Extended for more NPCs
-        
-        # Elevated platforms for jumping puzzles - positioned to not interfere with ground movement
-        self.platforms.append(Platform(300, SCREEN_HEIGHT - 150, 150, 20))   # After first NPC
-        self.platforms.append(Platform(600, SCREEN_HEIGHT - 250, 150, 20))   # Between NPCs
-        self.platforms.append(Platform(900, SCREEN_HEIGHT - 180, 150, 20))   # After second NPC
-        self.platforms.append(Platform(1300, SCREEN_HEIGHT - 220, 150, 20))  # Mid-level
-        self.platforms.append(Platform(1700, SCREEN_HEIGHT - 160, 150, 20))  # After priest
-        self.platforms.append(Platform(2100, SCREEN_HEIGHT - 200, 150, 20))  # Between NPCs
-        self.platforms.append(Platform(2500, SCREEN_HEIGHT - 140, 150, 20))  # After checkpoint
-        self.platforms.append(Platform(2900, SCREEN_HEIGHT - 190, 150, 20))  # Near end
-        self.platforms.append(Platform(3300, SCREEN_HEIGHT - 170, 150, 20))  # Final platform
-        
-        # Items positioned strategically near NPCs
-        self.items.append(ItemPickup(250, SCREEN_HEIGHT - 180, "stone", sprites))
-        self.items.append(ItemPickup(550, SCREEN_HEIGHT - 280, "water", sprites))
-        self.items.append(ItemPickup(850, SCREEN_HEIGHT - 210, "bread", sprites))
-        self.items.append(ItemPickup(1250, SCREEN_HEIGHT - 250, "scroll", sprites))
-        self.items.append(ItemPickup(1650, SCREEN_HEIGHT - 190, "meat", sprites))
-        self.items.append(ItemPickup(2050, SCREEN_HEIGHT - 230, "armor_of_god", sprites))
-        self.items.append(ItemPickup(2450, SCREEN_HEIGHT - 170, "staff", sprites))
-        self.items.append(ItemPickup(2850, SCREEN_HEIGHT - 220, "bread", sprites))
-        self.items.append(ItemPickup(3250, SCREEN_HEIGHT - 200, "water", sprites))
-        
-        # CRITICAL FIX: Moses Y position calculation
-        # Moses rect: x=150, y=670, bottom=718
-        # So NPCs should be at y=670 to match Moses exactly
-        moses_ground_y = 670  # Exact Y position where Moses stands
-        
-        # STRATEGIC NPC PLACEMENT - All at Moses' exact Y level for visibility
-        
-        # NPC 1: Palace Guard at x=400 (early encounter) - CLOSE TO STARTING POSITION
-        npc1 = NPC(400, moses_ground_y, "palace_guard", "guard_dialogue", sprites)
-        self.npcs.append(npc1)
-        
-        # NPC 2: Hebrew Slave at x=800 (after first platform)
-        npc2 = NPC(800, moses_ground_y, "hebrew_slave", "slave_dialogue", sprites)
-        self.npcs.append(npc2)
-        
-        # NPC 3: Egyptian Citizen at x=1200 (mid-level)
-        npc3 = NPC(1200, moses_ground_y, "egyptian_citizen", "citizen_dialogue", sprites)
-        self.npcs.append(npc3)
-        
-        # NPC 4: Priest at x=1600 (spiritual encounter)
-        npc4 = NPC(1600, moses_ground_y, "priest", "priest_dialogue", sprites)
-        self.npcs.append(npc4)
-        
-        # NPC 5: Another Hebrew Slave at x=2000 (resistance member)
-        npc5 = NPC(2000, moses_ground_y, "hebrew_slave", "resistance_dialogue", sprites)
-        self.npcs.append(npc5)
-        
-        # NPC 6: Palace Guard at x=2400 (checkpoint)
-        npc6 = NPC(2400, moses_ground_y, "palace_guard", "checkpoint_dialogue", sprites)
-        self.npcs.append(npc6)
-        
-        # NPC 7: Egyptian Citizen at x=2800 (informant)
-        npc7 = NPC(2800, moses_ground_y, "egyptian_citizen", "informant_dialogue", sprites)
-        self.npcs.append(npc7)
-        
-        # NPC 8: Final Priest at x=3200 (wisdom giver)
-        npc8 = NPC(3200, moses_ground_y, "priest", "wisdom_dialogue", sprites)
-        self.npcs.append(npc8)
-        
-        # ADD EXTRA CLOSE NPCs for immediate testing
-        # NPC 9: Very close Palace Guard at x=300 (right after Moses starts)
-        npc9 = NPC(300, moses_ground_y, "palace_guard", "guard_dialogue", sprites)
-        self.npcs.append(npc9)
-        
-        # NPC 10: Hebrew Slave at x=500 (easy to reach)
-        npc10 = NPC(500, moses_ground_y, "hebrew_slave", "slave_dialogue", sprites)
-        self.npcs.append(npc10)
-        
-        # Enemies positioned between NPCs for challenge
-        # Note: Using fallback enemy creation since Enemy class has import issues
-        # These will be simple moving blocks until Enemy class is fixed
-        print("⚠️ Creating simple enemy blocks (Enemy class needs fixing)")
-        
-        # Create simple enemy rectangles as moving obstacles
-        for i, x_pos in enumerate([600, 1000, 1400, 1800, 2200, 2600, 3000]):
-            enemy_rect = pygame.Rect(x_pos, moses_ground_y, 32, 32)
-            # Store as simple dict for now
-            simple_enemy = {
-                'rect': enemy_rect,
-                'type': 'egyptian_soldier',
-                'health': 30,
-                'current_health': 30,  # Track current health
-                'defeated': False,
-                'direction': 1 if i % 2 == 0 else -1,
-                'start_x': x_pos,
-                'speed': 1
-            }
-            self.simple_enemies.append(simple_enemy)
-        
-        # Exit to Egypt City at the far end
-        self.exit_zones.append(ExitZone(SCREEN_WIDTH * 7.5, ground_y - 100, 100, 100, Location.EGYPT_CITY))
+    def finish_loading(self):
+        """Convert the background cache and baked platforms to the display format (main thread only)"""
+        if pygame.display.get_surface():
+            self.background_cache = self.background_cache.convert()
+        self.static_geometry.convert_chunks()
     
-    def create_egypt_city_level(self, sprites):
-        """Create Egypt city level with NPCs at Moses' level"""
-        ground_y = SCREEN_HEIGHT - 50
-        self.platforms.append(Platform(0, ground_y, SCREEN_WIDTH * 4, 50))
-        
-        # Building platforms - create a city-like environment
-        building_heights = [120, 180, 140, 200, 160, 220, 180]
-        for i, height in enumerate(building_heights):
-            x = 200 + i * 250
-            y = ground_y - height
-            self.platforms.append(Platform(x, y, 180, 20))
-            
-            # Add items on some buildings
-            if i % 2 == 0:
-                item_types = ["meat", "stone", "scroll", "water"]
-                item_type = item_types[i // 2 % len(item_types)]
-                self.items.append(ItemPickup(x + 90, y - 30, item_type, sprites))
-        
-        # NPCs positioned at the same level as Moses
-        npc_y = SCREEN_HEIGHT - 100  # Same as Moses' level
-        
-        # Egyptian City NPCs with authentic roles
-        self.npcs.append(NPC(300, npc_y, "merchant", "merchant_dialogue", sprites))
-        self.npcs.append(NPC(600, npc_y, "scribe", "scribe_dialogue", sprites))
-        self.npcs.append(NPC(900, npc_y, "noble", "noble_dialogue", sprites))
-        self.npcs.append(NPC(1200, npc_y, "overseer", "overseer_dialogue", sprites))
-        self.npcs.append(NPC(1500, npc_y, "hebrew_slave", "city_slave_dialogue", sprites))
-        self.npcs.append(NPC(1800, npc_y, "egyptian_citizen", "citizen_dialogue", sprites))
-        
-        # More challenging enemies at Moses' level
-        enemy_y = SCREEN_HEIGHT - 100
-        print("⚠️ Creating simple enemy blocks for Egypt City")
-        
-        for i, x_pos in enumerate([500, 1000, 1600]):
-            enemy_rect = pygame.Rect(x_pos, enemy_y, 32, 32)
-            simple_enemy = {
-                'rect': enemy_rect,
-                'type': 'egyptian_soldier',
-                'health': 30,
-                'current_health': 30,
-                'defeated': False,
-                'direction': 1 if i % 2 == 0 else -1,
-                'start_x': x_pos,
-                'speed': 1
-            }
-            self.simple_enemies.append(simple_enemy)
-        
-        # Exit to Desert
-        self.exit_zones.append(ExitZone(SCREEN_WIDTH * 3.5, ground_y - 150, 100, 100, Location.DESERT))
+    def build_level(self, level):
+        """Create platforms, items, NPCs, simple enemies and exits from a compiled level"""
+        self.build_level_geometry(level)
+        self.spawn_items(level, np.arange(len(level.items)))
+        self.spawn_npcs(level, np.arange(len(level.npcs)))
+        self.spawn_enemies(level, np.arange(len(level.enemies)))
     
-    def create_desert_level(self, sprites):
-        """Create the desert level with NPCs at Moses' level"""
-        # Sandy terrain with dunes
-        ground_y = SCREEN_HEIGHT - 30
-        self.platforms.append(Platform(0, ground_y, SCREEN_WIDTH * 5, 30))
-        
-        # Sand dunes as platforms
-        dune_positions = [(300, SCREEN_HEIGHT - 80), (800, SCREEN_HEIGHT - 120), 
-                         (1400, SCREEN_HEIGHT - 90), (2000, SCREEN_HEIGHT - 110)]
-        
-        for x, y in dune_positions:
-            self.platforms.append(Platform(x, y, 200, 50))
-        
-        # Desert items
-        self.items.append(ItemPickup(350, SCREEN_HEIGHT - 110, "water", sprites))
-        self.items.append(ItemPickup(850, SCREEN_HEIGHT - 150, "meat", sprites))
-        self.items.append(ItemPickup(1450, SCREEN_HEIGHT - 120, "staff", sprites))
-        self.items.append(ItemPickup(2050, SCREEN_HEIGHT - 140, "bread", sprites))
-        
-        # Desert NPCs positioned at Moses' level (adjusted for desert ground)
-        npc_y = SCREEN_HEIGHT - 78  # Adjusted for desert ground level
-        
-        self.npcs.append(NPC(500, npc_y, "bedouin", "bedouin_dialogue", sprites))
-        self.npcs.append(NPC(1000, npc_y, "nomad", "nomad_dialogue", sprites))
-        self.npcs.append(NPC(1600, npc_y, "desert_guide", "guide_dialogue", sprites))
-        self.npcs.append(NPC(2200, npc_y, "hebrew_slave", "desert_encounter", sprites))
-        
-        # Wild animals and remaining soldiers at the same level
-        enemy_y = SCREEN_HEIGHT - 78
-        print("⚠️ Creating simple enemy blocks for Desert")
-        
-        for i, (x_pos, enemy_type) in enumerate([(600, 'wild_animal'), (1200, 'wild_animal'), (1800, 'egyptian_soldier')]):
-            enemy_rect = pygame.Rect(x_pos, enemy_y, 32, 32)
-            simple_enemy = {
-                'rect': enemy_rect,
-                'type': enemy_type,
-                'health': 20 if enemy_type == 'wild_animal' else 30,
-                'current_health': 20 if enemy_type == 'wild_animal' else 30,
-                'defeated': False,
-                'direction': 1 if i % 2 == 0 else -1,
-                'start_x': x_pos,
-                'speed': 2 if enemy_type == 'wild_animal' else 1
-            }
-            self.simple_enemies.append(simple_enemy)
-        
-        # Exit to Red Sea
-        self.exit_zones.append(ExitZone(SCREEN_WIDTH * 4.5, ground_y - 50, 100, 100, Location.RED_SEA))
+    def build_level_geometry(self, level):
+        """Create the platforms and exits of a compiled level (kept whole when streaming)"""
+        self.platforms.extend(Platform(x, y, width, height, platform_type) for (x, y, width, height), platform_type
+                              in zip(level.platforms.tolist(), level.string_column(level.platform_types)))
+        for (x, y, width, height), destination in zip(level.exits.tolist(),
+                                                     level.string_column(level.exit_destinations)):
+            self.exit_zones.append(ExitZone(x, y, width, height, Location(destination)))
     
-    def create_red_sea_level(self, sprites):
-        """Create the Red Sea level"""
-        # Water level with special mechanics
-        self.platforms.append(Platform(0, SCREEN_HEIGHT - 50, 300, 50))  # Shore
-        self.platforms.append(Platform(SCREEN_WIDTH - 300, SCREEN_HEIGHT - 50, 300, 50))  # Other shore
-        
-        # Parted sea path (special platform)
-        self.platforms.append(Platform(300, SCREEN_HEIGHT - 30, SCREEN_WIDTH - 600, 30))
-        
-        # Items
-        self.items.append(ItemPickup(150, SCREEN_HEIGHT - 100, "armor_of_god", sprites))
-        self.items.append(ItemPickup(SCREEN_WIDTH - 150, SCREEN_HEIGHT - 100, "scroll", sprites))
-        
-        # Divine encounter
-        self.npcs.append(NPC(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 80, "priest", "divine_encounter", sprites))
-        
-        # Exit to Wilderness
-        self.exit_zones.append(ExitZone(SCREEN_WIDTH - 200, SCREEN_HEIGHT - 150, 100, 100, Location.WILDERNESS))
+    def spawn_items(self, level, spawns):
+        """Create the items at the given rows of a compiled level's item table"""
+        items = ItemPickup.spawn_many(self.world, level.items[spawns, 0], level.items[spawns, 1],
+                                      level.string_column(level.item_types[spawns]))
+        self.items.extend(items)
+        return items
     
-    def create_wilderness_level(self, sprites):
-        """Create the wilderness level"""
-        # Rocky terrain
-        self.platforms.append(Platform(0, SCREEN_HEIGHT - 50, SCREEN_WIDTH * 6, 50))
-        
-        # Rocky outcrops
-        rock_positions = [(200, SCREEN_HEIGHT - 100), (600, SCREEN_HEIGHT - 150), 
-                         (1200, SCREEN_HEIGHT - 120), (1800, SCREEN_HEIGHT - 180)]
-        
-        for x, y in rock_positions:
-            self.platforms.append(Platform(x, y, 150, 50))
-        
-        # Wilderness items
-        self.items.append(ItemPickup(250, SCREEN_HEIGHT - 130, "water", sprites))
-        self.items.append(ItemPickup(650, SCREEN_HEIGHT - 180, "bread", sprites))
-        self.items.append(ItemPickup(1250, SCREEN_HEIGHT - 150, "meat", sprites))
-        
-        # Wilderness encounters
-        self.npcs.append(NPC(800, SCREEN_HEIGHT - 100, "hebrew_slave", "wilderness_dialogue", sprites))
-        
-        # More challenging enemies
-        # Wild animals scattered throughout
-        print("⚠️ Creating simple enemy blocks for Red Sea")
-        for i in range(4):
-            x = 400 + i * 400
-            enemy_rect = pygame.Rect(x, SCREEN_HEIGHT - 100, 32, 32)
-            simple_enemy = {
-                'rect': enemy_rect,
-                'type': 'wild_animal',
-                'health': 20,
-                'current_health': 20,
-                'defeated': False,
-                'direction': 1 if i % 2 == 0 else -1,
-                'start_x': x,
-                'speed': 2
-            }
-            self.simple_enemies.append(simple_enemy)
-        
-        # Exit to Mount Sinai
-        self.exit_zones.append(ExitZone(SCREEN_WIDTH * 5.5, SCREEN_HEIGHT - 150, 100, 100, Location.MOUNT_SINAI))
+    def spawn_npcs(self, level, spawns):
+        """Create the NPCs at the given rows of a compiled level's NPC table"""
+        npcs = NPC.spawn_many(self.world, level.npcs[spawns, 0], level.npcs[spawns, 1],
+                              level.string_column(level.npc_types[spawns]),
+                              level.string_column(level.npc_dialogues[spawns]))
+        self.npcs.extend(npcs)
+        return npcs
     
-    def create_mount_sinai_level(self, sprites):
-        """Create Mount Sinai level"""
-        # Mountain terrain
-        self.platforms.append(Platform(0, SCREEN_HEIGHT - 50, SCREEN_WIDTH * 2, 50))
-        
-        # Mountain steps
-        for i in range(8):
-            x = 200 + i * 150
-            y = SCREEN_HEIGHT - 100 - i * 40
-            self.platforms.append(Platform(x, y, 120, 20))
-        
-        # Sacred items
-        self.items.append(ItemPickup(SCREEN_WIDTH - 200, SCREEN_HEIGHT - 400, "scroll", sprites))
-        self.items.append(ItemPickup(SCREEN_WIDTH - 150, SCREEN_HEIGHT - 400, "armor_of_god", sprites))
-        
-        # Divine encounter at the top
-        self.npcs.append(NPC(SCREEN_WIDTH - 100, SCREEN_HEIGHT - 420, "priest", "sinai_encounter", sprites))
-        
-        # Exit to Jerusalem
-        self.exit_zones.append(ExitZone(SCREEN_WIDTH * 1.8, SCREEN_HEIGHT - 150, 100, 100, Location.JERUSALEM))
+    def spawn_enemies(self, level, spawns):
+        """Add the simple enemies at the given rows of a compiled level's enemy table"""
+        enemies = level.enemies[spawns]
+        self.simple_enemies.add_many(enemies[:, 0], enemies[:, 1], level.string_column(level.enemy_types[spawns]),
+                                     health=enemies[:, 6], direction=enemies[:, 4], speed=enemies[:, 5],
+                                     width=enemies[:, 2], height=enemies[:, 3], spawn_ids=spawns)
     
-    def create_jerusalem_level(self, sprites):
-        """Create Jerusalem level (final destination)"""
-        # Holy city platforms
-        self.platforms.append(Platform(0, SCREEN_HEIGHT - 50, SCREEN_WIDTH * 2, 50))
-        
-        # City structures
-        for i in range(6):
-            x = 100 + i * 200
-            y = SCREEN_HEIGHT - 120 - (i % 2) * 60
-            self.platforms.append(Platform(x, y, 150, 20))
-        
-        # Final rewards
-        self.items.append(ItemPickup(SCREEN_WIDTH - 200, SCREEN_HEIGHT - 200, "armor_of_god", sprites))
-        
-        # Final encounter
-        self.npcs.append(NPC(SCREEN_WIDTH - 100, SCREEN_HEIGHT - 100, "priest", "final_encounter", sprites))
+    def asset_keys(self):
+        """Get the (category, name) sprites the current level draws"""
+        level = self.compiled_level
+        if level is None:
+            return []
+        keys = []
+        for category, ids in (('items', level.item_types), ('npcs', level.npc_types), ('enemies', level.enemy_types)):
+            for name in {level.strings[i] for i in ids.tolist()}:
+                keys.append((category, name))
+                if category != 'items':
+                    keys.append((f'{category}_left', name))
+        return keys
+    
+    def uses_streaming(self, level):
+        """Decide whether a compiled level is streamed by chunks, per streaming_mode"""
+        if self.streaming_mode == "on":
+            return True
+        if self.streaming_mode != "auto" or len(level.platforms) == 0:
+            return False
+        return int((level.platforms[:, 0] + level.platforms[:, 2]).max()) >= STREAM_MIN_WIDTH
+    
+    def stream(self, camera_x):
+        """Activate and evict level chunks around the camera (no-op unless streaming)"""
+        if self.streamer:
+            self.streamer.update(camera_x)
+    
+    def set_game_platforms(self, game_platforms, fixed_ground_width=None):
+        """Attach the multi-level platforms and fixed ground, then re-bake geometry"""
+        self.game_platforms = game_platforms
+        self.fixed_ground_width = fixed_ground_width
+        self.build_static_geometry()
+        self.build_collision_grid()
+    
+    def build_static_geometry(self):
+        """Bake level platforms, multi-level platforms and ground into chunks"""
+        self.static_geometry.build(self.platforms, self.game_platforms, self.fixed_ground_width)
+    
+    def build_collision_grid(self):
+        """Index level platforms and multi-level platforms for collision queries"""
+        self.collision_grid.clear()
+        level = self.compiled_level
+        if level is not None and level.cell_size == self.collision_grid.cell_size:
+            # Level platforms come with their cells already worked out by the compiler
+            entries = [(pygame.Rect(platform.rect), platform) for platform in self.platforms]
+            self.collision_grid.load_cells(entries, level.grid_keys, level.grid_offsets, level.grid_entries)
+            shared_platforms = self.game_platforms
+        else:
+            shared_platforms = list(self.platforms) + list(self.game_platforms)
+        for platform in shared_platforms:
+            rect = self.static_geometry.platform_rect(platform)
+            if rect:
+                self.collision_grid.insert(rect, platform)
+    
+    def build_triggers(self):
+        """Register the level's item pickups and exit zones as trigger volumes"""
+        self.triggers.clear()
+        for item in self.items:
+            self.triggers.register('item', item.rect, item)
+        for exit_zone in self.exit_zones:
+            self.triggers.register('exit', exit_zone.rect, exit_zone)
+    
+    def build_npc_index(self):
+        """Sort the level's NPCs by center x"""
+        body = self.world.stores['body']
+        rows = [body.rows[npc.entity] for npc in self.npcs]
+        centers = body.x[rows].astype(int) + body.width[rows] // 2  # Same as rect.centerx
+        self.npc_index.build(centers.tolist(), self.npcs)
+    
+    def update_npc_prompts(self, player_rect):
+        """Flag NPCs within talking range of the player; return (nearby, newly_nearby)"""
+        candidates = self.npc_index.query(player_rect.centerx - INTERACTION_RANGE_X,
+                                          player_rect.centerx + INTERACTION_RANGE_X)
+        nearby, newly_nearby = interaction_system(self.world, player_rect, candidates, self.nearby_npcs)
+        self.nearby_npcs = nearby
+        return nearby, newly_nearby
+    
+    def query_platforms(self, rect):
+        """Get (rect, platform) pairs for the platforms near a rect"""
+        return self.collision_grid.query(rect)
     
     def update(self, dt):
         """Update level elements"""
-        for item in self.items:
-            item.update(dt)
+        bob_system(self.world, dt)
+        patrol_system(self.world, dt)
+    
+    def build_background_cache(self, screen_size, convert=True):
+        """Pre-scale the level background (or pre-draw the fallback strip) for tiling"""
+        screen_width, screen_height = screen_size
         
-        for npc in self.npcs:
-            npc.update(dt)
+        if self.background:
+            # Scale to fit screen height while maintaining aspect ratio
+            bg_width = self.background.get_width()
+            bg_height = self.background.get_height()
+            scale_factor = screen_height / bg_height
+            scaled_width = max(1, int(bg_width * scale_factor))
+            
+            cache = pygame.transform.scale(self.background, (scaled_width, screen_height))
+        else:
+            # Fallback: draw the repeating palace pattern once as a strip that is
+            # one tile wider than the screen on each side
+            tile_size = 64
+            cache = pygame.Surface((screen_width + tile_size * 2, screen_height))
+            for x in range(-tile_size, screen_width + tile_size, tile_size):
+                for y in range(0, screen_height, tile_size):
+                    strip_x = x + tile_size
+                    color = (200, 180, 140) if (x + y) % (tile_size * 2) == 0 else (180, 160, 120)
+                    pygame.draw.rect(cache, color, (strip_x, y, tile_size, tile_size))
+                    pygame.draw.rect(cache, (160, 140, 100), (strip_x, y, tile_size, tile_size), 2)
         
-        for enemy in self.enemies:
-            enemy.update(dt)
+        self.background_cache = cache.convert() if convert and pygame.display.get_surface() else cache
+        self.background_cache_key = (id(self.background), screen_size)
     
     def render_background(self, screen, camera_offset):
         """Render scrolling background like Mario Bros"""
+        screen_size = screen.get_size()
+        if self.background_cache_key != (id(self.background), screen_size):
+            self.build_background_cache(screen_size)
+        
         if self.background:
-            # Scale background to fit screen height
-            bg_width = self.background.get_width()
-            bg_height = self.background.get_height()
-            
-            # Scale to fit screen height while maintaining aspect ratio
-            scale_factor = SCREEN_HEIGHT / bg_height
-            scaled_width = int(bg_width * scale_factor)
-            scaled_height = SCREEN_HEIGHT
-            
-            scaled_bg = pygame.transform.scale(self.background, (scaled_width, scaled_height))
+            scaled_bg = self.background_cache
+            scaled_width = scaled_bg.get_width()
             
             # Calculate how many background tiles we need to cover the screen
-            tiles_needed = (SCREEN_WIDTH // scaled_width) + 2
+            tiles_needed = (screen_size[0] // scaled_width) + 2
             
             # Calculate the starting position for seamless scrolling
             start_x = -(camera_offset[0] % scaled_width)
@@ -1352,18 +836,30 @@ class LevelManager:
                 screen.blit(scaled_bg, (bg_x, 0))
                 
         else:
-            # Fallback: Create a repeating pattern background
+            # Fallback: one blit of the pre-drawn pattern strip
             tile_size = 64
-            for x in range(-tile_size, SCREEN_WIDTH + tile_size, tile_size):
-                for y in range(0, SCREEN_HEIGHT, tile_size):
-                    # Create a simple palace-like pattern
-                    adjusted_x = x - (camera_offset[0] % tile_size)
-                    color = (200, 180, 140) if (x + y) % (tile_size * 2) == 0 else (180, 160, 120)
-                    pygame.draw.rect(screen, color, (adjusted_x, y, tile_size, tile_size))
-                    pygame.draw.rect(screen, (160, 140, 100), (adjusted_x, y, tile_size, tile_size), 2)
+            screen.blit(self.background_cache, (-tile_size - (camera_offset[0] % tile_size), 0))
     
     def render(self, screen, camera_offset):
         """Render level elements with better visibility"""
+        if self.static_geometry.built:
+            # Pre-baked platforms and ground: a couple of chunk blits per frame
+            self.static_geometry.render_world(screen, camera_offset)
+            self.static_geometry.render_ground(screen, camera_offset)
+        else:
+            self.render_platforms(screen, camera_offset)
+        
+        # Render items, NPCs and enemy objects
+        render_system(self.world, screen, camera_offset, getattr(self, 'sprites', None))
+        
+        # Render simple enemies
+        self.render_simple_enemies(screen, camera_offset)
+        
+        # Render stones and staff bolts in one batch
+        self.projectiles.render(screen, camera_offset)
+    
+    def render_platforms(self, screen, camera_offset):
+        """Draw platforms directly (used before static geometry is baked)"""
         # Render platforms with consistent brown colors (supports both dict and object formats)
         for platform in self.platforms:
             # Handle dict format (new platform system)
@@ -1385,24 +881,6 @@ class LevelManager:
                 pygame.draw.rect(screen, (139, 69, 19), render_rect)    # Brown stone
                 pygame.draw.rect(screen, (101, 67, 33), render_rect, 3) # Dark brown border
                 pygame.draw.rect(screen, (160, 82, 45), (render_rect.x + 2, render_rect.y + 2, render_rect.width - 4, 4))  # Highlight
-        
-        # Render items
-        for item in self.items:
-            item.render(screen, camera_offset)
-        
-        # Render NPCs
-        for npc in self.npcs:
-            npc.render(screen, camera_offset)
-        
-        # Render enemies (original)
-        for enemy in self.enemies:
-            enemy.render(screen, camera_offset)
-        
-        # Render simple enemies
-        self.render_simple_enemies(screen, camera_offset)
-        
-        # Render stone projectiles
-        self.render_stones(screen, camera_offset)
     
     def get_platforms(self):
         return self.platforms
@@ -1418,95 +896,97 @@ class LevelManager:
     
     def get_simple_enemies(self):
         """Get active simple enemies"""
-        return [enemy for enemy in self.simple_enemies if not enemy['defeated']]
+        return [self.simple_enemies[i] for i in self.simple_enemies.active_indices()]
     
     def update_simple_enemies(self, dt):
-        """Update simple enemy blocks"""
-        for enemy in self.simple_enemies:
-            if enemy['defeated']:
-                continue
-                
-            # Simple AI: move back and forth
-            enemy['rect'].x += enemy['direction'] * enemy['speed']
-            
-            # Bounce off boundaries (100 pixels from start position)
-            if abs(enemy['rect'].x - enemy['start_x']) > 100:
-                enemy['direction'] *= -1
+        """Update simple enemy blocks: move back and forth 100 pixels around the start"""
+        self.simple_enemies.update_patrol(dt)
     
     def render_simple_enemies(self, screen, camera_offset):
         """Render simple enemy blocks with actual sprites"""
-        for enemy in self.simple_enemies:
-            if enemy['defeated']:
-                continue
-                
-            # Calculate screen position
-            screen_x = enemy['rect'].x - camera_offset[0]
-            screen_y = enemy['rect'].y - camera_offset[1]
+        store = self.simple_enemies
+        rows = store.active_indices()
+        if len(rows) == 0:
+            return
+        
+        # Calculate screen positions and only render enemies that are on screen
+        screen_xs = store.x[rows].astype(np.int32) - camera_offset[0]
+        screen_ys = store.y[rows].astype(np.int32) - camera_offset[1]
+        on_screen = (screen_xs > -50) & (screen_xs < SCREEN_WIDTH + 50)
+        
+        enemy_sprites = self.sprites.get('enemies') if getattr(self, 'sprites', None) else None
+        mirrored_sprites = self.sprites.get('enemies_left', {}) if enemy_sprites else {}
+        
+        for row, screen_x, screen_y in zip(rows[on_screen].tolist(), screen_xs[on_screen].tolist(),
+                                           screen_ys[on_screen].tolist()):
+            enemy_type = store.type_names[store.type_id[row]]
+            width = int(store.width[row])
             
-            # Only render if on screen
-            if -50 < screen_x < SCREEN_WIDTH + 50:
-                # Try to get actual sprite first
-                sprite = None
-                if hasattr(self, 'sprites') and self.sprites and 'enemies' in self.sprites:
-                    sprite = self.sprites['enemies'].get(enemy['type'])
+            # Try to get actual sprite first
+            sprite = enemy_sprites.get(enemy_type) if enemy_sprites else None
+            
+            if sprite:
+                # Use actual sprite
+                sprite_rect = pygame.Rect(screen_x, screen_y, width, int(store.height[row]))
                 
-                if sprite:
-                    # Use actual sprite
-                    sprite_rect = pygame.Rect(screen_x, screen_y, enemy['rect'].width, enemy['rect'].height)
-                    
-                    # Flip sprite based on direction for more dynamic look
-                    if enemy['direction'] < 0:
-                        sprite = pygame.transform.flip(sprite, True, False)
-                    
-                    screen.blit(sprite, sprite_rect)
+                # Use the pre-mirrored sprite when walking left
+                if store.direction[row] < 0:
+                    mirrored = mirrored_sprites.get(enemy_type)
+                    sprite = mirrored or pygame.transform.flip(sprite, True, False)
+                
+                screen.blit(sprite, sprite_rect)
+                
+                # Add subtle health indicator (small red bar if damaged)
+                max_health = int(store.health[row])
+                if store.current_health[row] < max_health:
+                    health_percent = int(store.current_health[row]) / max_health
+                    bar_width = 30
+                    bar_height = 4
+                    bar_x = screen_x + (width - bar_width) // 2
+                    bar_y = screen_y - 8
                     
-                    # Add subtle health indicator (small red bar if damaged)
-                    if enemy.get('current_health', enemy['health']) < enemy['health']:
-                        health_percent = enemy.get('current_health', enemy['health']) / enemy['health']
-                        bar_width = 30
-                        bar_height = 4
-                        bar_x = screen_x + (enemy['rect'].width - bar_width) // 2
-                        bar_y = screen_y - 8
-                        
-                        # Background
-                        pygame.draw.rect(screen, (100, 0, 0), (bar_x, bar_y, bar_width, bar_height))
-                        # Health
-                        pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, int(bar_width * health_percent), bar_height))
+                    # Background
+                    pygame.draw.rect(screen, (100, 0, 0), (bar_x, bar_y, bar_width, bar_height))
+                    # Health
+                    pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, int(bar_width * health_percent), bar_height))
+            else:
+                # Fallback to colored rectangles if sprites not available
+                if enemy_type == 'wild_animal':
+                    color = (139, 69, 19)  # Brown for animals
                 else:
-                    # Fallback to colored rectangles if sprites not available
-                    if enemy['type'] == 'wild_animal':
-                        color = (139, 69, 19)  # Brown for animals
-                    else:
-                        color = (139, 0, 0)    # Dark red for soldiers
-                    
-                    # Draw enemy as colored rectangle
-                    pygame.draw.rect(screen, color, (screen_x, screen_y, 32, 32))
-                    # Add simple border
-                    pygame.draw.rect(screen, (0, 0, 0), (screen_x, screen_y, 32, 32), 2)
+                    color = (139, 0, 0)    # Dark red for soldiers
+                
+                # Draw enemy as colored rectangle
+                pygame.draw.rect(screen, color, (screen_x, screen_y, 32, 32))
+                # Add simple border
+                pygame.draw.rect(screen, (0, 0, 0), (screen_x, screen_y, 32, 32), 2)
     
     def check_simple_enemy_collisions(self, player):
         """Check collisions with simple enemies - solid collision + damage"""
-        for enemy in self.simple_enemies:
-            if enemy['defeated']:
-                continue
-                
-            if player.rect.colliderect(enemy['rect']):
-                # Handle solid collision physics first
-                self.handle_enemy_collision_physics(player, enemy)
-                
-                # Then handle damage
-                damage = 20 if enemy['type'] == 'wild_animal' else 15
-                game_over = player.take_damage(damage)
-                
-                print(f"💥 Player hit {enemy['type']} for {damage} damage!")
-                
-                if game_over:
-                    print("💀 Game Over! Moses has fallen!")
-                    return 'game_over'
-                
-                return 'damage_taken'
+        store = self.simple_enemies
+        rows = store.active_indices()
+        boxes = store.boxes(rows)
+        touching = rows[(boxes[:, 0] < player.rect.right) & (boxes[:, 2] > player.rect.left) &
+                        (boxes[:, 1] < player.rect.bottom) & (boxes[:, 3] > player.rect.top)]
         
-        return False
+        if len(touching) == 0:
+            return False
+        enemy = store[int(touching[0])]
+        
+        # Handle solid collision physics first
+        self.handle_enemy_collision_physics(player, enemy)
+        
+        # Then handle damage
+        damage = 20 if enemy['type'] == 'wild_animal' else 15
+        game_over = player.take_damage(damage)
+        
+        print(f"💥 Player hit {enemy['type']} for {damage} damage!")
+        
+        if game_over:
+            print("💀 Game Over! Moses has fallen!")
+            return 'game_over'
+        
+        return 'damage_taken'
     
     def handle_enemy_collision_physics(self, player, enemy):
         """Handle solid collision physics with enemies"""
@@ -1545,52 +1025,81 @@ class LevelManager:
     def remove_item(self, item):
         if item in self.items:
             self.items.remove(item)
+            self.triggers.unregister(item)
+            item.destroy()
     
-    def add_stone(self, stone):
-        """Add a stone projectile"""
-        self.stones.append(stone)
+    def remove_npc(self, npc):
+        if npc in self.npcs:
+            self.npcs.remove(npc)
+            self.npc_index.remove(npc.rect.centerx, npc)
+            if npc in self.nearby_npcs:
+                self.nearby_npcs.remove(npc)
+            npc.destroy()
     
-    def update_stones(self, dt):
-        """Update all stone projectiles"""
-        for stone in self.stones[:]:  # Copy list to avoid modification during iteration
-            stone.update(dt)
-            if not stone.active:
-                self.stones.remove(stone)
+    def update_projectiles(self, dt):
+        """Move all stones and staff bolts"""
+        self.projectiles.update(dt)
     
-    def check_stone_enemy_collisions(self):
-        """Check if stones hit enemies"""
-        hits = 0
-        for stone in self.stones[:]:
-            if not stone.active:
-                continue
-                
-            for enemy in self.simple_enemies:
-                if enemy['defeated']:
-                    continue
-                    
-                if stone.rect.colliderect(enemy['rect']):
-                    # Stone hits enemy - deal damage
-                    stone_damage = 15  # Each stone does 15 damage
-                    enemy['current_health'] -= stone_damage
-                    
-                    # Remove stone
-                    stone.active = False
-                    self.stones.remove(stone)
-                    hits += 1
-                    
-                    if enemy['current_health'] <= 0:
-                        # Enemy defeated
-                        enemy['defeated'] = True
-                        print(f"🎯 Stone defeated {enemy['type']}!")
-                    else:
-                        # Enemy damaged but still alive
-                        print(f"🎯 Stone hit {enemy['type']} for {stone_damage} damage! Health: {enemy['current_health']}/{enemy['health']}")
-                    
-                    break
-        
-        return hits
+    def check_projectile_enemy_collisions(self, extra_enemies=()):
+        """Resolve stone and staff bolt hits against every enemy collection in one broadphase pass"""
+        projectiles = self.projectiles
+        if not len(projectiles):
+            return 0
+        
+        # Simple enemies come straight from the store columns, enemy objects from their rects
+        store_rows = self.simple_enemies.active_indices()
+        objects = self.get_enemies() + [enemy for enemy in extra_enemies if getattr(enemy, 'health', 0) > 0]
+        if len(store_rows) == 0 and not objects:
+            return 0
+        
+        enemy_boxes = np.concatenate([self.simple_enemies.boxes(store_rows),
+                                      boxes_from_rects([self.get_enemy_rect(enemy) for enemy in objects])])
+        projectile_hits, enemy_hits = sweep_overlaps(projectiles.boxes(), enemy_boxes)
+        if len(projectile_hits) == 0:
+            return 0
+        
+        # A projectile is used up by the first enemy (in collection order) it touches
+        order = np.lexsort((enemy_hits, projectile_hits))
+        projectile_hits, enemy_hits = projectile_hits[order], enemy_hits[order]
+        first = np.unique(projectile_hits, return_index=True)[1]
+        projectile_hits, enemy_hits = projectile_hits[first], enemy_hits[first]
+        
+        damage = np.bincount(enemy_hits, weights=projectiles.damage[projectile_hits],
+                             minlength=len(enemy_boxes)).astype(np.int32)
+        hit_targets = np.flatnonzero(damage)
+        store_hits = hit_targets[hit_targets < len(store_rows)]
+        if len(store_hits):
+            self.damage_simple_enemies(store_rows[store_hits], damage[store_hits])
+        for index in hit_targets[hit_targets >= len(store_rows)]:
+            self.damage_enemy(objects[index - len(store_rows)], int(damage[index]))
+        
+        used = np.zeros(len(projectiles), dtype=bool)
+        used[projectile_hits] = True
+        projectiles.compact(used)
+        return len(projectile_hits)
+    
+    def get_enemy_rect(self, enemy):
+        """Get the world rect of an enemy object"""
+        if hasattr(enemy, 'rect'):
+            return enemy.rect
+        return pygame.Rect(enemy.x, enemy.y, getattr(enemy, 'width', 30), getattr(enemy, 'height', 30))
     
-    def render_stones(self, screen, camera_offset):
-        """Render all stone projectiles"""
-        for stone in self.stones:
-            stone.render(screen, camera_offset)
+    def damage_enemy(self, enemy, damage):
+        """Apply projectile damage to an enemy object"""
+        if hasattr(enemy, 'take_damage'):
+            enemy.take_damage(damage)
+        else:
+            enemy.health -= damage
+    
+    def damage_simple_enemies(self, rows, damage):
+        """Apply projectile damage to simple enemies by store row"""
+        store = self.simple_enemies
+        defeated = set(store.apply_damage(rows, damage).tolist())
+        for row, amount in zip(rows.tolist(), damage.tolist()):
+            enemy_type = store.type_names[store.type_id[row]]
+            if row in defeated:
+                # Enemy defeated
+                print(f"🎯 Projectile defeated {enemy_type}!")
+            else:
+                # Enemy damaged but still alive
+                print(f"🎯 Projectile hit {enemy_type} for {amount} damage! Health: {store.current_health[row]}/{store.health[row]}")
@@ -4,6 +4,7 @@ Game Systems for Moses Adventure - Clean Working Version
 
 import pygame
 from constants import *
+from font_manager import get_font_manager
 
 class DialogueNode:
     def __init__(self, speaker, text, choices=None, moral_impact=0):
@@ -163,6 +164,8 @@ class DialogueSystem:
         if not self.active or not self.current_node:
             return
         
+        fonts = get_font_manager()
+        
         # Get screen dimensions
         screen_width = screen.get_width()
         screen_height = screen.get_height()
@@ -183,7 +186,7 @@ class DialogueSystem:
         
         # Speaker name - VERY VISIBLE
         if self.current_node and self.current_node.speaker:
-            speaker_font = pygame.font.Font(None, 48)  # Large font
+            speaker_font = fonts.get_sized_font(48)  # Large font
             speaker_text = speaker_font.render(f"{self.current_node.speaker}:", True, (255, 215, 0))
             
             # Speaker background for contrast
@@ -195,7 +198,7 @@ class DialogueSystem:
         
         # Main dialogue text - GUARANTEED VISIBLE
         if self.displayed_text and len(self.displayed_text) > 0:
-            text_font = pygame.font.Font(None, 32)  # Large, readable font
+            text_font = fonts.get_sized_font(32)  # Large, readable font
             text_color = (255, 255, 255)  # Pure WHITE text
             
             # Word wrap the text properly
@@ -233,7 +236,7 @@ class DialogueSystem:
         
         # Status indicator - VISIBLE
         status_y = box_y + box_height - 40
-        status_font = pygame.font.Font(None, 28)
+        status_font = fonts.get_sized_font(28)
         
         if self.waiting_for_input:
             prompt_surface = status_font.render("Press SPACE to continue...", True, (255, 255, 0))
@@ -371,21 +374,16 @@ class Inventory:
             player = self.game_instance.player if self.game_instance else None
             if player and self.game_instance:
                 # Create stone projectile
-                stone_x = player.x + (30 if player.facing_right else -30)
-                stone_y = player.y + 10
+                stone_x = player.rect.x + (30 if player.facing_right else -30)
+                stone_y = player.rect.y + 10
                 direction = 1 if player.facing_right else -1
                 
-                # Add stone projectile to game
-                if hasattr(self.game_instance, 'projectiles'):
-                    stone_projectile = {
-                        'x': stone_x,
-                        'y': stone_y,
-                        'velocity_x': direction * 8,
-                        'velocity_y': -2,
-                        'type': 'stone',
-                        'damage': 25
-                    }
-                    self.game_instance.projectiles.append(stone_projectile)
+                # Add stone projectile to the level's projectile pool
+                level_manager = getattr(self.game_instance, 'level_manager', None)
+                if level_manager:
+                    # Hand-thrown: 8 px/frame forward, 2 px/frame lift, 0.5 px/frame^2 gravity at 60 FPS
+                    level_manager.projectiles.spawn_stone(stone_x, stone_y, direction,
+                                                          speed=480, lift=120, gravity=1800, damage=25)
                     print("🪨 Stone thrown!")
                     
                     if hasattr(self.game_instance, 'sound_manager'):
@@ -400,22 +398,16 @@ class Inventory:
             player = self.game_instance.player if self.game_instance else None
             if player and self.game_instance:
                 # Create staff projectile
-                staff_x = player.x + (30 if player.facing_right else -30)
-                staff_y = player.y + 10
+                staff_x = player.rect.x + (30 if player.facing_right else -30)
+                staff_y = player.rect.y + 10
                 direction = 1 if player.facing_right else -1
                 
-                # Add staff projectile to game
-                if hasattr(self.game_instance, 'projectiles'):
-                    staff_projectile = {
-                        'x': staff_x,
-                        'y': staff_y,
-                        'velocity_x': direction * 12,
-                        'velocity_y': 0,
-                        'type': 'staff',
-                        'damage': 40,
-                        'divine': True
-                    }
-                    self.game_instance.projectiles.append(staff_projectile)
+                # Add staff projectile to the level's projectile pool
+                level_manager = getattr(self.game_instance, 'level_manager', None)
+                if level_manager:
+                    # Divine bolt: 12 px/frame at 60 FPS
+                    level_manager.projectiles.spawn_staff_bolt(staff_x, staff_y, direction,
+                                                               speed=720, damage=40)
                     print("⚡ Divine projectile fired!")
                     
                     if hasattr(self.game_instance, 'sound_manager'):
@@ -482,13 +474,15 @@ class Inventory:
         pygame.draw.rect(screen, (40, 30, 20), panel_rect)
         pygame.draw.rect(screen, (218, 165, 32), panel_rect, 3)
         
+        fonts = get_font_manager()
+        
         # Title
-        font = pygame.font.Font(None, 36)
+        font = fonts.get_sized_font(36)
         title_text = font.render("Biblical Inventory", True, (255, 255, 255))
         screen.blit(title_text, (panel_rect.left + 20, panel_rect.top + 20))
         
         # Instructions
-        instruction_font = pygame.font.Font(None, 24)
+        instruction_font = fonts.get_sized_font(24)
         instructions = [
             "Press number keys (1-7) to use items:",
             "A - Throw stone | W - Staff projectile"
@@ -499,7 +493,7 @@ class Inventory:
         
         # Items with effects
         y_offset = 120
-        item_font = pygame.font.Font(None, 28)
+        item_font = fonts.get_sized_font(28)
         
         for i, (item_type, quantity) in enumerate(self.items.items(), 1):
             if quantity > 0:
@@ -573,7 +567,7 @@ class VisualFeedback:
                 self.messages.remove(msg)
     
     def render(self, screen):
-        font = pygame.font.Font(None, 24)
+        font = get_font_manager().get_sized_font(24)
         y_offset = 50
         for msg in self.messages:
             text_surface = font.render(msg["text"], True, (255, 255, 255))
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Compiled Level Cache for Moses Adventure Game
+Compiles each level file into one binary blob of packed arrays plus a prebuilt platform grid,
+cached on disk, memory-mapped at load and recompiled when the level file's content changes
+"""
+
+import hashlib
+import json
+import os
+import struct
+
+import numpy as np
+
+from level_loader import LEVELS_DIR, LOCATION_NAMES, read_level_file
+
+CACHE_DIR = os.path.join(LEVELS_DIR, ".cache")
+CACHE_MAGIC = b"MOSLVL01"
+COMPILER_VERSION = 1  # Bump when the blob layout changes so old blobs are rebuilt
+GRID_CELL_SIZE = 128  # Must match the LevelManager collision grid
+ALIGNMENT = 64
+
+_compiled_cache = {}  # Level name -> CompiledLevel (memory-mapped)
+
+
+class CompiledLevel:
+    """Read-only view of a compiled level blob
+
+    Arrays are views into the memory-mapped file; strings (item, NPC, enemy
+    and platform types, dialogue ids, destinations) are stored once in a table
+    and referenced by index.
+    """
+
+    def __init__(self, name, header, buffer):
+        self.name = name
+        self.source_hash = header['source_hash']
+        self.cell_size = header['cell_size']
+        self.strings = header['strings']
+        self.buffer = buffer  # Keeps the mapping alive
+        self.arrays = {}
+        for array_name, (dtype, shape, offset) in header['arrays'].items():
+            count = int(np.prod(shape))
+            self.arrays[array_name] = np.frombuffer(buffer, dtype=dtype, count=count,
+                                                    offset=offset).reshape(shape)
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__['arrays'][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def string_column(self, ids):
+        """Get an object array of the strings for an array of string ids"""
+        table = np.array(self.strings, dtype=object)
+        return table[ids] if len(ids) else np.empty(0, dtype=object)
+
+
+def source_path(name):
+    return os.path.join(LEVELS_DIR, f"{name}.json")
+
+
+def cache_path(name):
+    return os.path.join(CACHE_DIR, f"{name}.lvlc")
+
+
+def hash_source(name):
+    """Get the content hash a compiled blob must match to be reused"""
+    digest = hashlib.sha256()
+    with open(source_path(name), "rb") as level_file:
+        digest.update(level_file.read())
+    digest.update(f"v{COMPILER_VERSION}/cell{GRID_CELL_SIZE}".encode())
+    return digest.hexdigest()
+
+
+def build_grid_cells(platforms, cell_size):
+    """Bucket platform rects into grid cells: (cell keys, offsets, platform indices)
+
+    Cell i holds platform indices entries[offsets[i]:offsets[i + 1]], in
+    platform order, matching what SpatialHashGrid.insert would produce.
+    """
+    buckets = {}
+    for index, (x, y, width, height) in enumerate(platforms.tolist()):
+        for cell_x in range(x // cell_size, (x + width - 1) // cell_size + 1):
+            for cell_y in range(y // cell_size, (y + height - 1) // cell_size + 1):
+                buckets.setdefault((cell_x, cell_y), []).append(index)
+
+    keys = np.array(list(buckets), dtype=np.int32).reshape(-1, 2)
+    offsets = np.zeros(len(buckets) + 1, dtype=np.int32)
+    offsets[1:] = np.cumsum([len(indices) for indices in buckets.values()])
+    entries = np.array([i for indices in buckets.values() for i in indices], dtype=np.int32)
+    return keys, offsets, entries
+
+
+def compile_level(data, cell_size=GRID_CELL_SIZE):
+    """Turn validated level data into (arrays, strings) ready to write"""
+    strings = []
+    string_ids = {}
+
+    def intern(value):
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    def table(section, fields, dtype):
+        return np.array([[entry[field] for field in fields] for entry in data[section]],
+                        dtype=dtype).reshape(-1, len(fields))
+
+    def ids(section, field):
+        return np.array([intern(entry[field]) for entry in data[section]], dtype=np.int32)
+
+    arrays = {
+        'platforms': table('platforms', ('x', 'y', 'width', 'height'), np.int32),
+        'platform_types': ids('platforms', 'type'),
+        'items': table('items', ('x', 'y'), np.float64),
+        'item_types': ids('items', 'type'),
+        'npcs': table('npcs', ('x', 'y'), np.float64),
+        'npc_types': ids('npcs', 'type'),
+        'npc_dialogues': ids('npcs', 'dialogue'),
+        'enemies': table('enemies', ('x', 'y', 'width', 'height', 'direction', 'speed', 'health'), np.float64),
+        'enemy_types': ids('enemies', 'type'),
+        'exits': table('exits', ('x', 'y', 'width', 'height'), np.int32),
+        'exit_destinations': ids('exits', 'destination'),
+    }
+    arrays['grid_keys'], arrays['grid_offsets'], arrays['grid_entries'] = build_grid_cells(
+        arrays['platforms'], cell_size)
+    return arrays, strings
+
+
+def write_blob(path, source_hash, arrays, strings, cell_size=GRID_CELL_SIZE):
+    """Write compiled arrays as magic, header length, JSON header, then aligned array data"""
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        offset = -(-offset // ALIGNMENT) * ALIGNMENT
+        layout[name] = (array.dtype.str, list(array.shape), offset)
+        offset += array.nbytes
+
+    header = json.dumps({'source_hash': source_hash, 'cell_size': cell_size,
+                         'strings': strings, 'arrays': layout}).encode("utf-8")
+    data_start = -(-(len(CACHE_MAGIC) + 4 + len(header)) // ALIGNMENT) * ALIGNMENT
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as blob:
+        blob.write(CACHE_MAGIC)
+        blob.write(struct.pack("<I", len(header)))
+        blob.write(header)
+        for name, array in arrays.items():
+            blob.seek(data_start + layout[name][2])
+            blob.write(np.ascontiguousarray(array).tobytes())
+        blob.truncate(data_start + offset)
+    os.replace(temp_path, path)  # Readers never see a half-written blob
+
+
+def read_blob_header(path):
+    """Get (header dict, data start offset) of a blob, or (None, 0) if it is unreadable"""
+    try:
+        with open(path, "rb") as blob:
+            if blob.read(len(CACHE_MAGIC)) != CACHE_MAGIC:
+                return None, 0
+            (length,) = struct.unpack("<I", blob.read(4))
+            header = json.loads(blob.read(length).decode("utf-8"))
+    except (OSError, ValueError, struct.error):
+        return None, 0
+    return header, -(-(len(CACHE_MAGIC) + 4 + length) // ALIGNMENT) * ALIGNMENT
+
+
+def map_blob(name, path):
+    """Memory-map a blob file as a CompiledLevel"""
+    header, data_start = read_blob_header(path)
+    mapped = np.memmap(path, dtype=np.uint8, mode="r")
+    return CompiledLevel(name, header, mapped[data_start:])
+
+
+def compile_level_file(name):
+    """Validate levels/<name>.json and write its blob; return the blob path"""
+    data = read_level_file(name)
+    arrays, strings = compile_level(data)
+    path = cache_path(name)
+    write_blob(path, hash_source(name), arrays, strings)
+    print(f"⚙️ Compiled level {name}: {len(data['platforms'])} platforms, "
+          f"{len(data['items']) + len(data['npcs']) + len(data['enemies'])} spawns")
+    return path
+
+
+def load_compiled_level(name):
+    """Get the memory-mapped compiled level, recompiling it if the level file changed"""
+    name = getattr(name, 'value', name)
+    source_hash = hash_source(name)
+
+    compiled = _compiled_cache.get(name)
+    if compiled is not None and compiled.source_hash == source_hash:
+        return compiled
+
+    path = cache_path(name)
+    header, _ = read_blob_header(path)
+    if header is None or header.get('source_hash') != source_hash:
+        compile_level_file(name)
+
+    compiled = map_blob(name, path)
+    _compiled_cache[name] = compiled
+    return compiled
+
+
+def prepare_all_levels():
+    """Compile any missing or stale level blobs, so bad data fails at startup; return the count"""
+    for name in LOCATION_NAMES:
+        load_compiled_level(name)
+    return len(LOCATION_NAMES)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Level Loader for Moses Adventure Game
+Reads the JSON level files in levels/, checks them against a schema and caches the parsed data
+"""
+
+import json
+import os
+
+LEVELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "levels")
+WORLD_FILE = "world"  # Multi-level platforms shared by every location
+
+LOCATION_NAMES = ("palace", "egypt_city", "desert", "red_sea", "wilderness", "mount_sinai", "jerusalem")
+
+# section -> (required fields, optional fields with defaults); numbers are int or float
+LEVEL_SCHEMA = {
+    'platforms': ({'x': 'number', 'y': 'number', 'width': 'number', 'height': 'number'},
+                  {'type': ('string', "stone")}),
+    'items': ({'x': 'number', 'y': 'number', 'type': 'string'}, {}),
+    'npcs': ({'x': 'number', 'y': 'number', 'type': 'string', 'dialogue': 'string'}, {}),
+    'enemies': ({'x': 'number', 'y': 'number', 'type': 'string'},
+                {'direction': ('number', 1), 'speed': ('number', 1), 'health': ('number', 30),
+                 'width': ('number', 32), 'height': ('number', 32)}),
+    'exits': ({'x': 'number', 'y': 'number', 'width': 'number', 'height': 'number',
+               'destination': 'string'}, {}),
+}
+
+_level_cache = {}  # Level name -> validated level dict, parsed once per run
+
+
+class LevelFormatError(ValueError):
+    """A level file is missing, malformed or does not match the schema"""
+
+
+def _check_value(value, kind):
+    """Check a field value against a schema kind ('number' or 'string')"""
+    if kind == 'number':
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    return isinstance(value, str)
+
+
+def validate_entry(entry, section, index, source):
+    """Check one entry of a level section and fill in optional fields"""
+    where = f"{source}: {section}[{index}]"
+    if not isinstance(entry, dict):
+        raise LevelFormatError(f"{where} must be an object")
+
+    required, optional = LEVEL_SCHEMA[section]
+    unknown = set(entry) - set(required) - set(optional)
+    if unknown:
+        raise LevelFormatError(f"{where} has unknown fields: {', '.join(sorted(unknown))}")
+
+    for field, kind in required.items():
+        if field not in entry:
+            raise LevelFormatError(f"{where} is missing '{field}'")
+        if not _check_value(entry[field], kind):
+            raise LevelFormatError(f"{where}.{field} must be a {kind}, got {entry[field]!r}")
+
+    for field, (kind, default) in optional.items():
+        if field not in entry:
+            entry[field] = default
+        elif not _check_value(entry[field], kind):
+            raise LevelFormatError(f"{where}.{field} must be a {kind}, got {entry[field]!r}")
+
+    if section in ('platforms', 'exits', 'enemies') and (entry['width'] <= 0 or entry['height'] <= 0):
+        raise LevelFormatError(f"{where} must have a positive width and height")
+    if section == 'exits' and entry['destination'] not in LOCATION_NAMES:
+        raise LevelFormatError(f"{where}.destination '{entry['destination']}' is not a known location")
+    return entry
+
+
+def validate_level(data, source):
+    """Check a parsed level against LEVEL_SCHEMA; missing sections become empty lists"""
+    if not isinstance(data, dict):
+        raise LevelFormatError(f"{source}: level must be a JSON object")
+
+    unknown = set(data) - set(LEVEL_SCHEMA) - {'name', 'ground_width'}
+    if unknown:
+        raise LevelFormatError(f"{source}: unknown sections: {', '.join(sorted(unknown))}")
+
+    if 'ground_width' in data and not _check_value(data['ground_width'], 'number'):
+        raise LevelFormatError(f"{source}: 'ground_width' must be a number")
+
+    for section in LEVEL_SCHEMA:
+        entries = data.setdefault(section, [])
+        if not isinstance(entries, list):
+            raise LevelFormatError(f"{source}: '{section}' must be a list")
+        for index, entry in enumerate(entries):
+            validate_entry(entry, section, index, source)
+    return data
+
+
+def read_level_file(name):
+    """Parse and validate levels/<name>.json"""
+    path = os.path.join(LEVELS_DIR, f"{name}.json")
+    try:
+        with open(path, encoding="utf-8") as level_file:
+            data = json.load(level_file)
+    except FileNotFoundError:
+        raise LevelFormatError(f"{path}: level file not found") from None
+    except json.JSONDecodeError as e:
+        raise LevelFormatError(f"{path}: invalid JSON ({e})") from None
+    return validate_level(data, path)
+
+
+def load_level_data(name):
+    """Get the validated data for a level by name or Location, reading the file only once"""
+    name = getattr(name, 'value', name)
+    data = _level_cache.get(name)
+    if data is None:
+        data = read_level_file(name)
+        _level_cache[name] = data
+    return data
+
+
+def load_world_data():
+    """Get the multi-level platforms and ground width shared by every location"""
+    return load_level_data(WORLD_FILE)
+
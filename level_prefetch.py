@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Level Prefetch for Moses Adventure Game
+Loads the level behind an exit zone on a worker thread while Moses walks towards it
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+SCREEN_WIDTH = 1024
+PREFETCH_DISTANCE = SCREEN_WIDTH  # Start loading a destination when Moses is this close to its exit (pixels)
+
+
+class LevelPrefetcher:
+    """Builds fully loaded level managers for upcoming destinations in the background
+
+    load_level(destination) runs on a single worker thread and must return a
+    ready level manager that shares nothing mutable with the live one, so
+    entering the level is just swapping it in.
+    """
+
+    def __init__(self, load_level, distance=PREFETCH_DISTANCE):
+        self.load_level = load_level
+        self.distance = distance
+        self.executor = None  # Started on the first prefetch
+        self.pending = {}     # destination -> Future of a loaded level manager
+
+    def update(self, player_rect, exit_zones):
+        """Queue a load for every exit zone within range that is not already loading"""
+        for exit_zone in exit_zones:
+            destination = exit_zone.destination
+            if destination in self.pending:
+                continue
+            rect = exit_zone.rect
+            gap = max(rect.left - player_rect.right, player_rect.left - rect.right, 0)
+            if gap <= self.distance:
+                if self.executor is None:
+                    self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-prefetch")
+                self.pending[destination] = self.executor.submit(self.load_level, destination)
+                print(f"📥 Prefetching {getattr(destination, 'value', destination)}")
+
+    def take(self, destination):
+        """Get the prefetched level for a destination (waiting if it is still loading), or None
+
+        Every other pending load is dropped, since it belongs to a level Moses is leaving.
+        """
+        future = self.pending.pop(destination, None)
+        self.clear()
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"❌ Prefetch of {getattr(destination, 'value', destination)} failed: {e}")
+            return None
+
+    def clear(self):
+        """Forget every pending load"""
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Level Streaming for Moses Adventure Game
+Splits a compiled level into horizontal chunks and keeps only the ones around the camera alive
+"""
+
+import numpy as np
+
+SCREEN_WIDTH = 1024
+
+STREAM_CHUNK_WIDTH = SCREEN_WIDTH
+STREAM_RADIUS = 1                     # Chunks kept alive on each side of the visible ones
+STREAM_MIN_WIDTH = SCREEN_WIDTH * 12  # "auto" streaming mode kicks in for levels this long
+
+
+class LevelStreamer:
+    """Spawns and despawns a level's items, NPCs and simple enemies chunk by chunk
+
+    Spawns belong to the chunk containing their x position. Chunks in the
+    window around the camera are active: their entities exist in the level
+    manager's world, NPC index, trigger index and enemy store. Leaving the
+    window despawns them, remembering collected items, finished NPCs and each
+    enemy's position, direction and health so coming back restores them.
+    Baked platform surfaces outside the window are dropped too.
+    """
+
+    def __init__(self, chunk_width=STREAM_CHUNK_WIDTH, radius=STREAM_RADIUS):
+        self.chunk_width = chunk_width
+        self.radius = radius
+        self.level_manager = None
+        self.level = None
+        self.window = None  # (first, last) chunk indices currently active
+        self.active = {}    # chunk index -> ([(spawn, item)], [(spawn, npc)])
+
+    def start(self, level_manager, level):
+        """Index a compiled level's spawns by chunk; nothing is spawned until update()"""
+        self.level_manager = level_manager
+        self.level = level
+        self.window = None
+        self.active = {}
+
+        self.item_chunks = self.bucket(level.items[:, 0])
+        self.npc_chunks = self.bucket(level.npcs[:, 0])
+        self.enemy_chunks = self.bucket(level.enemies[:, 0])
+
+        self.collected_items = set()  # Item spawns picked up, never respawned
+        self.removed_npcs = set()     # NPC spawns removed after their dialogue
+
+        # Saved enemy state per spawn, written when a chunk is evicted
+        count = len(level.enemies)
+        self.enemy_saved = np.zeros(count, dtype=np.bool_)
+        self.enemy_x = np.zeros(count, dtype=np.float64)
+        self.enemy_direction = np.zeros(count, dtype=np.int8)
+        self.enemy_health = np.zeros(count, dtype=np.int32)
+        self.enemy_defeated = np.zeros(count, dtype=np.bool_)
+
+    def bucket(self, xs):
+        """Group spawn rows by chunk index: chunk -> array of rows"""
+        chunks = np.floor_divide(xs, self.chunk_width).astype(np.int64)
+        order = np.argsort(chunks, kind='stable')
+        indices, starts = np.unique(chunks[order], return_index=True)
+        return {int(index): rows for index, rows in zip(indices, np.split(order, starts[1:]))}
+
+    def update(self, camera_x, screen_width=SCREEN_WIDTH):
+        """Activate and evict chunks for the camera position; return True if the window moved"""
+        first = int(camera_x // self.chunk_width) - self.radius
+        last = int((camera_x + screen_width - 1) // self.chunk_width) + self.radius
+        if (first, last) == self.window:
+            return False
+        self.window = (first, last)
+
+        for index in [index for index in self.active if index < first or index > last]:
+            self.evict(index)
+        for index in range(first, last + 1):
+            if index not in self.active:
+                self.activate(index)
+
+        self.level_manager.static_geometry.evict_chunks(first, last)
+        return True
+
+    def activate(self, index):
+        """Spawn one chunk's entities and restore any state saved when it was evicted"""
+        manager, level = self.level_manager, self.level
+        empty = np.empty(0, dtype=np.intp)
+
+        item_spawns = [spawn for spawn in self.item_chunks.get(index, empty).tolist()
+                       if spawn not in self.collected_items]
+        items = manager.spawn_items(level, item_spawns)
+        for item in items:
+            manager.triggers.register('item', item.rect, item)
+
+        npc_spawns = [spawn for spawn in self.npc_chunks.get(index, empty).tolist()
+                      if spawn not in self.removed_npcs]
+        npcs = manager.spawn_npcs(level, npc_spawns)
+        for npc in npcs:
+            manager.npc_index.insert(npc.rect.centerx, npc)
+
+        enemy_spawns = self.enemy_chunks.get(index, empty)
+        store = manager.simple_enemies
+        start = store.count
+        manager.spawn_enemies(level, enemy_spawns)
+        saved = self.enemy_saved[enemy_spawns]
+        if saved.any():
+            rows = np.arange(start, store.count)[saved]
+            spawns = enemy_spawns[saved]
+            store.x[rows] = self.enemy_x[spawns]
+            store.direction[rows] = self.enemy_direction[spawns]
+            store.current_health[rows] = self.enemy_health[spawns]
+            store.defeated[rows] = self.enemy_defeated[spawns]
+
+        self.active[index] = (list(zip(item_spawns, items)), list(zip(npc_spawns, npcs)))
+
+    def evict(self, index):
+        """Despawn one chunk's entities, remembering what the player changed"""
+        manager = self.level_manager
+        items, npcs = self.active.pop(index)
+
+        for spawn, item in items:
+            if item.alive:
+                manager.remove_item(item)
+            else:
+                self.collected_items.add(spawn)
+        for spawn, npc in npcs:
+            if npc.alive:
+                manager.remove_npc(npc)
+            else:
+                self.removed_npcs.add(spawn)
+
+        enemy_spawns = self.enemy_chunks.get(index)
+        if enemy_spawns is not None:
+            store = manager.simple_enemies
+            spawn_ids = store.spawn_id[:store.count]
+            leaving = np.isin(spawn_ids, enemy_spawns)
+            spawns = spawn_ids[leaving]
+            self.enemy_saved[spawns] = True
+            self.enemy_x[spawns] = store.x[:store.count][leaving]
+            self.enemy_direction[spawns] = store.direction[:store.count][leaving]
+            self.enemy_health[spawns] = store.current_health[:store.count][leaving]
+            self.enemy_defeated[spawns] = store.defeated[:store.count][leaving]
+            store.remove_where(leaving)
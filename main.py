@@ -10,6 +10,7 @@ import pygame
 import sys
 import os
 import traceback
+from functools import partial
 
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -20,6 +21,12 @@ try:
     from game_systems import *
     from sound_manager import SoundManager  # Import the new sound manager
     from font_manager import initialize_font_manager, get_font_manager
+    from sprite_cache import SpriteVariantCache
+    from asset_manager import AssetManager
+    from asset_pack import open_default_pack
+    from surface_cache import SurfaceCache
+    from sprite_atlas import open_default_atlas
+    from simulation import Simulation, InputState, GameState, SIM_DT
 except ImportError as e:
     print(f"Import error: {e}")
     print("Make sure all game files are in the same directory")
@@ -33,6 +40,8 @@ pygame.mixer.init()
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
+MAX_SIM_STEPS = 5  # Catch-up cap per rendered frame; older backlog is dropped
+ASSET_MEMORY_BUDGET = 64 * 1024 * 1024  # Resident sprite bytes before unused ones are evicted
 GRAVITY = 0.8
 JUMP_STRENGTH = -15
 PLAYER_SPEED = 5
@@ -48,15 +57,6 @@ RED = (220, 20, 60)
 GRAY = (128, 128, 128)
 LIGHT_GRAY = (192, 192, 192)
 
-class GameState(Enum):
-    MENU = "menu"
-    PLAYING = "playing"
-    DIALOGUE = "dialogue"
-    INVENTORY = "inventory"
-    PAUSED = "paused"
-    GAME_OVER = "game_over"
-    VICTORY = "victory"
-
 class Location(Enum):
     PALACE = "palace"
     EGYPT_CITY = "egypt_city"
@@ -66,7 +66,22 @@ class Location(Enum):
     MOUNT_SINAI = "mount_sinai"
     JERUSALEM = "jerusalem"
 
+def simulation_attribute(name):
+    """Property that reads and writes an attribute of the game's Simulation"""
+    return property(lambda self: getattr(self.simulation, name),
+                    lambda self, value: setattr(self.simulation, name, value))
+
 class MosesAdventureGame:
+    # World state lives in the Simulation; the frontend code reaches it through these
+    state = simulation_attribute('state')
+    player = simulation_attribute('player')
+    camera = simulation_attribute('camera')
+    level_manager = simulation_attribute('level_manager')
+    inventory = simulation_attribute('inventory')
+    dialogue_system = simulation_attribute('dialogue_system')
+    enemies = simulation_attribute('enemies')
+    game_platforms = simulation_attribute('game_platforms')
+    
     def __init__(self):
         # Enhanced audio initialization
         pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=512)
@@ -76,6 +91,9 @@ class MosesAdventureGame:
         pygame.display.set_caption("Moses Adventure - Biblical Platformer")
         self.clock = pygame.time.Clock()
         self.running = True
+        
+        # Headless game world; this class only reads input, plays sound and draws it
+        self.simulation = Simulation()
         self.state = GameState.MENU
         self.stone_throw_mode = False  # Stone throwing mode
         self.healing_ready = False  # Healing ready mode
@@ -86,15 +104,7 @@ class MosesAdventureGame:
         self.font_manager = initialize_font_manager()
         
         # Game systems
-        self.player = None
-        self.camera = Camera()
-        self.level_manager = LevelManager()
-        self.inventory = Inventory()
         self.inventory.game_instance = self  # Connect for item effects
-        self.dialogue_system = DialogueSystem()
-
-        # Initialize enemies list
-        self.enemies = []
         self.dialogue_system.game_instance = self  # Connect for health effects
         self.sound_manager = SoundManager()
         self.moral_system = MoralSystem()
@@ -104,12 +114,22 @@ class MosesAdventureGame:
         # self.dialogue_system.moral_system = self.moral_system
         self.dialogue_system.set_sound_manager(self.sound_manager)
         
-        # Load sprites
+        # Sprites load lazily through the asset manager (mirrored variants included)
+        self.sprite_variants = SpriteVariantCache()
+        self.assets = AssetManager(ASSET_MEMORY_BUDGET)
+        self.assets.pack = open_default_pack()
+        self.assets.surface_cache = SurfaceCache()
+        self.assets.use_atlas(open_default_atlas())
         self.sprites = self.load_sprites()
+        self.assets.prune_surface_cache()
+        self.simulation.sprites = self.sprites
+        self.simulation.assets = self.assets
         
         # Game state
         self.paused = False
         self.show_fps = False
+        self.sim_accumulator = 0.0  # Unsimulated time carried between frames
+        self.render_alpha = 1.0  # Fraction of a tick between the last two sim states
         self.stone_throw_mode = False  # For stone throwing at enemies
         self.scripture_dialogue_active = False
         
@@ -158,174 +178,29 @@ class MosesAdventureGame:
         self.consumption_text_duration = 1.5  # Updated to 1.5 seconds
         
         print("✅ Item consumption text timer system initialized")
-        
-        # Projectile system for stones and staff
-        self.projectiles = []
-
-    def initialize_multi_level_world(self):
-        """Initialize the multi-level platform world"""
-        print("🏗️  Creating multi-level platform world...")
-        
-                # Create platform system with MUCH MORE HEIGHT SPACING from old platforms
-        # Old platforms are around y=608-670, new platforms positioned MUCH HIGHER for clear separation
-        # 400px horizontal spacing, 160px+ vertical spacing between levels
-        self.game_platforms = [
-            # Base level - MUCH HIGHER above old platforms (y=480-520) - 88-128px separation from old platforms
-            {'x': 400, 'y': 490, 'width': 120, 'height': 20},   # 400px spacing between platforms
-            {'x': 800, 'y': 500, 'width': 110, 'height': 20},   # 400px spacing - no overlap
-            {'x': 1200, 'y': 495, 'width': 120, 'height': 20},  # 400px spacing - clear separation
-            {'x': 1600, 'y': 505, 'width': 110, 'height': 20},  # 400px spacing - well spaced
-            {'x': 2000, 'y': 490, 'width': 120, 'height': 20},  # 400px spacing - good distance
-            {'x': 2400, 'y': 500, 'width': 110, 'height': 20},  # 400px spacing - final base platform
-            
-            # Level 1 - First elevated platforms (y=320-360) - 160px above base level
-            {'x': 300, 'y': 330, 'width': 100, 'height': 20},   # Offset start, 400px spacing
-            {'x': 700, 'y': 340, 'width': 95, 'height': 20},    # 400px spacing - good distance
-            {'x': 1100, 'y': 335, 'width': 100, 'height': 20},  # 400px spacing - clear separation
-            {'x': 1500, 'y': 345, 'width': 95, 'height': 20},   # 400px spacing - well spaced
-            {'x': 1900, 'y': 330, 'width': 100, 'height': 20},  # 400px spacing - good distance
-            {'x': 2300, 'y': 340, 'width': 95, 'height': 20},   # 400px spacing - final level 1
-            
-            # Level 2 - Second elevated platforms (y=160-200) - 160px above Level 1
-            {'x': 200, 'y': 170, 'width': 85, 'height': 20},    # Offset start, 400px spacing
-            {'x': 600, 'y': 180, 'width': 90, 'height': 20},    # 400px spacing - good distance
-            {'x': 1000, 'y': 175, 'width': 85, 'height': 20},   # 400px spacing - clear separation
-            {'x': 1400, 'y': 185, 'width': 90, 'height': 20},   # 400px spacing - well spaced
-            {'x': 1800, 'y': 170, 'width': 85, 'height': 20},   # 400px spacing - good distance
-            {'x': 2200, 'y': 180, 'width': 90, 'height': 20},   # 400px spacing - final level 2
-            
-            # Level 3 - Third elevated platforms (y=20-60) - 140px above Level 2
-            {'x': 500, 'y': 30, 'width': 75, 'height': 20},     # Centered start, 400px spacing
-            {'x': 900, 'y': 40, 'width': 80, 'height': 20},     # 400px spacing - good distance
-            {'x': 1300, 'y': 35, 'width': 75, 'height': 20},    # 400px spacing - clear separation
-            {'x': 1700, 'y': 45, 'width': 80, 'height': 20},    # 400px spacing - well spaced
-            {'x': 2100, 'y': 30, 'width': 75, 'height': 20},    # 400px spacing - final level 3
-        ]
-        
-        # Create strategic items on HIGHER SPACED platforms (positioned on platform centers)
-        self.game_items = [
-            # Base level items (y=480-520) - On much higher platforms
-            {'x': 460, 'y': 470, 'type': 'stone'},      # On platform at x=400
-            {'x': 860, 'y': 480, 'type': 'water'},      # On platform at x=800
-            {'x': 1260, 'y': 475, 'type': 'bread'},     # On platform at x=1200
-            {'x': 1660, 'y': 485, 'type': 'scroll'},    # On platform at x=1600
-            {'x': 2060, 'y': 470, 'type': 'meat'},      # On platform at x=2000
-            {'x': 2460, 'y': 480, 'type': 'armor_of_god'}, # On platform at x=2400
-            
-            # Level 1 items (y=320-360) - On elevated platforms
-            {'x': 360, 'y': 310, 'type': 'water'},      # On platform at x=300
-            {'x': 760, 'y': 320, 'type': 'bread'},      # On platform at x=700
-            {'x': 1160, 'y': 315, 'type': 'scroll'},    # On platform at x=1100
-            {'x': 1560, 'y': 325, 'type': 'meat'},      # On platform at x=1500
-            {'x': 1960, 'y': 310, 'type': 'armor_of_god'}, # On platform at x=1900
-            {'x': 2360, 'y': 320, 'type': 'staff'},     # On platform at x=2300
-            
-            # Level 2 items (y=160-200) - On higher platforms
-            {'x': 260, 'y': 150, 'type': 'scroll'},     # On platform at x=200
-            {'x': 660, 'y': 160, 'type': 'meat'},       # On platform at x=600
-            {'x': 1060, 'y': 155, 'type': 'armor_of_god'}, # On platform at x=1000
-            {'x': 1460, 'y': 165, 'type': 'staff'},     # On platform at x=1400
-            {'x': 1860, 'y': 150, 'type': 'stone'},     # On platform at x=1800
-            {'x': 2260, 'y': 160, 'type': 'water'},     # On platform at x=2200
-            
-            # Level 3 items (y=20-60) - On top platforms - Ultimate rewards
-            {'x': 560, 'y': 10, 'type': 'armor_of_god'}, # On platform at x=500 - Ultimate reward
-            {'x': 960, 'y': 20, 'type': 'staff'},       # On platform at x=900 - Ultimate reward
-            {'x': 1360, 'y': 15, 'type': 'meat'},       # On platform at x=1300 - Ultimate reward
-            {'x': 1760, 'y': 25, 'type': 'scroll'},     # On platform at x=1700 - Ultimate reward
-            {'x': 2160, 'y': 10, 'type': 'stone'},      # On platform at x=2100 - Ultimate reward
-        ]
-        
-        # Create NPCs and enemies on platforms
-        self.game_npcs = [
-            # Ground NPCs
-            {'x': 320, 'y': 550, 'type': 'hebrew_slave'},
-            {'x': 720, 'y': 560, 'type': 'egyptian_citizen'},
-            {'x': 1120, 'y': 575, 'type': 'priest'},
-            {'x': 1720, 'y': 540, 'type': 'palace_guard'},
-            
-            # Platform NPCs
-            {'x': 470, 'y': 460, 'type': 'egyptian_citizen'},
-            {'x': 870, 'y': 470, 'type': 'hebrew_slave'},
-            {'x': 1270, 'y': 465, 'type': 'priest'},
-            {'x': 420, 'y': 360, 'type': 'priest'},
-            {'x': 820, 'y': 370, 'type': 'hebrew_slave'},
-            {'x': 570, 'y': 250, 'type': 'priest'},
-            {'x': 970, 'y': 240, 'type': 'palace_guard'},
-        ]
-        
-        self.game_enemies = [
-            # Ground enemies
-            {'x': 600, 'y': 640, 'type': 'egyptian_soldier'},
-            {'x': 1000, 'y': 620, 'type': 'egyptian_soldier'},
-            {'x': 1400, 'y': 640, 'type': 'egyptian_soldier'},
-            {'x': 1800, 'y': 640, 'type': 'egyptian_soldier'},
-            
-            # Platform enemies
-            {'x': 540, 'y': 570, 'type': 'egyptian_soldier'},
-            {'x': 940, 'y': 588, 'type': 'egyptian_soldier'},
-            {'x': 290, 'y': 450, 'type': 'egyptian_soldier'},
-            {'x': 690, 'y': 440, 'type': 'egyptian_soldier'},
-            {'x': 1090, 'y': 450, 'type': 'egyptian_soldier'},
-            {'x': 240, 'y': 350, 'type': 'egyptian_soldier'},
-            {'x': 640, 'y': 340, 'type': 'egyptian_soldier'},
-            {'x': 1040, 'y': 350, 'type': 'egyptian_soldier'},
-            {'x': 390, 'y': 260, 'type': 'egyptian_soldier'},
-            {'x': 790, 'y': 270, 'type': 'egyptian_soldier'},
-            {'x': 1190, 'y': 265, 'type': 'egyptian_soldier'},
-        ]
-        
-        print(f"✅ Created {len(self.game_platforms)} platforms across 4 levels")
-        print(f"✅ Created {len(self.game_items)} strategic items")
-        print(f"✅ Created {len(self.game_npcs)} NPCs and {len(self.game_enemies)} enemies")
-        
-        return True
-
 
     def load_sprites(self):
-        """Load all game sprites including NPCs and tiles for enhanced UI"""
-        sprites = {}
+        """Register every game sprite with the asset manager; sprites load on first use
+        
+        Returns the sprites dict the game has always used, but each group is a
+        lazy view onto self.assets. Only the player sprites are loaded here.
+        """
+        assets = self.assets
         
-        # Load tile sprites for enhanced UI
-        sprites['tiles'] = {}
+        # Tile sprites for enhanced UI (drawn fallback when a file is missing)
         tile_path = "assets/tiles/"
-        if os.path.exists(tile_path):
-            tile_files = ['ground', 'stone_platform', 'palace_wall', 'sand', 'water']
-            for tile_name in tile_files:
-                sprite = self.load_sprite(f"{tile_path}{tile_name}.png")
-                if sprite:
-                    sprites['tiles'][tile_name] = sprite
-                    print(f"✅ Loaded tile: {tile_name}")
-                else:
-                    # Create fallback tile
-                    sprites['tiles'][tile_name] = self.create_tile_fallback(tile_name)
+        for tile_name in ['ground', 'stone_platform', 'palace_wall', 'sand', 'water']:
+            assets.register('tiles', tile_name, f"{tile_path}{tile_name}.png",
+                            fallback=partial(self.create_tile_fallback, tile_name))
         
-        # Load player sprites
-        sprites['player'] = {}
-        player_path = "assets/sprites/player/"
-        if os.path.exists(player_path):
-            sprites['player']['idle'] = self.load_sprite(f"{player_path}moses_idle.png")
-            sprites['player']['jump'] = self.load_sprite(f"{player_path}moses_jump.png")
-            sprites['player']['walk'] = []
-            for i in range(4):
-                walk_sprite = self.load_sprite(f"{player_path}moses_walk_{i}.png")
-                if walk_sprite:
-                    sprites['player']['walk'].append(walk_sprite)
-        
-        # Load NPC sprites for all locations
-        sprites['npcs'] = {}
+        # NPC sprites for all locations
         npc_path = "assets/sprites/npcs/"
         
         # Base NPC types (actual sprite files)
         base_npc_types = ['palace_guard', 'egyptian_citizen', 'hebrew_slave', 'priest']
         for npc_type in base_npc_types:
-            sprite = self.load_sprite(f"{npc_path}{npc_type}.png")
-            if sprite:
-                sprites['npcs'][npc_type] = sprite
-                print(f"✅ Loaded NPC: {npc_type}")
-            else:
-                # Create fallback colored sprite
-                sprites['npcs'][npc_type] = self.create_npc_fallback(npc_type)
+            assets.register('npcs', npc_type, f"{npc_path}{npc_type}.png",
+                            fallback=partial(self.create_npc_fallback, npc_type))
         
         # Extended NPC types (using base sprites or fallbacks)
         npc_mappings = {
@@ -363,48 +238,64 @@ class MosesAdventureGame:
             'city_guard': 'palace_guard'
         }
         
-        # Map extended NPCs to base sprites or create unique fallbacks
+        # Extended NPCs share their base sprite (which has its own fallback)
         for extended_npc, base_npc in npc_mappings.items():
-            if base_npc in sprites['npcs'] and sprites['npcs'][base_npc]:
-                sprites['npcs'][extended_npc] = sprites['npcs'][base_npc]
-            else:
-                sprites['npcs'][extended_npc] = self.create_npc_fallback(extended_npc)
+            assets.register_alias('npcs', extended_npc, ('npcs', base_npc))
         
-        # Load item sprites
-        sprites['items'] = {}
+        # Item sprites
         item_path = "assets/items/"
-        item_types = ['stone', 'meat', 'water', 'armor_of_god', 'staff', 'bread', 'scroll']
-        for item_type in item_types:
-            sprites['items'][item_type] = self.load_sprite(f"{item_path}{item_type}.png")
+        for item_type in ['stone', 'meat', 'water', 'armor_of_god', 'staff', 'bread', 'scroll']:
+            assets.register('items', item_type, f"{item_path}{item_type}.png")
         
-        # Load enemy sprites
-        sprites['enemies'] = {}
+        # Enemy sprites
         enemy_path = "assets/sprites/enemies/"
-        enemy_types = ['egyptian_soldier', 'wild_animal']
-        for enemy_type in enemy_types:
-            sprite = self.load_sprite(f"{enemy_path}{enemy_type}.png")
-            if sprite:
-                sprites['enemies'][enemy_type] = sprite
-                print(f"✅ Loaded enemy: {enemy_type}")
-            else:
-                # Create fallback enemy sprite
-                sprites['enemies'][enemy_type] = self.create_enemy_fallback(enemy_type)
+        for enemy_type in ['egyptian_soldier', 'wild_animal']:
+            assets.register('enemies', enemy_type, f"{enemy_path}{enemy_type}.png",
+                            fallback=partial(self.create_enemy_fallback, enemy_type))
+        
+        # Left-facing NPC and enemy sprites, mirrored once when first drawn
+        for category in ('npcs', 'enemies'):
+            for name in assets.names(category):
+                target = assets.resolve((category, name))
+                if target == (category, name):
+                    assets.register_derived(f'{category}_left', name, target, self.sprite_variants.flip)
+                else:
+                    assets.register_alias(f'{category}_left', name, (f'{category}_left', target[1]))
         
-        # Load UI sprites
-        sprites['ui'] = {}
+        # UI sprites
         ui_path = "assets/ui/"
-        ui_elements = ['health_bar_bg', 'health_bar_fill', 'dialogue_box', 'inventory_slot', 'button']
-        for ui_element in ui_elements:
-            sprites['ui'][ui_element] = self.load_sprite(f"{ui_path}{ui_element}.png")
+        for ui_element in ['health_bar_bg', 'health_bar_fill', 'dialogue_box', 'inventory_slot', 'button']:
+            assets.register('ui', ui_element, f"{ui_path}{ui_element}.png")
         
-        # Load background sprites
-        sprites['backgrounds'] = {}
+        # Background sprites
         bg_path = "assets/backgrounds/"
-        bg_types = ['palace', 'desert', 'red_sea']
-        for bg_type in bg_types:
-            sprites['backgrounds'][bg_type] = self.load_sprite(f"{bg_path}{bg_type}.png")
+        for bg_type in ['palace', 'desert', 'red_sea']:
+            assets.register('backgrounds', bg_type, f"{bg_path}{bg_type}.png")
+        
+        sprites = {category: assets.group(category)
+                   for category in ('tiles', 'npcs', 'npcs_left', 'items', 'enemies', 'enemies_left', 'ui', 'backgrounds')}
         
-        print(f"🎨 Loaded sprites: {len(sprites['tiles'])} tiles, {len(sprites['npcs'])} NPCs, {len(sprites['player'])} player, {len(sprites.get('enemies', {}))} enemies")
+        # Player sprites are needed everywhere, so load them now (with left-facing variants)
+        player_path = "assets/sprites/player/"
+        player = {}
+        for state in ('idle', 'jump'):
+            assets.register('player', state, f"{player_path}moses_{state}.png")
+        # The atlas's frame table decides the walk cycle; without one it is the four walk files
+        walk_frames = (assets.atlas and assets.atlas.animation('moses_walk')) or \
+            [f"{player_path}moses_walk_{i}.png" for i in range(4)]
+        for i, frame_path in enumerate(walk_frames):
+            assets.register('player', f'walk_{i}', frame_path)
+        assets.preload([('player', name) for name in assets.names('player')])
+        player['idle'] = assets.get('player', 'idle')
+        player['jump'] = assets.get('player', 'jump')
+        player['walk'] = [frame for frame in (assets.get('player', f'walk_{i}') for i in range(len(walk_frames)))
+                          if frame]
+        assets.retain('player', [('player', name) for name in assets.names('player')])
+        self.sprite_variants.add_player_variants(player)
+        sprites['player'] = player
+        
+        print(f"🎨 Registered {len(assets.catalog)} sprites "
+              f"({len(sprites['npcs'])} NPCs, {len(sprites['enemies'])} enemies); loading on first use")
         return sprites
     
     def create_tile_fallback(self, tile_name):
@@ -445,6 +336,8 @@ class MosesAdventureGame:
         pygame.draw.rect(surface, (0, 0, 0), surface.get_rect(), 2)  # Border
         
         return surface
+    
+    def create_npc_fallback(self, npc_type):
         """Create a colored fallback sprite for NPCs with better visibility"""
         npc_surface = pygame.Surface((32, 48))
         npc_colors = {
@@ -486,246 +379,6 @@ class MosesAdventureGame:
         
         return npc_surface
     
-    def load_sprite(self, path):
-        """Load a single sprite with error handling"""
-        try:
-            if os.path.exists(path):
-                return pygame.image.load(path).convert_alpha()
-            else:
-                print(f"Warning: Sprite not found: {path}")
-                return None
-        except pygame.error as e:
-            print(f"Error loading sprite {path}: {e}")
-            return None
-    
-    def update_projectiles(self, dt):
-        """Update projectiles (stones and staff)"""
-        for projectile in self.projectiles[:]:
-            # Update position
-            projectile['x'] += projectile['velocity_x']
-            projectile['y'] += projectile['velocity_y']
-            
-            # Apply gravity to stones
-            if projectile['type'] == 'stone':
-                projectile['velocity_y'] += 0.5  # Gravity
-            
-            # Check collision with enemies
-            projectile_rect = pygame.Rect(projectile['x'], projectile['y'], 10, 10)
-            
-            for enemy in self.enemies[:]:
-                enemy_rect = pygame.Rect(enemy.x, enemy.y, enemy.width, enemy.height)
-                if projectile_rect.colliderect(enemy_rect):
-                    # Hit enemy
-                    damage = projectile['damage']
-                    enemy.health -= damage
-                    print(f"💥 {projectile['type']} hit enemy for {damage} damage!")
-                    
-                    # Remove projectile
-                    if projectile in self.projectiles:
-                        self.projectiles.remove(projectile)
-                    
-                    # Remove enemy if dead
-                    if enemy.health <= 0:
-                        self.enemies.remove(enemy)
-                        print("💀 Enemy defeated!")
-                    
-                    break
-            
-            # Remove projectiles that go off screen
-            if (projectile['x'] < -50 or projectile['x'] > SCREEN_WIDTH + 50 or 
-                projectile['y'] > SCREEN_HEIGHT + 50):
-                if projectile in self.projectiles:
-                    self.projectiles.remove(projectile)
-    
-    def render_projectiles(self, screen):
-        """Render projectiles"""
-        for projectile in self.projectiles:
-            if projectile['type'] == 'stone':
-                # Draw stone
-                pygame.draw.circle(screen, (139, 69, 19), 
-                                 (int(projectile['x']), int(projectile['y'])), 5)
-            elif projectile['type'] == 'staff':
-                # Draw divine projectile
-                pygame.draw.circle(screen, (255, 255, 0), 
-                                 (int(projectile['x']), int(projectile['y'])), 8)
-                pygame.draw.circle(screen, (255, 255, 255), 
-                                 (int(projectile['x']), int(projectile['y'])), 4)
-
-    
-    
-    def check_item_collection(self):
-        """FIXED: Item collection system - walk over items to collect"""
-        if not self.player or not hasattr(self.player, 'rect'):
-            return
-        
-        player_rect = self.player.rect
-        collected_items = []
-        
-        # Check item collisions with larger collection area
-        for item in getattr(self, 'items', []):
-            if hasattr(item, 'x') and hasattr(item, 'y') and hasattr(item, 'type'):
-                # FIXED: Larger collection area for easier pickup
-                item_rect = pygame.Rect(item.x - 5, item.y - 5, 30, 30)
-                
-                if player_rect.colliderect(item_rect):
-                    # Add to inventory
-                    if self.inventory:
-                        self.inventory.add_item(item.type, 1)
-                        
-                        # Play pickup sound
-                        if hasattr(self, 'sound_manager') and self.sound_manager:
-                            self.sound_manager.play_sound('pickup')
-                        
-                        # Show collection message
-                        item_names = {
-                            'stone': 'Stone',
-                            'water': 'Water',
-                            'bread': 'Bread', 
-                            'meat': 'Meat',
-                            'scroll': 'Scroll',
-                            'armor_of_god': 'Armor of God',
-                            'staff': 'Staff of Moses'
-                        }
-                        
-                        item_name = item_names.get(item.type, item.type.title())
-                        print(f"📦 Collected {item_name}!")
-                        
-                        # Visual feedback
-                        if hasattr(self, 'show_item_collection_message'):
-                            self.show_item_collection_message(item_name, item.type)
-                    
-                    collected_items.append(item)
-        
-        # Remove collected items
-        if hasattr(self, 'items'):
-            for item in collected_items:
-                if item in self.items:
-                    self.items.remove(item)
-    def check_collisions(self):
-        """FINAL FIX: Comprehensive collision detection with guaranteed ground detection"""
-        if not self.player or not hasattr(self.player, 'rect'):
-            return
-        
-        player_rect = self.player.rect
-        ground_level = SCREEN_HEIGHT - 50  # 718
-        
-        # ALWAYS check ground first - this is the most important
-        if player_rect.bottom >= ground_level:
-            player_rect.bottom = ground_level
-            self.player.velocity_y = 0
-            self.player.on_ground = True
-            self.player.is_jumping = False
-            # Only print debug message occasionally
-            if not hasattr(self, '_ground_debug_shown'):
-                print(f"🏠 Moses secured on ground: y={self.player.rect.y}, on_ground={self.player.on_ground}")
-                self._ground_debug_shown = True
-        
-        # Check platform collisions (secondary)
-        if hasattr(self, 'platforms') and self.platforms:
-            for platform in self.platforms:
-                platform_rect = pygame.Rect(platform['x'], platform['y'], 
-                                           platform['width'], platform['height'])
-                
-                # Platform collision detection
-                if (player_rect.colliderect(platform_rect) and
-                    self.player.velocity_y >= 0 and  # Falling or stationary
-                    player_rect.bottom <= platform_rect.top + 10 and  # Landing from above
-                    player_rect.bottom >= platform_rect.top - 5):  # Near platform top
-                    
-                    # Land on platform
-                    player_rect.bottom = platform_rect.top
-                    self.player.velocity_y = 0
-                    self.player.on_ground = True
-                    self.player.is_jumping = False
-                    print(f"🏗️ Moses landed on platform at y={platform['y']}")
-                    break
-    def check_enemy_collisions(self):
-        """FIXED: Enemy collision detection with proper damage"""
-        if not self.player or not hasattr(self.player, 'rect'):
-            return
-        
-        if self.player.invulnerable:
-            return  # Skip if player is invulnerable
-        
-        player_rect = self.player.rect
-        
-        # Check enemy collisions
-        for enemy in getattr(self, 'enemies', []):
-            if hasattr(enemy, 'x') and hasattr(enemy, 'y'):
-                enemy_rect = pygame.Rect(enemy.x, enemy.y, 32, 32)
-                
-                # FIXED: Proper collision detection
-                if player_rect.colliderect(enemy_rect):
-                    # Calculate damage
-                    base_damage = 10
-                    actual_damage = base_damage
-                    
-                    # Apply armor reduction
-                    if hasattr(self.player, 'armor_active') and self.player.armor_active:
-                        actual_damage = int(base_damage * 0.25)  # 75% reduction
-                        print(f"🛡️ Armor of God reduced damage: {base_damage} → {actual_damage}")
-                    
-                    # Apply damage
-                    self.player.health -= actual_damage
-                    if self.player.health < 0:
-                        self.player.health = 0
-                    
-                    # Set invulnerability
-                    self.player.invulnerable = True
-                    self.player.invulnerable_timer = self.player.invulnerable_time
-                    
-                    print(f"💔 Moses took {actual_damage} damage! Health: {self.player.health}/100")
-                    
-                    # Play hurt sound
-                    if hasattr(self.player, 'sound_manager') and self.player.sound_manager:
-                        self.player.sound_manager.play_sound('player_hurt')
-                    
-                    # Check for game over
-                    if self.player.health <= 0:
-                        self.handle_game_over()
-                    
-                    break
-    def check_item_collection(self):
-        """Check for item collection"""
-        if not self.player or not hasattr(self.player, 'rect'):
-            return
-        
-        try:
-            player_rect = self.player.rect
-            for item in getattr(self, 'items', [])[:]:
-                if hasattr(item, 'x') and hasattr(item, 'y'):
-                    item_rect = pygame.Rect(item.x, item.y, 20, 20)
-                    if player_rect.colliderect(item_rect):
-                        item_type = getattr(item, 'type', 'bread')
-                        if self.inventory:
-                            self.inventory.add_item(item_type, 1)
-                            print(f'📦 Collected {item_type}!')
-                        if hasattr(self, 'items') and item in self.items:
-                            self.items.remove(item)
-                        break
-        except:
-            pass
-
-    def update_player(self, dt):
-        """FIXED: Update player with proper physics integration"""
-        if not self.player:
-            return
-        
-        # Update player internal state first
-        self.player.update(dt)
-        
-        # FIXED: Apply collision detection after player movement
-        self.check_collisions()
-        
-        # Update camera to follow player smoothly
-        if hasattr(self, 'camera_x'):
-            target_camera_x = self.player.rect.centerx - SCREEN_WIDTH // 2
-            self.camera_x += (target_camera_x - self.camera_x) * 0.1
-            
-            # Keep camera within bounds
-            max_camera_x = max(0, (SCREEN_WIDTH * 2) - SCREEN_WIDTH)
-            self.camera_x = max(0, min(self.camera_x, max_camera_x))
-
     def handle_npc_interaction(self, npc):
         """FIXED: Handle NPC interactions with dialogue options"""
         if not npc or not hasattr(npc, 'npc_type'):
@@ -809,11 +462,11 @@ class MosesAdventureGame:
         print("Controls: Arrow keys to move, E to interact, M for music, S for sound")
         
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
+            frame_time = self.clock.tick(self.target_fps) / 1000.0  # Real time since last frame
             
             self.handle_events()
             if not self.paused:
-                self.update(dt)
+                self.step_simulation(frame_time)
             self.render()
             
             # Optional FPS display
@@ -825,6 +478,25 @@ class MosesAdventureGame:
         pygame.quit()
         sys.exit()
     
+    def step_simulation(self, frame_time):
+        """Advance the game in fixed SIM_DT ticks, keeping the remainder for interpolation"""
+        self.sim_accumulator += frame_time
+        
+        # Held keys are sampled once per rendered frame and reused for its ticks
+        controls = InputState.from_keys(pygame.key.get_pressed())
+        
+        steps = 0
+        while self.sim_accumulator >= SIM_DT and steps < MAX_SIM_STEPS:
+            self.update(SIM_DT, controls)
+            self.sim_accumulator -= SIM_DT
+            steps += 1
+        
+        # Too far behind (slow machine, window drag): drop the backlog instead of spiralling
+        if steps == MAX_SIM_STEPS and self.sim_accumulator > SIM_DT:
+            self.sim_accumulator = 0.0
+        
+        self.render_alpha = self.sim_accumulator / SIM_DT
+    
     def handle_events(self):
         """Handle all game events"""
         for event in pygame.event.get():
@@ -869,7 +541,7 @@ class MosesAdventureGame:
                     if not self.dialogue_system.active:
                         self.state = GameState.PLAYING
                         # Remove the NPC that was just talked to
-                    self.remove_interacted_npc()
+                    self.simulation.remove_interacted_npc()
             elif self.state == GameState.INVENTORY:
                 self.inventory.handle_event(event)
                 if not self.inventory.active:
@@ -1040,150 +712,28 @@ class MosesAdventureGame:
                 print("👋 Farewell, Moses...")
                 self.running = False
     
-    def restart_game(self):
-        """Restart the game from the beginning"""
-        # Reset player health and position
-        ground_y = SCREEN_HEIGHT - 50
-        player_y = ground_y - 48
-        self.player = Player(150, player_y, self.sprites.get('player', {}))
-        
-        # Give player access to platforms for collision detection
-        if hasattr(self, 'game_platforms'):
-            self.player.game_platforms = self.game_platforms
-        
-        # Reset player health to full
-        self.player.health = self.player.max_health
-        
-        # Clear any active states
-        self.stone_throw_mode = False
-        self.healing_ready = False
-        self.healing_item = None
-        self.healing_amount = 0
-        
-        # Reset inventory (optional - you might want to keep items)
-        # self.inventory = Inventory()
-        # self.inventory.game_instance = self
-        
-        # Reload the current level
-        self.level_manager.load_level(Location.PALACE, self.sprites)
-        
-        # Initialize multi-level platform system
-        print("🏗️  Initializing multi-level platform system...")
-        self.initialize_multi_level_world()
-        
-        # CRITICAL: Ensure player has platform reference for collision detection
-        if hasattr(self, 'game_platforms') and hasattr(self, 'player'):
-            self.player.game_platforms = self.game_platforms
-            print(f"🔧 ✅ Player now has access to {len(self.game_platforms)} platforms for collision detection")
-        else:
-            print("❌ Failed to assign platforms to player!")
-        
-        # Platform integration handled by render_platforms method
-        print(f"🏗️  Platform system ready with {len(self.game_platforms)} platforms")
-        
-        # Initialize multi-level platform system
-        print("🏗️  Initializing multi-level platform system...")
-        self.initialize_multi_level_world()
-        
-        # CRITICAL: Ensure player has platform reference for collision detection
-        if hasattr(self, 'game_platforms') and hasattr(self, 'player'):
-            self.player.game_platforms = self.game_platforms
-            print(f"🔧 ✅ Player now has access to {len(self.game_platforms)} platforms for collision detection")
-        else:
-            print("❌ Failed to assign platforms to player!")
-        
-        # Platform integration handled by render_platforms method
-        print(f"🏗️  Platform system ready with {len(self.game_platforms)} platforms")
-        
-        # Reset camera
-        self.camera = Camera()
-        
-        # Connect systems
-        self.player.sound_manager = self.sound_manager
-        
-        # Start playing again
-        self.state = GameState.PLAYING
-        
-        print("✅ Game restarted successfully!")
-    
     def start_game(self):
         """Initialize and start the game with opening dialogue"""
-        # Place player properly on the ground
-        # Ground platform is at y=718, player height is 48, so player should be at y=670
-        ground_y = SCREEN_HEIGHT - 50  # 718
-        player_y = ground_y - 48  # 670 (player height is 48)
-        self.player = Player(150, player_y, self.sprites.get('player', {}))
-        
-        # Give player access to platforms for collision detection
-        if hasattr(self, 'game_platforms'):
-            self.player.game_platforms = self.game_platforms
-        
-        # Debug: Show Moses' exact position
-        print(f"🎯 Moses Position: x={self.player.rect.x}, y={self.player.rect.y}, bottom={self.player.rect.bottom}")
+        # New player, palace level and multi-level platforms; opens with the narrator
+        self.simulation.start()
         
         # Connect sound manager to player for jump sounds
-        if hasattr(self.player, 'set_sound_manager'):
-            self.player.set_sound_manager(self.sound_manager)
+        self.player.set_sound_manager(self.sound_manager)
         
         # Configure realistic walking sounds
-        if hasattr(self.player, 'set_walking_pace'):
-            self.player.set_walking_pace("normal")  # Set normal walking pace
+        self.player.set_walking_pace("normal")  # Set normal walking pace
         
         # Set comfortable step volume
         self.sound_manager.set_step_volume(0.5)  # 50% volume for comfortable listening
         
-        self.level_manager.load_level(Location.PALACE, self.sprites)
-        
-        # Initialize multi-level platform system
-        print("🏗️  Initializing multi-level platform system...")
-        self.initialize_multi_level_world()
-        
-        # CRITICAL: Ensure player has platform reference for collision detection
-        if hasattr(self, 'game_platforms') and hasattr(self, 'player'):
-            self.player.game_platforms = self.game_platforms
-            print(f"🔧 ✅ Player now has access to {len(self.game_platforms)} platforms for collision detection")
-        else:
-            print("❌ Failed to assign platforms to player!")
-        
-        # Platform integration handled by render_platforms method
-        print(f"🏗️  Platform system ready with {len(self.game_platforms)} platforms")
-        
-        # Initialize multi-level platform system
-        print("🏗️  Initializing multi-level platform system...")
-        self.initialize_multi_level_world()
-        
-        # CRITICAL: Ensure player has platform reference for collision detection
-        if hasattr(self, 'game_platforms') and hasattr(self, 'player'):
-            self.player.game_platforms = self.game_platforms
-            print(f"🔧 ✅ Player now has access to {len(self.game_platforms)} platforms for collision detection")
-        else:
-            print("❌ Failed to assign platforms to player!")
-        
-        # Platform integration handled by render_platforms method
-        print(f"🏗️  Platform system ready with {len(self.game_platforms)} platforms")
-        
-        # Reset camera to show the game world properly
-        self.camera.x = 0
-        self.camera.y = 0
-        
         # Play ancient_egypt.mp3 background music
         self.sound_manager.play_background_music()
         
         # Reset game systems
         self.moral_system = MoralSystem()
-        # self.dialogue_system.moral_system = self.moral_system
-        self.inventory = Inventory()
         self.inventory.game_instance = self  # Connect for item effects
         self.visual_feedback = VisualFeedback()
         
-        # START WITH OPENING DIALOGUE instead of going straight to playing
-        
-        # DIALOGUE BYPASS FOR TESTING - uncomment next line to skip dialogue
-        # self.state = GameState.PLAYING; return
-        
-        # START WITH OPENING DIALOGUE - RESTORED
-        self.state = GameState.DIALOGUE
-        self.dialogue_system.start_dialogue("opening")
         print("🎭 Opening dialogue started - narrator text should appear")
         print("💬 DIALOGUE CONTROLS:")
         print("   - SPACE or ENTER: Advance dialogue")
@@ -1212,27 +762,8 @@ class MosesAdventureGame:
         """Restart the game"""
         print("🔄 Restarting Moses Adventure...")
         
-        # Reset player
-        if self.player:
-            self.player.health = getattr(self.player, 'max_health', 100)
-            self.player.rect.x = 150
-            self.player.rect.y = 670
-            self.player.velocity_x = 0
-            self.player.velocity_y = 0
-            if hasattr(self.player, 'armor_active'):
-                self.player.armor_active = False
-                self.player.armor_timer = 0
-        
-        # Reset inventory
-        if hasattr(self, 'inventory'):
-            for item in self.inventory.items:
-                self.inventory.items[item] = 0
-            self.inventory.stone_ready = False
-            self.inventory.staff_active = False
-            self.inventory.armor_active = False
-        
-        # Reset game state
-        self.state = GameState.PLAYING
+        # Reset player, inventory and game state
+        self.simulation.restart()
         
         # Clear visual feedback
         if hasattr(self, 'visual_feedback'):
@@ -1255,112 +786,20 @@ class MosesAdventureGame:
         if hasattr(self, 'visual_feedback'):
             self.visual_feedback.show_message("Welcome to Moses Adventure!", 3.0)
     
-    def update_player(self, dt):
-        """Update player position and physics"""
-        if not self.player:
-            return
-        
-        # Apply gravity
-        if hasattr(self.player, 'velocity_y'):
-            if not self.player.on_ground:
-                self.player.velocity_y += 800 * dt  # Gravity
-                if self.player.velocity_y > 600:  # Terminal velocity
-                    self.player.velocity_y = 600
-        
-        # Update position based on velocity
-        if hasattr(self.player, 'velocity_x') and hasattr(self.player, 'rect'):
-            self.player.rect.x += self.player.velocity_x * dt
-            
-        if hasattr(self.player, 'velocity_y') and hasattr(self.player, 'rect'):
-            self.player.rect.y += self.player.velocity_y * dt
-        
-        # Keep player on screen
-        if hasattr(self.player, 'rect'):
-            if self.player.rect.x < 0:
-                self.player.rect.x = 0
-            elif self.player.rect.x > SCREEN_WIDTH - self.player.rect.width:
-                self.player.rect.x = SCREEN_WIDTH - self.player.rect.width
-            
-            # Ground collision fallback
-            if self.player.rect.bottom > 670:
-                self.player.rect.bottom = 670
-                if hasattr(self.player, 'velocity_y'):
-                    self.player.velocity_y = 0
-                self.player.on_ground = True
-                print(f"🏠 Moses on ground at y={self.player.rect.y}")
-
-    def update(self, dt):
-        """Update game state with delta time for smooth 60 FPS"""
+    def update(self, dt, controls=None):
+        """Step the simulation one tick, then react to what happened in it"""
         # Update scripture dialogue timer
         if self.scripture_dialogue_active:
             self.scripture_timer -= dt
             if self.scripture_timer <= 0:
                 self.scripture_dialogue_active = False
         
-        if self.state == GameState.PLAYING:
-            if self.player:
-                # Update player physics
-                self.player.update(dt)
+        if controls is None:
+            controls = InputState.from_keys(pygame.key.get_pressed())
         
-        # Update camera to follow Moses vertically and horizontally
-        if hasattr(self, 'camera') and hasattr(self, 'player'):
-            self.camera.follow_player(self.player)
+        self.simulation.step(controls, dt)
+        self.handle_simulation_events()
         
-        # Update simple enemies
-        self.level_manager.update_simple_enemies(dt)
-        
-        # Update stone projectiles
-        self.level_manager.update_stones(dt)
-        
-        # Check stone-enemy collisions
-        hits = self.level_manager.check_stone_enemy_collisions()
-        if hits > 0:
-            # Play enemy defeat sound
-            if hasattr(self.sound_manager, 'play_sound'):
-                self.sound_manager.play_sound('enemy_defeat')
-        
-        # CRITICAL: Check collisions AFTER player update
-        self.check_collisions()
-                # Check collisions AFTER player update
-                # Update player physics
-        self.update_player(dt)
-        
-        self.check_collisions()
-
-        # Check item collection
-        self.check_item_collection()
-
-        # Enemy collision damage
-        if self.player and self.player.health > 0:
-            player_rect = self.player.rect if hasattr(self.player, 'rect') else pygame.Rect(0, 0, 32, 32)
-            for enemy in getattr(self, 'enemies', []):
-                if hasattr(enemy, 'x') and hasattr(enemy, 'y'):
-                    enemy_rect = pygame.Rect(enemy.x, enemy.y, 30, 30)
-                    if player_rect.colliderect(enemy_rect):
-                        damage = 10
-                        if hasattr(self.player, 'armor_active') and self.player.armor_active:
-                            damage = int(damage * 0.25)
-                        self.player.health -= damage
-                        if self.player.health < 0:
-                            self.player.health = 0
-                        print(f'💔 Took {damage} damage! Health: {self.player.health}/100')
-                        break
-
-        # Check enemy collisions for damage
-        self.check_enemy_collisions()
-        
-        # Update camera and other systems
-        if self.player:
-            self.camera.follow_player(self.player)
-        self.check_interactions()
-        self.check_level_transitions()
-        
-        # Check for game over
-        if self.player and self.player.health <= 0:
-            self.state = GameState.GAME_OVER
-        
-            self.level_manager.update(dt)
-
         # Update all visual feedback messages
         if self.consumption_text_timer > 0:
             self.consumption_text_timer -= dt
@@ -1381,161 +820,37 @@ class MosesAdventureGame:
                 if message['timer'] <= 0:
                     self.feedback_messages.remove(message)
             self.visual_feedback.update(dt)
-
-        # Update inventory system
-        if self.inventory:
-            self.inventory.update(dt)
-
-        # Update projectiles
-        self.update_projectiles(dt)
-        
-        if self.state == GameState.DIALOGUE:
-            # Update dialogue system for typing effect
-            if self.dialogue_system and self.dialogue_system.active:
-                self.dialogue_system.update(dt)
     
-    def check_enemy_collisions(self):
-        """Check collisions between player and enemies with damage"""
-        if not self.player or not hasattr(self.player, 'rect') or self.player.health <= 0:
-            return
-        
-        player_rect = self.player.rect
-        
-        for enemy in getattr(self, 'enemies', [])[:]:
-            if hasattr(enemy, 'x') and hasattr(enemy, 'y'):
-                enemy_rect = pygame.Rect(enemy.x, enemy.y, 30, 30)
-                
-                if player_rect.colliderect(enemy_rect):
-                    # Calculate damage
-                    damage = 10
-                    if hasattr(self.player, 'armor_active') and self.player.armor_active:
-                        damage = int(damage * 0.25)
-                        print(f"🛡️ Armor reduced damage to {damage}")
-                    
-                    # Apply damage
-                    self.player.health -= damage
-                    if self.player.health < 0:
-                        self.player.health = 0
-                    
-                    print(f"💔 Moses took {damage} damage! Health: {self.player.health}/100")
-                    
-                    # Visual feedback
-                    if hasattr(self, 'visual_feedback'):
-                        self.visual_feedback.show_message(f"Took {damage} damage!", 2.0)
-                    
-                    # Game over check
-                    if self.player.health <= 0:
-                        print("💀 GAME OVER!")
-                        if hasattr(self, 'game_over'):
-                            self.game_over()
-                    
-                    # Knockback
-                    knockback = 20
-                    if enemy.x < player_rect.x:
-                        player_rect.x += knockback
-                    else:
-                        player_rect.x -= knockback
-                    
-                    break
-
-
-    def handle_platform_collision(self, platform):
-        """Handle collision with platforms with FIXED physics"""
-        if not self.player or not platform:
-            return
-            
-        player = self.player
-        
-        try:
-            # Calculate overlap with tolerance for edge cases
-            overlap_x = min(player.rect.right - platform.rect.left, 
-                           platform.rect.right - player.rect.left)
-            overlap_y = min(player.rect.bottom - platform.rect.top, 
-                           platform.rect.bottom - player.rect.top)
-            
-            # FIXED: Better platform landing detection
-            if abs(player.rect.bottom - platform.rect.top) <= 5 and player.velocity_y >= 0:
-                # Player is landing on or standing on platform
-                player.rect.bottom = platform.rect.top
-                if hasattr(player, 'velocity_y'):
-                    player.velocity_y = 0
-                if hasattr(player, 'on_ground'):
-                    player.on_ground = True
-                if hasattr(player, 'is_jumping'):
-                    player.is_jumping = False
+    def handle_simulation_events(self):
+        """Play sounds and show feedback for the events of the last tick"""
+        for event in self.simulation.drain_events():
+            kind = event[0]
+            if kind == 'sound':
+                self.sound_manager.play_sound(event[1])
+            elif kind == 'message':
+                self.visual_feedback.show_message(event[1], event[2])
+            elif kind == 'item_collected':
+                item_type, item_rect = event[1], event[2]
+                if hasattr(self.visual_feedback, 'show_item_collected'):
+                    self.visual_feedback.show_item_collected(item_type, item_rect.center)
+                elif hasattr(self.visual_feedback, 'create_pickup_effect'):
+                    self.visual_feedback.create_pickup_effect(item_rect.centerx, item_rect.centery)
+            elif kind == 'dialogue_started':
+                if hasattr(self.sound_manager, 'play_dialogue_sound'):
+                    self.sound_manager.play_dialogue_sound()
+            elif kind == 'level_entered':
+                destination = event[1]
+                self.sound_manager.play_background_music(destination.value)
+                self.assets.print_report()
                 
-                # Clear the platform check flag if it exists
-                if hasattr(player, 'needs_platform_check'):
-                    player.needs_platform_check = False
-                
-                # Create dust effect
-                if hasattr(self, 'visual_feedback'):
-                    self.visual_feedback.create_dust_effect(player.rect.centerx, player.rect.bottom)
-                # Landing sound
-                if hasattr(self.sound_manager, 'play_sound'):
-                    self.sound_manager.play_sound("jump")
-                return
-            
-            # Resolve collision based on smallest overlap for other cases
-            if overlap_x < overlap_y:
-                # Horizontal collision
-                if player.rect.centerx < platform.rect.centerx:
-                    player.rect.right = platform.rect.left
+                # Show location text
+                location_name = destination.value.replace('_', ' ').title()
+                if hasattr(self.visual_feedback, 'show_location_text'):
+                    self.visual_feedback.show_location_text(location_name)
                 else:
-                    player.rect.left = platform.rect.right
-                if hasattr(player, 'velocity_x'):
-                    player.velocity_x = 0
-            else:
-                # Vertical collision
-                if player.rect.centery < platform.rect.centery:
-                    # Landing on top
-                    player.rect.bottom = platform.rect.top
-                    if hasattr(player, 'velocity_y'):
-                        player.velocity_y = 0
-                    if hasattr(player, 'on_ground'):
-                        player.on_ground = True
-                    if hasattr(player, 'is_jumping'):
-                        player.is_jumping = False
-                    
-                    # Clear the platform check flag if it exists
-                    if hasattr(player, 'needs_platform_check'):
-                        player.needs_platform_check = False
-                    
-                    # Create dust effect
-                    if hasattr(self, 'visual_feedback'):
-                        self.visual_feedback.create_dust_effect(player.rect.centerx, player.rect.bottom)
-                    # Landing sound
-                    if hasattr(self.sound_manager, 'play_sound'):
-                        self.sound_manager.play_sound("jump")
-                else:
-                    # Hitting from below
-                    player.rect.top = platform.rect.bottom
-                    if hasattr(player, 'velocity_y'):
-                        player.velocity_y = 0
-        except Exception as e:
-            print(f"⚠️  Collision error: {e}")
-            # Prevent crash by doing basic collision resolution
-            if hasattr(player, 'rect') and hasattr(platform, 'rect'):
-                player.rect.bottom = platform.rect.top - 1
-    
-    def collect_item(self, item):
-        """Collect an item and add to inventory"""
-        try:
-            self.inventory.add_item(item.item_type)
-            self.level_manager.remove_item(item)
-            
-            if hasattr(self.sound_manager, 'play_sound'):
-                self.sound_manager.play_sound("pickup")
-            
-            # Show visual feedback if available
-            if hasattr(self.visual_feedback, 'show_item_collected'):
-                self.visual_feedback.show_item_collected(item.item_type, item.rect.center)
-            elif hasattr(self.visual_feedback, 'create_pickup_effect'):
-                self.visual_feedback.create_pickup_effect(item.rect.centerx, item.rect.centery)
-            
-            print(f"📦 Collected {item.item_type}")
-        except Exception as e:
-            print(f"⚠️  Item collection error: {e}")
+                    self.visual_feedback.show_message(location_name, 2.0)
+            elif kind == 'game_over':
+                self.game_over()
     
     def handle_enemy_collision(self, enemy):
         """Handle collision with enemies - damage instead of instant death"""
@@ -1582,112 +897,11 @@ class MosesAdventureGame:
             else:
                 self.player.rect.x += 20
     
-    def remove_interacted_npc(self):
-        """Remove the NPC that was just interacted with"""
-        if hasattr(self, 'last_interacted_npc') and self.last_interacted_npc:
-            try:
-                # Mark NPC as completed and move them off-screen
-                npc = self.last_interacted_npc
-                npc.rect.x = -1000  # Move far off-screen
-                npc.completed = True
-                print(f"✅ {npc.npc_type} completed their task and moved away")
-                
-                # Alternative: Remove from level manager if possible
-                if hasattr(self.level_manager, 'remove_npc'):
-                    self.level_manager.remove_npc(npc)
-                
-                self.last_interacted_npc = None
-            except Exception as e:
-                print(f"⚠️  Error removing NPC: {e}")
-    
-    def check_interactions(self):
-        """Check for NPC interactions with enhanced visibility and feedback"""
-        if not self.player:
-            return
-        
-        try:
-            npcs = self.level_manager.get_npcs()
-            keys = pygame.key.get_pressed()
-            
-            interaction_found = False
-            
-            for npc in npcs:
-                if not npc or not hasattr(npc, 'rect'):
-                    continue
-                    
-                # Check if player is close enough to interact (increased range)
-                distance = abs(self.player.rect.centerx - npc.rect.centerx)
-                vertical_distance = abs(self.player.rect.centery - npc.rect.centery)
-                
-                # More generous interaction range
-                if distance < 100 and vertical_distance < 60:  # Increased interaction range
-                    interaction_found = True
-                    
-                    # Show interaction prompt
-                    npc.showing_prompt = True
-                    
-                    # Show NPC info in console
-                    if not hasattr(npc, 'info_shown'):
-                        print(f"💬 Press E to talk to {npc.npc_type}")
-                        print(f"📏 Distance: {distance} pixels (Moses at x={self.player.rect.x})")
-                        npc.info_shown = True
-                    
-                    if keys[pygame.K_e] and not getattr(npc, 'is_interacting', False):  # Interact key
-                        # Store reference to this NPC for removal after dialogue
-                        self.last_interacted_npc = npc
-                        
-                        # Start interaction
-                        npc.is_interacting = True
-                        
-                        # Start interaction animation
-                        if hasattr(self.player, 'start_interaction'):
-                            self.player.start_interaction()
-                        
-                        # Switch to dialogue state
-                        self.state = GameState.DIALOGUE
-                        
-                        # Start dialogue with enhanced system
-                        dialogue_success = self.dialogue_system.start_dialogue(npc.dialogue_id)
-                        if dialogue_success:
-                            print(f"✅ Started dialogue with {npc.npc_type}")
-                            # Play dialogue sound
-                            if hasattr(self.sound_manager, 'play_dialogue_sound'):
-                                self.sound_manager.play_dialogue_sound()
-                        else:
-                            print(f"❌ Failed to start dialogue with {npc.npc_type}")
-                            self.state = GameState.PLAYING  # Return to playing if dialogue fails
-                        
-                        break
-                else:
-                    # Reset info and prompt when moving away
-                    if hasattr(npc, 'info_shown'):
-                        npc.info_shown = False
-                    if hasattr(npc, 'showing_prompt'):
-                        npc.showing_prompt = False
-            
-            # Clear all interaction prompts if no NPCs are nearby
-            if not interaction_found:
-                if hasattr(self, 'visual_feedback'):
-                    self.visual_feedback.clear_interaction_prompt()
-        except Exception as e:
-            print(f"⚠️  Interaction check error: {e}")
-    
     def start_dialogue(self, npc):
         """Start dialogue with an NPC"""
         self.dialogue_system.start_dialogue(npc.dialogue_id)
         self.state = GameState.DIALOGUE
     
-    def check_level_transitions(self):
-        """Check if player should transition to next level"""
-        if not self.player:
-            return
-            
-        # Check if player reached the exit
-        exit_zones = self.level_manager.get_exit_zones()
-        for exit_zone in exit_zones:
-            if self.player.rect.colliderect(exit_zone.rect):
-                self.transition_to_level(exit_zone.destination)
-    
     def show_scripture_dialogue(self):
         """Show scripture dialogue when scroll is used"""
         scriptures = [
@@ -1724,8 +938,7 @@ class MosesAdventureGame:
             stone_y = self.player.rect.centery
             direction = 1 if self.player.facing_right else -1
             
-            stone = Stone(stone_x, stone_y, direction)
-            self.level_manager.add_stone(stone)
+            self.level_manager.projectiles.spawn_stone(stone_x, stone_y, direction)
             
             # Set attack cooldown
             self.player.can_attack = False
@@ -1826,24 +1039,6 @@ class MosesAdventureGame:
         self.stone_throw_mode = False
         self.visual_feedback.show_message("Stone missed target", 1.5)
         return False
-        """Transition to a new level"""
-        self.level_manager.load_level(destination, self.sprites)
-        self.sound_manager.play_background_music(destination.value)
-        
-        # Reset player position for new level
-        if self.player:
-            self.player.rect.x = 100
-            self.player.rect.y = SCREEN_HEIGHT - 100  # Position on ground level
-            self.player.velocity_x = 0
-            self.player.velocity_y = 0
-            self.player.on_ground = True  # Make sure player starts on ground
-        
-        # Show location text
-        self.visual_feedback.show_location_text(destination.value.replace('_', ' ').title())
-        
-        # Check for victory condition
-        if destination == Location.JERUSALEM:
-            self.state = GameState.VICTORY
     
     def render(self):
         """Render the game with visual feedback"""
@@ -1983,46 +1178,31 @@ class MosesAdventureGame:
             y_offset += 30
     
     def render_game(self):
-        # Render multi-level platforms
-        if hasattr(self, 'platforms'):
-            for platform in self.platforms:
-                platform_rect = pygame.Rect(platform['x'], platform['y'], platform['width'], platform['height'])
-                pygame.draw.rect(self.screen, (128, 128, 128), platform_rect)  # Gray platforms
-                pygame.draw.rect(self.screen, (100, 100, 100), platform_rect, 2)  # Dark border
-
-        # Render multi-level platforms
-        if hasattr(self, 'platforms'):
-            for platform in self.platforms:
-                platform_rect = pygame.Rect(platform['x'], platform['y'], platform['width'], platform['height'])
-                pygame.draw.rect(self.screen, (128, 128, 128), platform_rect)  # Gray platforms
-                pygame.draw.rect(self.screen, (100, 100, 100), platform_rect, 2)  # Dark border
-
         """Render the main game with proper background"""
         # Clear screen first
         self.screen.fill(BLACK)
         
-        # Apply camera offset
-        camera_offset = self.camera.get_offset()
+        # Apply camera offset (interpolated between the last two sim ticks)
+        camera_offset = self.camera.get_offset(self.render_alpha)
         
         # Render background first (this should show the palace)
         self.level_manager.render_background(self.screen, camera_offset)
         
-        # Render level elements (platforms, items, NPCs)
+        # Render level elements (baked platforms and ground, items, NPCs)
         self.level_manager.render(self.screen, camera_offset)
 
-        # Render FIXED ground that stays at bottom of screen
-        self.render_fixed_ground(camera_offset)
-        
-        # Render multi-level platforms
-        self.render_platforms(camera_offset)
+        if not self.level_manager.static_geometry.built:
+            # Render FIXED ground that stays at bottom of screen
+            self.render_fixed_ground(camera_offset)
+            
+            # Render multi-level platforms
+            self.render_platforms(camera_offset)
                 
-        # Render player on top
+        # Render player on top, at its interpolated position
         if self.player:
-            self.player.render(self.screen, camera_offset)
-            
-            # Render staff projectiles
-            if hasattr(self.player, 'render_staff_projectiles'):
-                self.player.render_staff_projectiles(self.screen, camera_offset)
+            shift_x, shift_y = self.player.get_render_shift(self.render_alpha)
+            self.player.render(self.screen, (camera_offset[0] - shift_x, camera_offset[1] - shift_y))
+
         
         # Render UI on top of everything
         
@@ -2073,19 +1253,19 @@ class MosesAdventureGame:
         self.screen.blit(overlay, (0, 0))
         
         # Game Over title
-        title_font = pygame.font.Font(None, 72)
+        title_font = self.font_manager.get_sized_font(72)
         title_text = title_font.render("GAME OVER", True, (255, 0, 0))
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
         self.screen.blit(title_text, title_rect)
         
         # Subtitle
-        subtitle_font = pygame.font.Font(None, 36)
+        subtitle_font = self.font_manager.get_sized_font(36)
         subtitle_text = subtitle_font.render("Moses has fallen in his divine mission", True, (255, 255, 255))
         subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
         self.screen.blit(subtitle_text, subtitle_rect)
         
         # Options
-        option_font = pygame.font.Font(None, 32)
+        option_font = self.font_manager.get_sized_font(32)
         options = [
             "Press R to Restart",
             "Press M for Main Menu", 
@@ -2098,7 +1278,7 @@ class MosesAdventureGame:
             self.screen.blit(option_text, option_rect)
         
         # Health status
-        health_font = pygame.font.Font(None, 28)
+        health_font = self.font_manager.get_sized_font(28)
         health_text = health_font.render(f"Final Health: {self.player.health if self.player else 0}/100", True, (255, 100, 100))
         health_rect = health_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 150))
         self.screen.blit(health_text, health_rect)
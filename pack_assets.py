@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Moses Adventure - Asset Packer
+Decodes every PNG and WAV under assets/ into one memory-mappable assets.pack
+Re-run after changing anything in assets/
+"""
+
+import os
+import sys
+
+import pygame
+
+from asset_pack import PACK_PATH, write_pack
+from surface_cache import hash_file
+
+ASSET_ROOT = "assets"
+MIXER_FORMAT = dict(frequency=44100, size=-16, channels=2)  # Same as SoundManager
+
+
+def collect_files(root, extension):
+    """Get every file under root with an extension, as forward-slash paths like the game uses"""
+    found = []
+    for folder, _, files in os.walk(root):
+        for filename in sorted(files):
+            if filename.lower().endswith(extension):
+                found.append(os.path.join(folder, filename).replace(os.sep, "/"))
+    return sorted(found)
+
+
+def pack_assets(output=PACK_PATH):
+    """Decode all images and sounds and write the pack"""
+    pygame.init()
+    try:
+        pygame.mixer.init(**MIXER_FORMAT)
+    except pygame.error as e:
+        print(f"⚠️  No audio device ({e}); packing images only")
+
+    images = {}
+    for path in collect_files(ASSET_ROOT, ".png"):
+        try:
+            images[path] = pygame.image.load(path)
+        except pygame.error as e:
+            print(f"❌ Skipping {path}: {e}")
+
+    sounds = {}
+    for path in collect_files(ASSET_ROOT, ".wav") if pygame.mixer.get_init() else []:
+        try:
+            sounds[path] = pygame.mixer.Sound(path).get_raw()
+        except pygame.error as e:
+            print(f"❌ Skipping {path}: {e}")
+
+    write_pack(output, images, sounds, pygame.mixer.get_init(), {path: hash_file(path) for path in images})
+    print(f"📦 Packed {len(images)} images and {len(sounds)} sounds into {output} "
+          f"({os.path.getsize(output) / 1024:.0f} KB)")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if pack_assets(*sys.argv[1:2]) else 1)
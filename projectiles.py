@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Projectile Pool for Moses Adventure Game
+Stones and staff bolts stored as NumPy arrays and updated in one vectorized pass
+"""
+
+import numpy as np
+import pygame
+
+SCREEN_WIDTH = 1024
+SCREEN_HEIGHT = 768
+
+# Projectile kinds
+STONE = 0
+STAFF_BOLT = 1
+
+STONE_COLOR = (139, 69, 19)
+STONE_BORDER = (101, 67, 33)
+
+
+class ProjectilePool:
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.allocate(capacity)
+        self.stamps = {}  # (kind, moving_right) -> (surface, blit offset)
+
+    def allocate(self, capacity):
+        """Create (or grow) the backing arrays, keeping live projectiles"""
+        old = getattr(self, 'x', None)
+        fields = {
+            'x': np.float64, 'y': np.float64,
+            'vx': np.float64, 'vy': np.float64,
+            'gravity': np.float64, 'lifetime': np.float64,
+            'damage': np.int32, 'kind': np.int8,
+            'width': np.int16, 'height': np.int16,
+        }
+        for name, dtype in fields.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.fields = list(fields)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Remove every projectile"""
+        self.count = 0
+
+    def spawn(self, kind, x, y, vx, vy, gravity=0.0, lifetime=3.0, damage=0, width=8, height=8):
+        """Add a projectile; the pool doubles in size when full"""
+        if self.count == self.capacity:
+            self.allocate(self.capacity * 2)
+
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.gravity[i] = gravity
+        self.lifetime[i] = lifetime
+        self.damage[i] = damage
+        self.kind[i] = kind
+        self.width[i] = width
+        self.height[i] = height
+        self.count += 1
+
+    def spawn_stone(self, x, y, direction, speed=300, lift=50, gravity=200, damage=15):
+        """Throw a stone in a slight upward arc"""
+        self.spawn(STONE, x, y, direction * speed, -lift, gravity=gravity, damage=damage)
+
+    def spawn_staff_bolt(self, x, y, direction, speed=450, damage=20):
+        """Fire a straight divine bolt from the staff"""
+        self.spawn(STAFF_BOLT, x, y, direction * speed, 0, damage=damage, width=16, height=16)
+
+    def update(self, dt, min_x=-100, max_y=SCREEN_HEIGHT + 50):
+        """Integrate all projectiles and drop expired or out-of-world ones"""
+        n = self.count
+        if n == 0:
+            return
+
+        x, y = self.x[:n], self.y[:n]
+        vy = self.vy[:n]
+        x += self.vx[:n] * dt
+        y += vy * dt
+        vy += self.gravity[:n] * dt
+        self.lifetime[:n] -= dt
+
+        dead = (self.lifetime[:n] <= 0) | (x < min_x) | (y > max_y)
+        if dead.any():
+            self.compact(dead)
+
+    def compact(self, dead):
+        """Remove projectiles flagged in a mask by moving live ones from the tail into the holes"""
+        n = self.count
+        alive_count = n - int(np.count_nonzero(dead))
+        holes = np.flatnonzero(dead[:alive_count])
+        movers = np.flatnonzero(~dead[alive_count:]) + alive_count
+        for name in self.fields:
+            array = getattr(self, name)
+            array[holes] = array[movers]
+        self.count = alive_count
+
+    def remove(self, index):
+        """Swap-remove a single projectile"""
+        last = self.count - 1
+        if index != last:
+            for name in self.fields:
+                array = getattr(self, name)
+                array[index] = array[last]
+        self.count = last
+
+    def boxes(self):
+        """Get an (N, 4) array of left, top, right, bottom for the live projectiles"""
+        n = self.count
+        boxes = np.empty((n, 4), dtype=np.float64)
+        boxes[:, 0] = self.x[:n]
+        boxes[:, 1] = self.y[:n]
+        boxes[:, 2] = self.x[:n] + self.width[:n]
+        boxes[:, 3] = self.y[:n] + self.height[:n]
+        return boxes
+
+    def get_stamp(self, kind, moving_right):
+        """Get the pre-drawn sprite for a projectile kind and direction"""
+        key = (kind, moving_right)
+        if key not in self.stamps:
+            if kind == STAFF_BOLT:
+                self.stamps[key] = self.draw_staff_bolt(moving_right)
+            else:
+                self.stamps[key] = self.draw_stone()
+        return self.stamps[key]
+
+    def draw_stone(self):
+        """Draw a stone as a small brown circle"""
+        surface = pygame.Surface((9, 9), pygame.SRCALPHA)
+        pygame.draw.circle(surface, STONE_COLOR, (4, 4), 4)
+        pygame.draw.circle(surface, STONE_BORDER, (4, 4), 4, 1)
+        return surface, (0, 0)
+
+    def draw_staff_bolt(self, moving_right):
+        """Draw a staff bolt as a bright yellow diamond with glow and a trail behind it"""
+        surface = pygame.Surface((64, 32), pygame.SRCALPHA)
+        cx, cy = 32, 16
+        side = -1 if moving_right else 1  # Trail is drawn behind the bolt
+
+        # Glow
+        surface.fill((255, 255, 0, 80), (cx - 16, cy - 16, 32, 32))
+
+        # Short trail under the diamond
+        if moving_right:
+            pygame.draw.rect(surface, (255, 255, 0), (cx - 16, cy - 2, 12, 4))
+            pygame.draw.rect(surface, (255, 255, 255), (cx - 14, cy - 1, 8, 2))
+        else:
+            pygame.draw.rect(surface, (255, 255, 0), (cx + 4, cy - 2, 16, 4))
+            pygame.draw.rect(surface, (255, 255, 255), (cx + 6, cy - 1, 12, 2))
+
+        # Diamond with white center and gold outline
+        diamond = [(cx, cy - 8), (cx + 8, cy), (cx, cy + 8), (cx - 8, cy)]
+        pygame.draw.polygon(surface, (255, 255, 0), diamond)
+        pygame.draw.polygon(surface, (255, 255, 255), [(cx, cy - 4), (cx + 4, cy), (cx, cy + 4), (cx - 4, cy)])
+        pygame.draw.polygon(surface, (255, 215, 0), diamond, 2)
+
+        # Motion blur trail segments
+        for i in range(3):
+            length = 20 - i * 4
+            near = 12 + i * 6
+            left = cx - near - 8 if moving_right else cx + near - 4
+            pygame.draw.rect(surface, (255, 255, 0), (left, cy - 3, length, 6))
+            pygame.draw.rect(surface, (255, 255, 255), (left + 2, cy - 1, length - 4, 2))
+
+        # Trail particles
+        for i in range(5):
+            pygame.draw.circle(surface, (255, 255, 100), (cx + side * (8 + i * 4), cy), 2)
+
+        # Blit so the 16x16 projectile box sits at the stamp center
+        return surface, (-(cx - 8), -(cy - 8))
+
+    def render(self, screen, camera_offset):
+        """Draw every on-screen projectile with a single batched blit call"""
+        n = self.count
+        if n == 0:
+            return
+
+        screen_x = (self.x[:n] - camera_offset[0]).astype(np.int32)
+        screen_y = (self.y[:n] - camera_offset[1]).astype(np.int32)
+        visible = np.flatnonzero((screen_x > -64) & (screen_x < screen.get_width() + 64) &
+                                 (screen_y > -64) & (screen_y < screen.get_height() + 64))
+        if len(visible) == 0:
+            return
+
+        kinds = self.kind[visible].tolist()
+        moving_right = (self.vx[visible] >= 0).tolist()
+        blits = []
+        for kind, right, sx, sy in zip(kinds, moving_right, screen_x[visible].tolist(), screen_y[visible].tolist()):
+            stamp, (ox, oy) = self.get_stamp(kind, right)
+            blits.append((stamp, (sx + ox, sy + oy)))
+        screen.blits(blits, doreturn=False)
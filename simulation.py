@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+Simulation Core for Moses Adventure Game
+Player, level, enemies, projectiles, inventory and dialogue state stepped from an InputState,
+with no window, mixer or keyboard access - the pygame frontend lives in main.py
+"""
+
+from enum import Enum
+
+import pygame
+
+from game_classes import Player, Camera, LevelManager, Location, SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from game_systems import Inventory, DialogueSystem
+from swept_collision import sweep_landings
+from level_loader import load_world_data
+from level_cache import prepare_all_levels
+from level_prefetch import LevelPrefetcher
+
+SIM_DT = 1.0 / FPS  # Fixed simulation tick length (seconds)
+COLLISION_MARGIN = 16  # Broadphase padding around Moses (pixels)
+
+
+class GameState(Enum):
+    MENU = "menu"
+    PLAYING = "playing"
+    DIALOGUE = "dialogue"
+    INVENTORY = "inventory"
+    PAUSED = "paused"
+    GAME_OVER = "game_over"
+    VICTORY = "victory"
+
+
+class InputState:
+    """The held controls for one simulation tick"""
+
+    def __init__(self, left=False, right=False, jump=False, interact=False):
+        self.left = left
+        self.right = right
+        self.jump = jump
+        self.interact = interact
+
+    @classmethod
+    def from_keys(cls, keys):
+        """Build controls from a pygame.key.get_pressed() snapshot"""
+        return cls(left=keys[pygame.K_LEFT], right=keys[pygame.K_RIGHT],
+                   jump=keys[pygame.K_UP], interact=keys[pygame.K_e])
+
+
+NO_INPUT = InputState()
+
+
+class Simulation:
+    def __init__(self, sprites=None):
+        self.sprites = sprites or {}
+        self.state = GameState.MENU
+        self.player = None
+        self.camera = Camera()
+        self.level_manager = LevelManager()
+        self.inventory = Inventory()
+        self.inventory.game_instance = self  # Replaced by the frontend when there is one
+        self.dialogue_system = DialogueSystem()
+        self.enemies = []  # Game-level enemy objects (level enemies live in the level manager)
+        self.game_platforms = []
+        self.last_interacted_npc = None
+        self.tick = 0
+        self.assets = None  # AssetManager when there is a frontend drawing sprites
+
+        # Destinations behind nearby exits are loaded ahead of time on a worker thread
+        self.prefetcher = LevelPrefetcher(self.load_level_manager)
+
+        # Things the frontend should play or show, drained after every step
+        self.events = []
+
+        # Collision phase handlers, resolved in this order every tick
+        self.collision_handlers = [
+            ('ground', self.handle_ground_contact),
+            ('platform', self.handle_platform_contact),
+            ('enemy', self.handle_enemy_contact),
+            ('item', self.handle_item_contact),
+            ('exit', self.handle_exit_contact),
+        ]
+
+    def emit(self, kind, *args):
+        """Queue an event (sound, message, level change...) for the frontend"""
+        self.events.append((kind,) + args)
+
+    def drain_events(self):
+        """Get and clear the queued events"""
+        events, self.events = self.events, []
+        return events
+
+    def start(self, opening_dialogue=True):
+        """Set up a new game in the palace"""
+        # Ground platform is at y=718, player height is 48, so player should be at y=670
+        ground_y = SCREEN_HEIGHT - 50  # 718
+        player_y = ground_y - 48  # 670 (player height is 48)
+        self.player = Player(150, player_y, self.sprites.get('player', {}))
+
+        # Debug: Show Moses' exact position
+        print(f"🎯 Moses Position: x={self.player.rect.x}, y={self.player.rect.y}, bottom={self.player.rect.bottom}")
+
+        # Staff bolts go into the level's shared projectile pool
+        self.player.projectile_pool = self.level_manager.projectiles
+
+        self.prefetcher.clear()
+        self.level_manager.load_level(Location.PALACE, self.sprites)
+        self.retain_level_assets()
+
+        # Initialize multi-level platform system
+        print("🏗️  Initializing multi-level platform system...")
+        self.initialize_multi_level_world()
+        self.player.game_platforms = self.game_platforms
+        print(f"🏗️  Platform system ready with {len(self.game_platforms)} platforms")
+
+        # Reset camera to show the game world properly
+        self.camera.x = 0
+        self.camera.y = 0
+        self.camera.save_previous()
+
+        self.inventory = Inventory()
+        self.inventory.game_instance = self
+        self.enemies = []
+        self.last_interacted_npc = None
+        self.tick = 0
+
+        if opening_dialogue and self.dialogue_system.start_dialogue("opening"):
+            self.state = GameState.DIALOGUE
+        else:
+            self.state = GameState.PLAYING
+
+    def restart(self):
+        """Put Moses back at the start with full health and an empty inventory"""
+        if self.player:
+            self.player.health = getattr(self.player, 'max_health', 100)
+            self.player.rect.x = 150
+            self.player.rect.y = 670
+            self.player.velocity_x = 0
+            self.player.velocity_y = 0
+            self.player.save_previous()
+            if hasattr(self.player, 'armor_active'):
+                self.player.armor_active = False
+                self.player.armor_timer = 0
+
+        for item in self.inventory.items:
+            self.inventory.items[item] = 0
+        self.inventory.stone_ready = False
+        self.inventory.staff_active = False
+        self.inventory.armor_active = False
+
+        self.state = GameState.PLAYING
+
+    def initialize_multi_level_world(self):
+        """Initialize the multi-level platform world"""
+        print("🏗️  Creating multi-level platform world...")
+
+        # Check every level file up front so bad data fails here, not at a level exit
+        level_count = prepare_all_levels()
+        print(f"📜 Validated {level_count} compiled level files")
+
+        # Four tiers of platforms high above the level geometry, from levels/world.json
+        world = load_world_data()
+        self.game_platforms = [dict(platform) for platform in world['platforms']]
+
+        # Bake the platforms and the fixed ground (extended width) into chunk surfaces
+        self.level_manager.set_game_platforms(self.game_platforms, world.get('ground_width', SCREEN_WIDTH * 6))
+
+        print(f"✅ Created {len(self.game_platforms)} platforms across 4 levels")
+        return True
+
+    def step(self, controls=NO_INPUT, dt=SIM_DT):
+        """Advance the world by one tick"""
+        if self.player:
+            self.player.save_previous()
+        self.camera.save_previous()
+        self.update(dt, controls)
+        self.tick += 1
+
+    def update(self, dt, controls=NO_INPUT):
+        """Run every gameplay system once, in order"""
+        if self.state == GameState.PLAYING and self.player:
+            # Update player input and movement
+            self.player.update(dt, controls)
+
+        # Update simple enemies
+        self.level_manager.update_simple_enemies(dt)
+
+        # Update stones and staff bolts
+        self.level_manager.update_projectiles(dt)
+
+        # Check projectile-enemy collisions (level enemies plus any game-level enemies)
+        hits = self.level_manager.check_projectile_enemy_collisions(self.enemies)
+        if hits > 0:
+            self.enemies = [enemy for enemy in self.enemies if getattr(enemy, 'health', 1) > 0]
+            self.emit('sound', 'enemy_defeat')
+
+        # Integrate player physics
+        self.update_player(dt)
+
+        # Single collision phase AFTER all movement: ground, platforms, enemies, items, exits
+        self.check_collisions()
+
+        # Camera follows the resolved player position once per tick
+        if self.player:
+            self.camera.follow_player(self.player)
+            self.level_manager.stream(self.camera.x)
+            if self.state == GameState.PLAYING:
+                self.prefetcher.update(self.player.rect, self.level_manager.get_exit_zones())
+            self.check_interactions(controls)
+
+        # Check for game over
+        if self.player and self.player.health <= 0:
+            self.state = GameState.GAME_OVER
+
+        # Item bobbing and enemy patrols
+        self.level_manager.update(dt)
+
+        # Timed item effects (armor)
+        self.inventory.update(dt)
+
+        if self.state == GameState.DIALOGUE and self.dialogue_system.active:
+            # Update dialogue system for typing effect
+            self.dialogue_system.update(dt)
+
+    def update_player(self, dt):
+        """Update player position and physics"""
+        if not self.player:
+            return
+
+        # Apply gravity
+        if not self.player.on_ground:
+            self.player.velocity_y += 800 * dt  # Gravity
+            if self.player.velocity_y > 600:  # Terminal velocity
+                self.player.velocity_y = 600
+
+        # Update position based on velocity
+        self.player.rect.x += self.player.velocity_x * dt
+        self.player.rect.y += self.player.velocity_y * dt
+
+        # Keep player on screen
+        if self.player.rect.x < 0:
+            self.player.rect.x = 0
+        elif self.player.rect.x > SCREEN_WIDTH - self.player.rect.width:
+            self.player.rect.x = SCREEN_WIDTH - self.player.rect.width
+
+        # Ground collision fallback
+        if self.player.rect.bottom > 670:
+            self.player.rect.bottom = 670
+            self.player.velocity_y = 0
+            self.player.on_ground = True
+            print(f"🏠 Moses on ground at y={self.player.rect.y}")
+
+    def check_collisions(self):
+        """Single collision phase: one broadphase pass, then typed handlers in fixed order"""
+        if not self.player:
+            return
+
+        candidates = self.gather_collision_candidates()
+
+        for kind, handler in self.collision_handlers:
+            for rect, obj in candidates[kind]:
+                # A handler returns True when nothing else of its kind needs resolving
+                if handler(rect, obj):
+                    break
+
+    def gather_collision_candidates(self):
+        """Broadphase: collect everything near the player once per tick"""
+        ground_level = SCREEN_HEIGHT - 50  # 718
+
+        # Cover the whole path Moses moved along this tick, grown a little so
+        # candidates stay valid after ground/platform snapping
+        start_rect = self.player.get_tick_start_rect()
+        query_rect = start_rect.union(self.player.rect).inflate(COLLISION_MARGIN * 2, COLLISION_MARGIN * 2)
+        candidates = {kind: [] for kind, _ in self.collision_handlers}
+
+        if query_rect.bottom >= ground_level:
+            candidates['ground'].append((pygame.Rect(query_rect.left, ground_level, query_rect.width, 50), None))
+
+        # Platforms crossed on the way down, earliest time of impact first
+        candidates['platform'] = sweep_landings(start_rect, self.player.rect,
+                                                self.level_manager.query_platforms(query_rect))
+
+        for enemy in self.enemies:
+            if hasattr(enemy, 'x') and hasattr(enemy, 'y'):
+                enemy_rect = pygame.Rect(enemy.x, enemy.y, 30, 30)
+                if query_rect.colliderect(enemy_rect):
+                    candidates['enemy'].append((enemy_rect, enemy))
+
+        # Items and exits only report when Moses steps into them
+        for kind, rect, obj in self.level_manager.triggers.update(self.player.rect):
+            candidates[kind].append((rect, obj))
+
+        return candidates
+
+    def handle_ground_contact(self, ground_rect, _):
+        """ALWAYS keep Moses on top of the ground - the most important check"""
+        player_rect = self.player.rect
+        if player_rect.bottom >= ground_rect.top:
+            player_rect.bottom = ground_rect.top
+            self.player.velocity_y = 0
+            self.player.on_ground = True
+            self.player.is_jumping = False
+            # Only print debug message occasionally
+            if not hasattr(self, '_ground_debug_shown'):
+                print(f"🏠 Moses secured on ground: y={self.player.rect.y}, on_ground={self.player.on_ground}")
+                self._ground_debug_shown = True
+        return True
+
+    def handle_platform_contact(self, platform_rect, toi):
+        """Land on the first platform the tick's fall crossed, however far Moses moved"""
+        player_rect = self.player.rect
+        if self.player.velocity_y >= 0:  # Falling or stationary
+            if self.player.velocity_y > 0:
+                print(f"🏗️ Moses landed on platform at y={platform_rect.y}")
+
+            # Land on platform at the time of impact; horizontal motion carries on
+            player_rect.bottom = platform_rect.top
+            self.player.velocity_y = 0
+            self.player.on_ground = True
+            self.player.is_jumping = False
+            return True
+        return False
+
+    def handle_enemy_contact(self, enemy_rect, enemy):
+        """Damage and knock back Moses when touching an enemy"""
+        player_rect = self.player.rect
+        if self.player.health <= 0 or not player_rect.colliderect(enemy_rect):
+            return False
+
+        # Calculate damage
+        damage = 10
+        if getattr(self.player, 'armor_active', False):
+            damage = int(damage * 0.25)
+            print(f"🛡️ Armor reduced damage to {damage}")
+
+        # Apply damage
+        self.player.health -= damage
+        if self.player.health < 0:
+            self.player.health = 0
+
+        print(f"💔 Moses took {damage} damage! Health: {self.player.health}/100")
+        self.emit('message', f"Took {damage} damage!", 2.0)
+
+        # Game over check
+        if self.player.health <= 0:
+            print("💀 GAME OVER!")
+            self.game_over()
+
+        # Knockback
+        knockback = 20
+        if enemy.x < player_rect.x:
+            player_rect.x += knockback
+        else:
+            player_rect.x -= knockback
+        return True
+
+    def handle_item_contact(self, item_rect, item):
+        """Walk over items to collect them"""
+        self.collect_item(item)
+        return False
+
+    def handle_exit_contact(self, exit_rect, exit_zone):
+        """Move to the next level when Moses reaches an exit"""
+        self.transition_to_level(exit_zone.destination)
+        return True
+
+    def collect_item(self, item):
+        """Collect an item and add to inventory"""
+        item_type, item_rect = item.item_type, item.rect
+        self.inventory.add_item(item_type)
+        self.level_manager.remove_item(item)
+        self.emit('sound', 'pickup')
+        self.emit('item_collected', item_type, item_rect)
+        print(f"📦 Collected {item_type}")
+
+    def check_interactions(self, controls):
+        """Show prompts on nearby NPCs and start a dialogue when E is held next to one"""
+        # Only NPCs inside the x window around Moses are examined
+        nearby, newly_nearby = self.level_manager.update_npc_prompts(self.player.rect)
+
+        # Show NPC info in console when Moses first comes into range
+        for npc in newly_nearby:
+            distance = abs(self.player.rect.centerx - npc.rect.centerx)
+            print(f"💬 Press E to talk to {npc.npc_type}")
+            print(f"📏 Distance: {distance} pixels (Moses at x={self.player.rect.x})")
+
+        if not nearby or not controls.interact:
+            return
+
+        for npc in nearby:
+            if npc.is_interacting:
+                continue
+
+            # Store reference to this NPC for removal after dialogue
+            self.last_interacted_npc = npc
+
+            # Start interaction
+            npc.is_interacting = True
+            self.player.start_interaction()
+
+            # Switch to dialogue state
+            self.state = GameState.DIALOGUE
+            if self.dialogue_system.start_dialogue(npc.dialogue_id):
+                print(f"✅ Started dialogue with {npc.npc_type}")
+                self.emit('dialogue_started', npc)
+            else:
+                print(f"❌ Failed to start dialogue with {npc.npc_type}")
+                self.state = GameState.PLAYING  # Return to playing if dialogue fails
+            break
+
+    def remove_interacted_npc(self):
+        """Remove the NPC that was just interacted with"""
+        npc = self.last_interacted_npc
+        if npc and npc.alive:
+            # Mark NPC as completed and remove them from the level
+            npc.completed = True
+            print(f"✅ {npc.npc_type} completed their task and moved away")
+            self.level_manager.remove_npc(npc)
+        self.last_interacted_npc = None
+
+    def load_level_manager(self, destination):
+        """Build a separate level manager with a destination's data loaded (runs on the prefetch thread)
+        
+        Nothing here touches the display: the background is scaled, platforms
+        baked and the level's sprites decoded into plain surfaces, which
+        swap_level_manager and retain_level_assets only convert.
+        """
+        level_manager = LevelManager()
+        level_manager.streaming_mode = self.level_manager.streaming_mode
+        level_manager.game_platforms = self.game_platforms
+        level_manager.fixed_ground_width = self.level_manager.fixed_ground_width
+        level_manager.load_level(destination, self.sprites, finish=False)
+        if self.assets:
+            self.assets.stage(level_manager.asset_keys())
+        return level_manager
+
+    def swap_level_manager(self, level_manager):
+        """Make a prefetched level live, keeping the shared projectile pool"""
+        level_manager.finish_loading()  # Converting needs the main thread
+        level_manager.projectiles = self.level_manager.projectiles
+        level_manager.projectiles.clear()
+        self.level_manager = level_manager
+
+    def retain_level_assets(self):
+        """Hold and preload the current level's sprites; the last level's become evictable"""
+        if self.assets:
+            keys = self.level_manager.asset_keys()
+            self.assets.retain('level', keys)
+            self.assets.preload(keys)
+            self.assets.clear_staged()  # Whatever other prefetches decoded is not needed now
+
+    def transition_to_level(self, destination):
+        """Transition to a new level"""
+        prefetched = self.prefetcher.take(destination)
+        if prefetched is not None:
+            self.swap_level_manager(prefetched)
+        else:
+            self.level_manager.load_level(destination, self.sprites)
+        self.retain_level_assets()
+
+        # Reset player position for new level
+        if self.player:
+            self.player.rect.x = 100
+            self.player.rect.y = SCREEN_HEIGHT - 100  # Position on ground level
+            self.player.velocity_x = 0
+            self.player.velocity_y = 0
+            self.player.on_ground = True  # Make sure player starts on ground
+            self.player.save_previous()  # Teleport, not a move to sweep through
+
+        self.emit('level_entered', destination)
+
+        # Check for victory condition
+        if destination == Location.JERUSALEM:
+            self.state = GameState.VICTORY
+
+    def game_over(self):
+        """Moses has fallen"""
+        self.state = GameState.GAME_OVER
+        self.emit('game_over')
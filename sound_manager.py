@@ -9,6 +9,8 @@ import pygame
 import os
 import math
 
+from asset_pack import open_default_pack
+
 class SoundManager:
     def __init__(self):
         """Initialize the sound manager"""
@@ -49,10 +51,19 @@ class SoundManager:
             'typing': 'assets/audio/sounds/typing.wav'            # NEW: Dialogue typing
         }
         
+        # Sounds in the asset pack come straight from mapped PCM, with no file probing
+        pack = open_default_pack()
+        
         sounds_loaded = 0
         for sound_name, file_path in sound_files.items():
             try:
-                if os.path.exists(file_path):
+                sound = pack.sound(file_path) if pack else None
+                if sound:
+                    self.sounds[sound_name] = sound
+                    self.sounds[sound_name].set_volume(self.sound_volume)
+                    sounds_loaded += 1
+                    print(f"✅ Loaded sound: {sound_name} (packed)")
+                elif os.path.exists(file_path):
                     self.sounds[sound_name] = pygame.mixer.Sound(file_path)
                     self.sounds[sound_name].set_volume(self.sound_volume)
                     sounds_loaded += 1
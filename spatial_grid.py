@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Spatial Hash Grid for Moses Adventure Game
+Uniform grid index so collision checks only look at nearby platforms
+"""
+
+import pygame
+
+
+class SpatialHashGrid:
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = {}    # (cell_x, cell_y) -> list of (rect, obj)
+        self.count = 0
+
+    def clear(self):
+        """Remove everything from the grid"""
+        self.cells.clear()
+        self.count = 0
+
+    def cell_range(self, rect):
+        """Get the inclusive cell index bounds covered by a rect"""
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def insert(self, rect, obj):
+        """Add an object to every cell its rect overlaps"""
+        rect = pygame.Rect(rect)
+        entry = (rect, obj)
+        min_x, min_y, max_x, max_y = self.cell_range(rect)
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                self.cells.setdefault((cell_x, cell_y), []).append(entry)
+        self.count += 1
+
+    def load_cells(self, entries, keys, offsets, indices):
+        """Add entries from prebuilt cell lists instead of inserting them one by one
+
+        entries are (rect, obj) pairs; cell (keys[i]) holds the entries at
+        indices[offsets[i]:offsets[i + 1]], as produced by the level compiler.
+        """
+        cells = self.cells
+        indices = indices.tolist()
+        offsets = offsets.tolist()
+        for i, (cell_x, cell_y) in enumerate(keys.tolist()):
+            cell = cells.setdefault((cell_x, cell_y), [])
+            cell.extend([entries[j] for j in indices[offsets[i]:offsets[i + 1]]])
+        self.count += len(entries)
+
+    def remove(self, rect, obj):
+        """Take an object out of every cell its rect overlaps"""
+        min_x, min_y, max_x, max_y = self.cell_range(pygame.Rect(rect))
+        found = False
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                entries = self.cells.get((cell_x, cell_y))
+                if not entries:
+                    continue
+                kept = [entry for entry in entries if entry[1] is not obj]
+                if len(kept) != len(entries):
+                    found = True
+                    if kept:
+                        self.cells[(cell_x, cell_y)] = kept
+                    else:
+                        del self.cells[(cell_x, cell_y)]
+        if found:
+            self.count -= 1
+        return found
+
+    def query(self, rect):
+        """Get the (rect, obj) entries whose cells overlap the given rect
+
+        Entries are returned once each, in insertion order per cell. Callers
+        still do the exact rect test - this only narrows the candidates.
+        """
+        min_x, min_y, max_x, max_y = self.cell_range(pygame.Rect(rect))
+        cells = self.cells
+        found = []
+        seen = set()
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                for entry in cells.get((cell_x, cell_y), ()):
+                    if id(entry) not in seen:
+                        seen.add(id(entry))
+                        found.append(entry)
+        return found
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Sprite Atlas for Moses Adventure Game
+Looks up where each sprite sits on the sheets built by build_atlas.py
+"""
+
+import json
+import os
+
+from asset_pack import source_stat
+from surface_cache import hash_file
+
+ATLAS_DIR = "assets/atlas"
+ATLAS_META_NAME = "atlas.json"
+ATLAS_VERIFIED_NAME = ".verified.json"  # Local, untracked: sources whose content was checked since a checkout
+
+_default_atlas = None  # Opened once, shared by every sprite lookup
+
+
+class SpriteAtlas:
+    """Sprite locations and animation frame tables from atlas.json
+
+    Sprites are keyed by their original file path (e.g. "assets/items/stone.png"),
+    so callers keep asking for the files they always did. When the atlas
+    opens, each source is stat'd and compared with the size and mtime
+    recorded at build time; only files that differ are hashed against the
+    recorded content hash. Changed sprites are treated as not in the atlas,
+    which sends the loader back to the file until build_atlas.py is re-run.
+    """
+
+    def __init__(self, directory=ATLAS_DIR):
+        with open(os.path.join(directory, ATLAS_META_NAME)) as meta_file:
+            metadata = json.load(meta_file)
+        self.verified_path = os.path.join(directory, ATLAS_VERIFIED_NAME)
+        self.sheets = [f"{directory}/{sheet['file']}" for sheet in metadata['sheets']]
+        self.sheet_hashes = {path: sheet.get('hash') for path, sheet in zip(self.sheets, metadata['sheets'])}
+        self.sprites = metadata['sprites']
+        self.animations = metadata.get('animations', {})
+        self.stale = self.find_stale()
+
+    def find_stale(self):
+        """Get the sprites whose source file no longer matches the hash it was packed with
+
+        Files whose mtime or size moved without their content changing (a
+        fresh checkout, a touch) are hashed once and remembered locally, so
+        later starts only stat them.
+        """
+        verified = self.load_verified()
+        stale = set()
+        newly_verified = False
+        for path, entry in self.sprites.items():
+            stat = source_stat(path)
+            if stat is None or stat == entry.get('source') or verified.get(path) == [*stat, entry.get('hash')]:
+                continue
+            if hash_file(path) == entry.get('hash'):
+                verified[path] = [*stat, entry.get('hash')]
+                newly_verified = True
+            else:
+                stale.add(path)
+        if newly_verified:
+            self.save_verified(verified)
+        if stale:
+            print(f"⚠️  {len(stale)} sprite(s) changed since the atlas was built; loading their files "
+                  f"until build_atlas.py is re-run: {', '.join(sorted(stale))}")
+        return stale
+
+    def load_verified(self):
+        """Get {path: [size, mtime_ns, hash]} of sources already checked on this machine"""
+        try:
+            with open(self.verified_path) as verified_file:
+                return json.load(verified_file)
+        except (OSError, ValueError):
+            return {}
+
+    def save_verified(self, verified):
+        try:
+            with open(self.verified_path, "w") as verified_file:
+                json.dump(verified, verified_file)
+        except OSError:
+            pass  # Only costs the next start the same hashing
+
+    def __contains__(self, path):
+        return self.locate(path) is not None
+
+    def locate(self, path):
+        """Get (sheet path, (x, y, width, height)) for a sprite, or None if it is not packed"""
+        entry = self.sprites.get(path)
+        if entry is None or path in self.stale:
+            return None
+        return self.sheets[entry['sheet']], tuple(entry['rect'])
+
+    def source_hash(self, path):
+        """Get the content hash a sheet was written with, or None if path is not a sheet"""
+        return self.sheet_hashes.get(path)
+
+    def animation(self, name):
+        """Get an animation's frame paths in play order, or None if the atlas has no such table"""
+        table = self.animations.get(name)
+        return list(table['frames']) if table else None
+
+
+def open_default_atlas():
+    """Get the game's sprite atlas, or None if build_atlas.py has not been run"""
+    global _default_atlas
+    if _default_atlas is None:
+        try:
+            _default_atlas = SpriteAtlas()
+            print(f"🗺️ Using sprite atlas {ATLAS_DIR} ({len(_default_atlas.sprites)} sprites, "
+                  f"{len(_default_atlas.sheets)} sheets)")
+        except (OSError, ValueError, KeyError) as e:
+            if not isinstance(e, FileNotFoundError):
+                print(f"⚠️  Ignoring sprite atlas: {e}")
+            _default_atlas = False
+    return _default_atlas or None
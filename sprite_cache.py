@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Sprite Variant Cache for Moses Adventure Game
+Stores mirrored copies of sprites once so entities never flip surfaces per frame
+"""
+
+import pygame
+
+
+class SpriteVariantCache:
+    def __init__(self):
+        # id(source surface) -> (source surface, mirrored surface)
+        self.mirrored = {}
+    
+    def get_mirrored(self, surface):
+        """Get the left-facing (horizontally mirrored) copy of a sprite"""
+        if surface is None:
+            return None
+        
+        entry = self.mirrored.get(id(surface))
+        if entry is None or entry[0] is not surface:
+            entry = (surface, pygame.transform.flip(surface, True, False))
+            self.mirrored[id(surface)] = entry
+        return entry[1]
+    
+    def mirror_group(self, group):
+        """Mirror every sprite in a name -> surface dict"""
+        return {name: self.get_mirrored(sprite) for name, sprite in group.items() if sprite}
+    
+    def add_variants(self, sprites):
+        """Add left-facing variants next to the loaded sprite groups
+        
+        Adds sprites['npcs_left'], sprites['enemies_left'] and the player's
+        'idle_left', 'jump_left' and 'walk_left' frames. Sprites that share a
+        surface (e.g. extended NPC types) share one mirrored copy.
+        """
+        sprites['npcs_left'] = self.mirror_group(sprites.get('npcs', {}))
+        sprites['enemies_left'] = self.mirror_group(sprites.get('enemies', {}))
+        self.add_player_variants(sprites.get('player'))
+        
+        print(f"🪞 Cached {len(self.mirrored)} mirrored sprite variants")
+        return sprites
+    
+    def add_player_variants(self, player):
+        """Add 'idle_left', 'jump_left' and 'walk_left' to the player's sprite dict"""
+        if player:
+            for state in ('idle', 'jump'):
+                if player.get(state):
+                    player[f'{state}_left'] = self.get_mirrored(player[state])
+            player['walk_left'] = [self.get_mirrored(frame) for frame in player.get('walk', [])]
+    
+    @staticmethod
+    def flip(surface):
+        """Make an uncached mirrored copy (for assets whose lifetime is managed elsewhere)"""
+        return pygame.transform.flip(surface, True, False)
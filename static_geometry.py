@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Static Geometry Layer for Moses Adventure Game
+Bakes level platforms and the fixed ground into chunk surfaces once per level
+"""
+
+import pygame
+
+SCREEN_WIDTH = 1024
+SCREEN_HEIGHT = 768
+
+# Platform colors (brown stone)
+STONE_COLOR = (139, 69, 19)
+STONE_BORDER = (101, 67, 33)
+STONE_HIGHLIGHT = (160, 82, 45)
+GROUND_TEXTURE = (120, 60, 15)
+
+# Chunk surfaces are transparent wherever no geometry was drawn
+TRANSPARENT_KEY = (255, 0, 255)
+
+
+class GeometryChunk:
+    def __init__(self, x, y, surface):
+        self.x = x  # World x of the chunk's left edge
+        self.y = y  # World y of the chunk's top edge (screen y for fixed ground)
+        self.surface = surface
+
+
+class StaticGeometryLayer:
+    def __init__(self, chunk_width=SCREEN_WIDTH):
+        self.chunk_width = chunk_width
+        self.world_chunks = {}   # chunk index -> GeometryChunk (scrolls with the camera)
+        self.ground_chunks = {}  # chunk index -> GeometryChunk (fixed to the screen bottom)
+        self.world_shapes = {}   # chunk index -> [(rect, draw)] still to bake or re-bake
+        self.ground_shapes = {}
+        self.ground_y = SCREEN_HEIGHT
+        self.streaming = False   # Bake chunks on first sight instead of all up front
+        self.built = False
+    
+    def clear(self):
+        """Drop all baked chunk surfaces"""
+        self.world_chunks.clear()
+        self.ground_chunks.clear()
+        self.world_shapes = {}
+        self.ground_shapes = {}
+        self.built = False
+    
+    def build(self, level_platforms, game_platforms=(), fixed_ground_width=None, ground_height=50, convert=True):
+        """Bake all platforms (and the fixed ground strip) into chunk surfaces
+        
+        level_platforms are Platform objects (or dicts) drawn in the level style,
+        game_platforms are the multi-level platform dicts drawn in their lighter
+        style on top. The fixed ground stays at the bottom of the screen, so it
+        is baked into its own row of chunks. When streaming, shapes are only
+        bucketed here and each chunk is baked the first time it is visible.
+        convert=False bakes plain surfaces (safe off the main thread); call
+        convert_chunks() on the main thread afterwards.
+        """
+        self.clear()
+        
+        shapes = []
+        for platform in level_platforms:
+            rect = self.platform_rect(platform)
+            if rect:
+                shapes.append((rect, self.draw_level_platform))
+        for platform in game_platforms:
+            rect = self.platform_rect(platform)
+            if rect:
+                shapes.append((rect, self.draw_game_platform))
+        
+        self.world_shapes = self.bucket_shapes(shapes)
+        if fixed_ground_width:
+            ground_rect = pygame.Rect(0, 0, fixed_ground_width, ground_height)
+            self.ground_shapes = self.bucket_shapes([(ground_rect, self.draw_fixed_ground)])
+            self.ground_y = SCREEN_HEIGHT - ground_height
+        
+        if not self.streaming:
+            for index in self.world_shapes:
+                self.get_chunk(self.world_chunks, self.world_shapes, index, convert=convert)
+            for index in self.ground_shapes:
+                self.get_chunk(self.ground_chunks, self.ground_shapes, index, self.ground_y, convert=convert)
+        
+        self.built = True
+        print(f"🧱 Baked static geometry: {len(shapes)} platforms into "
+              f"{len(self.world_shapes)} world + {len(self.ground_shapes)} ground chunks"
+              f"{' (streamed)' if self.streaming else ''}")
+    
+    def convert_chunks(self):
+        """Convert chunks baked with convert=False to the display format (main thread only)"""
+        if pygame.display.get_surface():
+            for chunks in (self.world_chunks, self.ground_chunks):
+                for chunk in chunks.values():
+                    chunk.surface = chunk.surface.convert()
+    
+    def platform_rect(self, platform):
+        """Get the world rect of a platform in either dict or object format"""
+        if isinstance(platform, dict):
+            return pygame.Rect(platform['x'], platform['y'], platform['width'], platform['height'])
+        if hasattr(platform, 'rect'):
+            return pygame.Rect(platform.rect)
+        return None
+    
+    def bucket_shapes(self, shapes):
+        """Group (rect, draw) shapes by every chunk index they overlap"""
+        buckets = {}
+        for rect, draw in shapes:
+            first = rect.left // self.chunk_width
+            last = (rect.right - 1) // self.chunk_width
+            for index in range(first, last + 1):
+                buckets.setdefault(index, []).append((rect, draw))
+        return buckets
+    
+    def bake_chunk(self, index, chunk_shapes, convert=True):
+        """Draw one chunk's shapes into a surface sized to its contents"""
+        chunk_x = index * self.chunk_width
+        top = min(rect.top for rect, _ in chunk_shapes)
+        bottom = max(rect.bottom for rect, _ in chunk_shapes)
+        
+        surface = pygame.Surface((self.chunk_width, bottom - top))
+        surface.fill(TRANSPARENT_KEY)
+        for rect, draw in chunk_shapes:
+            draw(surface, rect.move(-chunk_x, -top))
+        
+        surface.set_colorkey(TRANSPARENT_KEY, pygame.RLEACCEL)
+        if convert and pygame.display.get_surface():
+            surface = surface.convert()
+        return GeometryChunk(chunk_x, top, surface)
+    
+    def get_chunk(self, chunks, shapes, index, fixed_y=None, convert=True):
+        """Get a baked chunk, baking it now if it has shapes but no surface yet"""
+        chunk = chunks.get(index)
+        if chunk is None and index in shapes:
+            chunk = self.bake_chunk(index, shapes[index], convert)
+            if fixed_y is not None:
+                chunk.y = fixed_y
+            chunks[index] = chunk
+        return chunk
+    
+    def evict_chunks(self, first, last):
+        """Drop baked surfaces outside the chunk index range first..last (re-baked on demand)"""
+        for chunks in (self.world_chunks, self.ground_chunks):
+            for index in [index for index in chunks if index < first or index > last]:
+                del chunks[index]
+    
+    def draw_level_platform(self, surface, rect):
+        """Level platform style (LevelManager platforms)"""
+        pygame.draw.rect(surface, STONE_COLOR, rect)
+        pygame.draw.rect(surface, STONE_BORDER, rect, 3)
+        pygame.draw.rect(surface, STONE_HIGHLIGHT, (rect.x + 2, rect.y + 2, rect.width - 4, 4))
+    
+    def draw_game_platform(self, surface, rect):
+        """Multi-level platform style"""
+        pygame.draw.rect(surface, STONE_COLOR, rect)
+        pygame.draw.rect(surface, STONE_BORDER, rect, 2)
+        if rect.width > 60:  # Only add details to larger platforms
+            pygame.draw.rect(surface, STONE_HIGHLIGHT, (rect.x + 2, rect.y + 2, rect.width - 4, 3))
+    
+    def draw_fixed_ground(self, surface, rect):
+        """Fixed ground style with a texture line every 20 pixels"""
+        pygame.draw.rect(surface, STONE_COLOR, rect)
+        pygame.draw.rect(surface, STONE_BORDER, rect, 3)
+        for x in range(rect.x, rect.right, 20):
+            pygame.draw.line(surface, GROUND_TEXTURE, (x, rect.y + 5), (x, rect.bottom - 5))
+    
+    def visible_chunks(self, chunks, shapes, camera_x, screen_width, fixed_y=None):
+        """Yield the chunks that intersect the camera horizontally"""
+        first = camera_x // self.chunk_width
+        last = (camera_x + screen_width - 1) // self.chunk_width
+        for index in range(first, last + 1):
+            chunk = self.get_chunk(chunks, shapes, index, fixed_y)
+            if chunk:
+                yield chunk
+    
+    def render_world(self, screen, camera_offset):
+        """Blit the platform chunks that intersect the camera"""
+        screen_width = screen.get_width()
+        for chunk in self.visible_chunks(self.world_chunks, self.world_shapes, camera_offset[0], screen_width):
+            screen.blit(chunk.surface, (chunk.x - camera_offset[0], chunk.y - camera_offset[1]))
+    
+    def render_ground(self, screen, camera_offset):
+        """Blit the fixed ground chunks (horizontal scrolling only)"""
+        screen_width = screen.get_width()
+        for chunk in self.visible_chunks(self.ground_chunks, self.ground_shapes, camera_offset[0], screen_width,
+                                         self.ground_y):
+            screen.blit(chunk.surface, (chunk.x - camera_offset[0], chunk.y))
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Surface Cache for Moses Adventure Game
+Keeps decoded, display-converted sprites on disk so warm starts skip PNG decoding and fallback drawing
+"""
+
+import hashlib
+import os
+import struct
+
+import pygame
+
+SURFACE_CACHE_DIR = ".surface_cache"
+SURFACE_MAGIC = b"MOSSRF01"
+# magic, width, height, pitch, flags, bitsize, R/G/B/A masks
+SURFACE_HEADER = struct.Struct("<8sIIIIIIIII")
+
+
+def hash_file(path):
+    """Hash a source image's bytes, or None if it cannot be read (done by the pack and atlas builders)"""
+    try:
+        with open(path, "rb") as source:
+            return hashlib.sha256(source.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def stat_file(path):
+    """Fingerprint a loose image by modification time and size without reading it, or None if missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"stat:{path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def hash_callable(function):
+    """Hash what a drawing function does: its bytecode, constants and bound arguments
+
+    Works through functools.partial and bound methods, so editing e.g. the
+    colors in create_npc_fallback gives the cached fallbacks a new key.
+    """
+    digest = hashlib.sha256()
+    while hasattr(function, 'func'):  # functools.partial
+        digest.update(repr((function.args, sorted(function.keywords.items()))).encode("utf-8"))
+        function = function.func
+    function = getattr(function, '__func__', function)  # Bound method
+    code = getattr(function, '__code__', None)
+    if code is None:
+        digest.update(getattr(function, '__qualname__', repr(function)).encode("utf-8"))
+    else:
+        digest.update(code.co_code)
+        digest.update(repr(function.__defaults__).encode("utf-8"))
+        digest.update(repr(code.co_consts).encode("utf-8"))
+        digest.update(repr(code.co_names).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def display_format():
+    """Describe the pixel format converted sprites end up in, for cache keys"""
+    display = pygame.display.get_surface()
+    if display is None:
+        return "unconverted"
+    return f"{display.get_bitsize()}-" + "-".join(f"{mask:x}" for mask in display.get_masks())
+
+
+class SurfaceCache:
+    """Raw pixels of finished surfaces, one file per (source hash, pixel format, scale)
+
+    Surfaces are stored exactly as they sit in memory (pitch, flags and
+    masks included) and rebuilt by copying the bytes back into a surface of
+    the same format, so a hit needs no decoding or conversion. Entries whose
+    source, display format or scale changed simply get a new key; prune()
+    deletes the ones nothing asks for any more.
+    """
+
+    def __init__(self, directory=SURFACE_CACHE_DIR):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, source_hash, scale=1):
+        """Get the cache key for a source hash under the current display format"""
+        return hashlib.sha256(f"{source_hash}|{display_format()}|{scale}".encode("utf-8")).hexdigest()[:32]
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.surf")
+
+    def load(self, key):
+        """Rebuild a cached surface, or None on a miss"""
+        try:
+            with open(self.path(key), "rb") as cache_file:
+                data = cache_file.read()
+        except OSError:
+            self.misses += 1
+            return None
+
+        if len(data) < SURFACE_HEADER.size:
+            self.misses += 1
+            return None
+        magic, width, height, pitch, flags, bitsize, *masks = SURFACE_HEADER.unpack_from(data)
+        pixels = memoryview(data)[SURFACE_HEADER.size:]
+        try:
+            surface = pygame.Surface((width, height), flags, bitsize, masks)
+        except (pygame.error, ValueError):
+            surface = None
+        if (magic != SURFACE_MAGIC or surface is None or surface.get_pitch() != pitch
+                or len(pixels) != pitch * height):
+            self.misses += 1
+            return None
+
+        surface.get_buffer().write(bytes(pixels), 0)
+        self.hits += 1
+        return surface
+
+    def save(self, key, surface):
+        """Write a surface's raw pixels; failures only cost the next start a decode"""
+        if surface is None:
+            return
+        header = SURFACE_HEADER.pack(SURFACE_MAGIC, surface.get_width(), surface.get_height(),
+                                     surface.get_pitch(), surface.get_flags() & pygame.SRCALPHA,
+                                     surface.get_bitsize(), *surface.get_masks())
+        path = self.path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path + ".tmp", "wb") as cache_file:
+                cache_file.write(header)
+                cache_file.write(surface.get_buffer().raw)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            print(f"⚠️  Could not cache surface: {e}")
+
+    def prune(self, keys):
+        """Delete every cached surface whose key is not in keys; return how many went"""
+        keep = {os.path.basename(self.path(key)) for key in keys}
+        try:
+            filenames = os.listdir(self.directory)
+        except OSError:
+            return 0
+        removed = 0
+        for filename in filenames:
+            if filename not in keep:
+                try:
+                    os.remove(os.path.join(self.directory, filename))
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Swept Collision for Moses Adventure Game
+Continuous landing tests so fast falls and long ticks cannot skip through thin platforms
+"""
+
+
+def landing_time(start, end, surface):
+    """Get the time of impact (0..1) of a falling box onto the top of a surface, or None
+
+    start and end are the box rects at the beginning and end of the tick. The
+    box lands when its bottom edge crosses the surface top while the two
+    overlap horizontally at that moment. Platforms are one-way: boxes moving
+    up, or already below the top at the start of the tick, pass through.
+    """
+    top = surface.top
+    dy = end.bottom - start.bottom
+    if dy < 0 or start.bottom > top or end.bottom < top:
+        return None
+
+    toi = (top - start.bottom) / dy if dy else 0.0
+
+    # Horizontal position of the box at the moment of impact
+    left = start.left + (end.left - start.left) * toi
+    if left < surface.right and left + start.width > surface.left:
+        return toi
+    return None
+
+
+def sweep_landings(start, end, candidates):
+    """Get (rect, toi) for every candidate surface the box lands on, earliest first"""
+    hits = []
+    for rect, _ in candidates:
+        toi = landing_time(start, end, rect)
+        if toi is not None:
+            hits.append((rect, toi))
+    hits.sort(key=lambda hit: hit[1])
+    return hits
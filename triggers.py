@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Trigger Volumes for Moses Adventure Game
+Item pickups and exit zones indexed once per level, reporting when the player enters one
+"""
+
+from spatial_grid import SpatialHashGrid
+
+
+class TriggerIndex:
+    def __init__(self, cell_size=128):
+        self.grid = SpatialHashGrid(cell_size)
+        self.player_cells = None  # Cell bounds the nearby list was built for
+        self.nearby = []          # (rect, (kind, obj)) entries in the player's cells
+        self.inside = set()       # Trigger objects the player overlapped last update
+        self.entries = {}         # obj -> (rect, payload) for unregistering
+
+    def clear(self):
+        """Remove every trigger"""
+        self.grid.clear()
+        self.entries.clear()
+        self.player_cells = None
+        self.nearby = []
+        self.inside = set()
+
+    def register(self, kind, rect, obj):
+        """Add a trigger volume of a kind ('item' or 'exit')"""
+        payload = (kind, obj)
+        self.grid.insert(rect, payload)
+        self.entries[obj] = (rect, payload)
+        self.player_cells = None
+
+    def unregister(self, obj):
+        """Remove a trigger volume (e.g. a collected item)"""
+        entry = self.entries.pop(obj, None)
+        if entry:
+            self.grid.remove(*entry)
+            self.player_cells = None
+            self.inside.discard(obj)
+
+    def update(self, player_rect):
+        """Get (kind, rect, obj) for every trigger the player entered since the last update
+
+        The nearby list is only rebuilt from the grid when the player moves into
+        different cells; otherwise this is an overlap test against the few
+        triggers already around the player, usually none.
+        """
+        cells = self.grid.cell_range(player_rect)
+        if cells != self.player_cells:
+            self.player_cells = cells
+            self.nearby = self.grid.query(player_rect)
+
+        entered = []
+        inside = set()
+        for rect, (kind, obj) in self.nearby:
+            if player_rect.colliderect(rect):
+                inside.add(obj)
+                if obj not in self.inside:
+                    entered.append((kind, rect, obj))
+        self.inside = inside
+        return entered